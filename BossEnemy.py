@@ -7,62 +7,98 @@ import pygame
 import math
 import random
 import os
+import re
+import asset_loader
+import frame_cache
+import fonts
+import object_pool
+import perf_counters
+import texture_atlas
 from Level2Enemies import Level2Enemy, BoneParticle, build_state_animations_from_manifest
 
 
+# Animation folders and their expected naming patterns
+# Map game states to folder names and file prefixes
+BOSS_ANIMATION_FOLDERS = {
+    "idle": ("Idle", "Bringer-of-Death_Idle_"),
+    "run": ("Walk", "Bringer-of-Death_Walk_"),  
+    "attack": ("Attack", "Bringer-of-Death_Attack_"),
+    "cast": ("Cast", "Bringer-of-Death_Cast_"),
+    "spell": ("Spell", "Bringer-of-Death_Spell_"),
+    "hurt": ("Hurt", "Bringer-of-Death_Hurt_"),
+    "death": ("Death", "Bringer-of-Death_Death_")
+}
+
+_boss_anims = {}  # (base_path, scale_to) -> loaded animations, shared by every boss built
+
+
+def _indexed_frames(folder_path, file_prefix):
+    """Frame files `<prefix><n>.png` in folder_path, listed once and in natural (numeric) order."""
+    pattern = re.compile(re.escape(file_prefix) + r"(\d+)\.png$")
+    numbered = []
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            match = pattern.match(entry.name)
+            if match and entry.is_file():
+                numbered.append((int(match.group(1)), entry.path))
+    numbered.sort()
+    return [path for _, path in numbered]
+
+
 def build_boss_animations_from_individual_files(base_path: str, scale_to: tuple = (128, 128)) -> dict[str, list[pygame.Surface]]:
-    """Load boss animations from individual PNG files instead of sprite sheets"""
-    anims = {}
-    
-    # Animation folders and their expected naming patterns
-    # Map folder names to game states and file prefixes
-    animation_folders = {
-        "idle": ("Idle", "Bringer-of-Death_Idle_"),
-        "run": ("Walk", "Bringer-of-Death_Walk_"),  
-        "attack": ("Attack", "Bringer-of-Death_Attack_"),
-        "cast": ("Cast", "Bringer-of-Death_Cast_"),
-        "spell": ("Spell", "Bringer-of-Death_Spell_"),
-        "hurt": ("Hurt", "Bringer-of-Death_Hurt_"),
-        "death": ("Death", "Bringer-of-Death_Death_")
-    }
-    
-    for anim_state, (folder_name, file_prefix) in animation_folders.items():
-        folder_path = os.path.join(base_path, folder_name)
-        if not os.path.exists(folder_path):
-            anims[anim_state] = []
-            continue
-            
-        frames = []
-        frame_num = 1
-        
-        # Load frames until we can't find any more
-        while True:
-            file_path = os.path.join(folder_path, f"{file_prefix}{frame_num}.png")
-            if not os.path.exists(file_path):
-                break
-                
-            try:
-                frame = pygame.image.load(file_path).convert_alpha()
-                # Scale the frame if needed
-                if scale_to:
-                    frame = pygame.transform.scale(frame, scale_to)
-                frames.append(frame)
-                frame_num += 1
-            except pygame.error as e:
-                print(f"Error loading {file_path}: {e}")
-                break
-        
-        anims[anim_state] = frames
-        if frames:
-            print(f"Loaded {len(frames)} frames for {anim_state}")
-    
-    return anims
+    """Load boss animations from individual PNG files instead of sprite sheets.
+
+    Memoized per (base_path, scale_to), so rebuilding the boss (retrying the
+    fight, switching difficulty) doesn't touch the disk again.
+    """
+    key = (base_path, tuple(scale_to) if scale_to else None)
+    anims = _boss_anims.get(key)
+    if anims is None:
+        anims = {}
+        for anim_state, (folder_name, file_prefix) in BOSS_ANIMATION_FOLDERS.items():
+            folder_path = os.path.join(base_path, folder_name)
+            if not os.path.isdir(folder_path):
+                anims[anim_state] = []
+                continue
+
+            frame_files = _indexed_frames(folder_path, file_prefix)
+
+            def build():
+                frames = []
+                # Queue the whole folder on the decode pool, then convert in order
+                for file_path, decoded in zip(frame_files, asset_loader.load_async(frame_files)):
+                    try:
+                        frame = decoded.result().convert_alpha()
+                        # Scale the frame if needed
+                        if scale_to:
+                            frame = pygame.transform.scale(frame, scale_to)
+                        frames.append(frame)
+                    except pygame.error as e:
+                        print(f"Error loading {file_path}: {e}")
+                        break
+                return frames
+
+            frames = frame_cache.load_frames(frame_files, ("boss_frames", scale_to), build,
+                                             atlas=texture_atlas.SPRITES)
+            anims[anim_state] = frames
+            if frames:
+                print(f"Loaded {len(frames)} frames for {anim_state}")
+        _boss_anims[key] = anims
+
+    # Each boss gets its own dict and lists; the frames themselves are shared
+    return {state: list(frames) for state, frames in anims.items()}
 
 
 class BossProjectile:
     """Boss projectile for ranged attacks"""
     
-    def __init__(self, x, y, target_x, target_y, speed=4, damage=1, projectile_type="shadow_bolt", can_split=False, parent_projectiles_list=None):
+    def __init__(self, *args, **kwargs):
+        self.rect = pygame.Rect(0, 0, 16, 16)
+        self.trail_particles = []
+        self.reset(*args, **kwargs)
+
+    def reset(self, x, y, target_x, target_y, speed=4, damage=1, projectile_type="shadow_bolt", can_split=False, parent_projectiles_list=None):
+        """Aim a new bolt; spent ones are recycled through object_pool, keeping their rect and trail list"""
         self.x = x
         self.y = y
         self.start_x = x
@@ -89,10 +125,10 @@ class BossProjectile:
             self.vel_y = 0
         
         # Create collision rect
-        self.rect = pygame.Rect(x - 8, y - 8, 16, 16)
+        self.rect.update(x - 8, y - 8, 16, 16)
         
         # Visual effects
-        self.trail_particles = []
+        self.trail_particles.clear()
         self.life_timer = 0
         
         # Projectile appearance based on type
@@ -136,8 +172,12 @@ class BossProjectile:
         
         # Check collision with obstacles
         if obstacles:
+            if perf_counters.enabled:
+                perf_counters.add("rect_tests", len(obstacles))
             for obstacle in obstacles:
                 if self.rect.colliderect(obstacle.rect):
+                    if perf_counters.enabled:
+                        perf_counters.add("rect_hits")
                     self.alive = False
                     self.create_impact_particles()
                     return
@@ -192,7 +232,8 @@ class BossProjectile:
             target_y = self.y + math.sin(final_rad) * distance
             
             # Create child projectile (cannot split again)
-            child = BossProjectile(
+            child = object_pool.acquire(
+                BossProjectile,
                 self.x, self.y,
                 target_x, target_y,
                 speed=self.speed * 0.8,  # Slightly slower
@@ -429,6 +470,7 @@ class DungeonBoss(Level2Enemy):
                 print(f"Boss projectile hit player!")
             if not projectile.alive:
                 self.projectiles.remove(projectile)
+                object_pool.release(projectile)
         
         # Update pattern timer
         self.pattern_timer += dt
@@ -1020,7 +1062,8 @@ class DungeonBoss(Level2Enemy):
             # Slight vertical offset for multiple projectiles
             y_offset = (i - 0.5) * 40 if num_projectiles > 1 else 0
             
-            projectile = BossProjectile(
+            projectile = object_pool.acquire(
+                BossProjectile,
                 self.rect.centerx,
                 self.rect.centery - 20 + y_offset,
                 player.rect.centerx,
@@ -1046,7 +1089,8 @@ class DungeonBoss(Level2Enemy):
         self.cast_timer = 30  # ~0.5 seconds at 60 FPS
         
         # Aim at player's center
-        projectile = BossProjectile(
+        projectile = object_pool.acquire(
+            BossProjectile,
             self.rect.centerx, 
             self.rect.centery - 20,  # Shoot from boss center
             player.rect.centerx,
@@ -1078,7 +1122,8 @@ class DungeonBoss(Level2Enemy):
         target_x = self.rect.centerx + math.cos(final_rad) * distance
         target_y = self.rect.centery + math.sin(final_rad) * distance
         
-        projectile = BossProjectile(
+        projectile = object_pool.acquire(
+            BossProjectile,
             self.rect.centerx,
             self.rect.centery - 20,
             target_x,
@@ -1090,7 +1135,8 @@ class DungeonBoss(Level2Enemy):
             parent_projectiles_list=None
         )
         self.projectiles.append(projectile)
-        projectile = BossProjectile(
+        projectile = object_pool.acquire(
+            BossProjectile,
             self.rect.centerx,
             self.rect.centery - 20,
             target_x,
@@ -1293,16 +1339,16 @@ class DungeonBoss(Level2Enemy):
                         (bar_x - 2, bar_y - 2, bar_width + 4, bar_height + 4), 2)
             
             # HP text
-            font = pygame.font.Font(None, 20)
+            font = fonts.get(None, 20)
             hp_text = f"{self.current_hp}/{self.max_hp}"
-            text_surf = font.render(hp_text, True, (255, 255, 255))
+            text_surf = fonts.render(font, hp_text, (255, 255, 255))
             text_rect = text_surf.get_rect(center=(screen_x, bar_y - 15))
             surface.blit(text_surf, text_rect)
             
             # Phase indicator
             if self.phase == 2:
-                phase_font = pygame.font.Font(None, 24)
-                phase_text = phase_font.render("PHASE 2", True, (255, 100, 100))
+                phase_font = fonts.get(None, 24)
+                phase_text = fonts.render(phase_font, "PHASE 2", (255, 100, 100))
                 phase_rect = phase_text.get_rect(center=(screen_x, bar_y + bar_height + 15))
                 surface.blit(phase_text, phase_rect)
     
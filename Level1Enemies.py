@@ -1,6 +1,11 @@
 import pygame
 import math
 from entities import build_state_animations_from_manifest
+import frame_cache
+import object_pool
+import perf_counters
+import texture_atlas
+import sfx
 import time
 
 WARRIOR_ANIM = {
@@ -61,8 +66,7 @@ class Level1Enemy:
         self.attack_flash_time = 1500
         self.attack_flash_until = 0
         
-        self.exclamation_img = pygame.image.load("assets/exclamation.png").convert_alpha()
-        self.exclamation_img = pygame.transform.scale(self.exclamation_img, (16, 24))
+        self.exclamation_img = frame_cache.load_image("assets/exclamation.png", size=(16, 24), atlas=texture_atlas.SPRITES)
         self.anims = build_state_animations_from_manifest(anim_manifest or {})
         self.anim_tick = 0
         self.anim_speed = 10
@@ -177,6 +181,31 @@ class Level1Enemy:
             self.direction *= -1
             self.facing_right = (self.direction > 0)
             self.ai_timer = 0
+
+    def patrol_step(self, dt):
+        """Cheap far-away patrol used by the AI scheduler; returns the dx to walk.
+
+        Mirrors the patrol branch of update_ai without sight checks or obstacle
+        scans - the scheduler clamps the move to a precomputed ground lane.
+        """
+        self.update_timers(dt)
+        if self.isIdle or not self.on_ground:
+            return 0
+
+        if hasattr(self, 'patrol_left_bound'):
+            if self.direction > 0 and self.rect.x >= self.patrol_right_bound:
+                self.direction *= -1
+                self.facing_right = (self.direction > 0)
+            elif self.direction < 0 and self.rect.x <= self.patrol_left_bound:
+                self.direction *= -1
+                self.facing_right = (self.direction > 0)
+            return self.direction * self.speed * dt
+
+        if self.ai_timer > 120:
+            self.direction *= -1
+            self.facing_right = (self.direction > 0)
+            self.ai_timer = 0
+        return 0
             
     def apply_physics(self, obstacles):
         if not self.on_ground:
@@ -206,10 +235,12 @@ class Level1Enemy:
             
     def check_ground_ahead(self, dx, obstacles):
 
+        # Look ahead at least the full step so larger (accumulated dt) moves can't skip an edge
+        look_ahead = max(5, abs(dx))
         if dx > 0:
-            check_x = self.rect.right + 5  # Look ahead a bit more
+            check_x = self.rect.right + look_ahead
         else:  # Moving left
-            check_x = self.rect.left - 5   # Look ahead a bit more
+            check_x = self.rect.left - look_ahead
             
         # Create ground check rectangle below the projected position
         ground_check = pygame.Rect(check_x - 5, self.rect.bottom, 32, 20)
@@ -217,6 +248,8 @@ class Level1Enemy:
         self.debug_ground_check = ground_check
         
         ground_found = False
+        if perf_counters.enabled:
+            perf_counters.add("rect_tests", len(obstacles))
         for obstacle in obstacles:
             # Convert obstacle rect back to world space for collision testing
             world_obstacle_rect = obstacle.get_rect().copy()
@@ -247,6 +280,8 @@ class Level1Enemy:
         self.facing_right = (self.direction > 0)
         
     def check_horizontal_collision(self, obstacles):
+        if perf_counters.enabled:
+            perf_counters.add("rect_tests", len(obstacles))
         for obstacle in obstacles:
             # Convert obstacle rect back to world space for collision testing
             world_obstacle_rect = obstacle.get_rect().copy()
@@ -258,6 +293,8 @@ class Level1Enemy:
         return False
         
     def check_vertical_collision(self, obstacles):
+        if perf_counters.enabled:
+            perf_counters.add("rect_tests", len(obstacles) * (2 if self.on_ground else 1))
         for obstacle in obstacles:
             # Convert obstacle rect back to world space for collision testing
             world_obstacle_rect = obstacle.get_rect().copy()
@@ -265,6 +302,8 @@ class Level1Enemy:
             world_obstacle_rect.y = obstacle.original_y
             
             if self.rect.colliderect(world_obstacle_rect):
+                if perf_counters.enabled:
+                    perf_counters.add("rect_hits")
                 if self.y_velocity > 0:
                     self.rect.bottom = world_obstacle_rect.top
                     self.y_velocity = 0
@@ -399,6 +438,7 @@ class Archer(Level1Enemy):
     
     def __init__(self, x, y, width=64, height=64):
         super().__init__(x, y, width, height, anim_manifest=ARCHER_ANIM)
+        sfx.preload("archer_shoot")
 
         self.sight_range = 250
         self.sight_width = 60
@@ -428,8 +468,7 @@ class Archer(Level1Enemy):
         self.detection_timer = 0.0
         self.detection_duration = 60  # Frames to show exclamation
         try:
-            self.exclamation_img = pygame.image.load("assets/exclamation.png").convert_alpha()
-            self.exclamation_img = pygame.transform.scale(self.exclamation_img, (24, 24))
+            self.exclamation_img = frame_cache.load_image("assets/exclamation.png", size=(24, 24), atlas=texture_atlas.SPRITES)
         except:
             self.exclamation_img = None
         
@@ -447,7 +486,8 @@ class Archer(Level1Enemy):
         spawn_y = self.rect.centery - 4
         
         self.start_attack_anim(200)
-        arrow = Arrow(spawn_x, spawn_y, dir_right=self.facing_right, speed=self.arrow_speed)
+        sfx.play("archer_shoot")
+        arrow = object_pool.acquire(Arrow, spawn_x, spawn_y, dir_right=self.facing_right, speed=self.arrow_speed)
 
         if hasattr(self, "level") and hasattr(self.level, "arrows"):
             self.level.arrows.append(arrow)
@@ -498,7 +538,7 @@ class Archer(Level1Enemy):
 
         # normal patrol
         if self.on_ground:
-            movement = self.direction * self.speed
+            movement = self.direction * self.speed * dt
             if self.direction > 0 and self.rect.x >= self.patrol_right_bound:
                 self.direction *= -1
                 self.facing_right = (self.direction > 0)
@@ -532,8 +572,7 @@ class Warrior(Level1Enemy):
         self.detection_timer = 0.0
         self.detection_duration = 60  # Frames to show exclamation
         try:
-            self.exclamation_img = pygame.image.load("assets/exclamation.png").convert_alpha()
-            self.exclamation_img = pygame.transform.scale(self.exclamation_img, (24, 24))
+            self.exclamation_img = frame_cache.load_image("assets/exclamation.png", size=(24, 24), atlas=texture_atlas.SPRITES)
         except:
             self.exclamation_img = None
         
@@ -562,11 +601,11 @@ class Warrior(Level1Enemy):
                 if player.rect.centerx + self.scroll_offset > self.rect.centerx:
                     self.facing_right = True
                     self.direction = 1
-                    movement = self.chase_speed
+                    movement = self.chase_speed * dt
                 else:
                     self.facing_right = False
                     self.direction = -1
-                    movement = -self.chase_speed
+                    movement = -self.chase_speed * dt
                 
                 self.move_horizontal(movement, obstacles)
             else:
@@ -577,7 +616,7 @@ class Warrior(Level1Enemy):
             self.player_detected = False
             
         if self.on_ground:
-            movement = self.direction * self.speed
+            movement = self.direction * self.speed * dt
             
             if self.direction > 0 and self.rect.x >= self.patrol_right_bound:
                 self.direction *= -1
@@ -622,18 +661,27 @@ class Warrior(Level1Enemy):
             print("Warrior missed!")
 
 class Arrow:
+    _images = {}  # dir_right -> arrow image facing that way, shared by every arrow
+
     def __init__(self, x, y, dir_right: bool, speed=8, gravity=0.0, ttl_ms=4000, size=(18, 4)):
+        self.rect = pygame.Rect(0, 0, 0, 0)  # world space
+        self.reset(x, y, dir_right, speed, gravity, ttl_ms, size)
+
+    def reset(self, x, y, dir_right: bool, speed=8, gravity=0.0, ttl_ms=4000, size=(18, 4)):
+        """Set up a new flight; arrows are recycled through object_pool"""
         w, h = size
-        self.rect = pygame.Rect(int(x), int(y), w, h)  # world space
+        self.rect.update(int(x), int(y), w, h)
         self.vx = speed if dir_right else -speed
         self.vy = 0.0
         self.alive = True
         self.spawn_ms = pygame.time.get_ticks()
         self.ttl_ms = ttl_ms
-        self.image = pygame.image.load("assets/arrow.png").convert_alpha()
-        
-        if not dir_right:
-            self.image = pygame.transform.flip(self.image, True,False)
+        self.image = self._images.get(dir_right)
+        if self.image is None:
+            self.image = frame_cache.load_image("assets/arrow.png", atlas=texture_atlas.SPRITES)
+            if not dir_right:
+                self.image = pygame.transform.flip(self.image, True,False)
+            Arrow._images[dir_right] = self.image
 
     def update(self, obstacles):
         if not self.alive:
@@ -647,6 +695,8 @@ class Arrow:
         self.rect.x += int(self.vx)
         self.rect.y += int(self.vy)
 
+        if perf_counters.enabled:
+            perf_counters.add("rect_tests", len(obstacles))
         for o in obstacles:
             r = o.get_rect().copy()
             r.x = o.original_x
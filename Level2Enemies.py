@@ -35,6 +35,9 @@ import pygame
 import math
 import random
 from entities import build_state_animations_from_manifest
+import frame_cache
+import object_pool
+import texture_atlas
 import time
 
 # ============ ANIMATION MANIFESTS ============
@@ -130,8 +133,7 @@ class Level2Enemy:
         self.attack_flash_time = 1000
         self.attack_flash_until = 0
         
-        self.exclamation_img = pygame.image.load("assets/exclamation.png").convert_alpha()
-        self.exclamation_img = pygame.transform.scale(self.exclamation_img, (16, 24))
+        self.exclamation_img = frame_cache.load_image("assets/exclamation.png", size=(16, 24), atlas=texture_atlas.SPRITES)
         self.anims = build_state_animations_from_manifest(anim_manifest or {})
         self.anim_tick = 0
         self.anim_speed = 10
@@ -484,6 +486,10 @@ class Level2Enemy:
 class BoneParticle:
     """Bone projectile particle for Skeleton attacks"""
     def __init__(self, x, y, target_x, target_y):
+        self.reset(x, y, target_x, target_y)
+
+    def reset(self, x, y, target_x, target_y):
+        """Shared by __init__ and object_pool, which recycles dead particles through it"""
         self.x = x
         self.y = y
         # Calculate direction
@@ -526,6 +532,9 @@ class BoneParticle:
 class PoisonCloudParticle:
     """Poison cloud effect for Mushroom attacks"""
     def __init__(self, x, y):
+        self.reset(x, y)
+
+    def reset(self, x, y):
         self.x = x
         self.y = y
         self.radius = 5
@@ -562,6 +571,9 @@ class PoisonCloudParticle:
 class TeleportParticle:
     """Swirling particle effect for Flying Eye teleport"""
     def __init__(self, x, y):
+        self.reset(x, y)
+
+    def reset(self, x, y):
         self.x = x
         self.y = y
         self.offset_x = random.uniform(-20, 20)
@@ -637,7 +649,7 @@ class MutatedMushroom(Level2Enemy):
         
         # Create poison cloud on attack
         if self.poison_cooldown <= 0:
-            particle = PoisonCloudParticle(self.rect.centerx, self.rect.centery)
+            particle = object_pool.acquire(PoisonCloudParticle, self.rect.centerx, self.rect.centery)
             self.poison_particles.append(particle)
             self.poison_cooldown = 120  # Cooldown frames
     
@@ -653,6 +665,7 @@ class MutatedMushroom(Level2Enemy):
             particle.update()
             if particle.is_dead():
                 self.poison_particles.remove(particle)
+                object_pool.release(particle)
     
     def draw(self, surface):
         super().draw(surface)
@@ -696,7 +709,8 @@ class Skeleton(Level2Enemy):
         
         # Create slash effect particles
         for i in range(5):
-            particle = BoneParticle(
+            particle = object_pool.acquire(
+                BoneParticle,
                 self.rect.centerx + (20 if self.facing_right else -20),
                 self.rect.centery + random.randint(-10, 10),
                 player.rect.centerx,
@@ -712,6 +726,7 @@ class Skeleton(Level2Enemy):
             particle.update()
             if particle.is_dead():
                 self.slash_particles.remove(particle)
+                object_pool.release(particle)
     
     def draw(self, surface):
         super().draw(surface)
@@ -770,7 +785,8 @@ class FlyingEye(Level2Enemy):
             player.take_damage(self.attack_damage)
         
         # Create energy beam particle
-        beam = BoneParticle(
+        beam = object_pool.acquire(
+            BoneParticle,
             self.rect.centerx,
             self.rect.centery,
             player.rect.centerx + self.scroll_offset,
@@ -789,7 +805,7 @@ class FlyingEye(Level2Enemy):
         
         # Create teleport particles
         for i in range(12):
-            particle = TeleportParticle(self.rect.centerx, self.rect.centery)
+            particle = object_pool.acquire(TeleportParticle, self.rect.centerx, self.rect.centery)
             self.teleport_particles.append(particle)
         
         # Teleport to random nearby position
@@ -812,12 +828,14 @@ class FlyingEye(Level2Enemy):
             beam.update()
             if beam.is_dead():
                 self.energy_beams.remove(beam)
+                object_pool.release(beam)
         
         # Update teleport particles
         for particle in self.teleport_particles[:]:
             particle.update()
             if particle.is_dead():
                 self.teleport_particles.remove(particle)
+                object_pool.release(particle)
     
     def draw(self, surface):
         # Draw teleport particles first (behind enemy)
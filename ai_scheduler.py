@@ -0,0 +1,152 @@
+"""
+Level-of-detail AI scheduling for enemies.
+
+Every enemy inside the activation window used to run its full AI each frame.
+AIScheduler puts each one in a tick tier by how far it is outside the view
+(ground_scroll .. ground_scroll + view width):
+
+  NEAR - full update every frame: on screen or within `near_margin` of it
+  MID  - decisions (sight, patrol, movement, attacks) every `mid_interval`
+         frames with the accumulated dt; gravity and the animation clock
+         still step every frame, since neither scales by dt
+  FAR  - cheap patrol only: walk along a precomputed lane, no obstacle scans
+
+Bosses, spotted/airborne enemies and anything without a patrol_step() never
+drop to FAR. The lane turns an enemy round at ledges, so patrol_step() is
+only for enemies whose full update() does too (Level 1's edge detection);
+Level 2 enemies walk off ledges and stay at MID. Pending dt is carried
+across tier changes so no time is lost.
+"""
+
+NEAR, MID, FAR = 0, 1, 2
+
+GROUND_GAP = 16     # Blocks are 16px wide on a 32px grid; gaps this small still count as ground
+
+
+class AIScheduler:
+    """Assigns enemies an AI tick tier by distance from the view and runs them accordingly."""
+
+    def __init__(self, view_width=960, near_margin=200, far_margin=500, mid_interval=4):
+        self.view_width = view_width
+        self.near_margin = near_margin  # Off-screen distance an enemy can walk into view from between MID ticks
+        self.far_margin = far_margin
+        self.mid_interval = mid_interval
+        self.frame = 0
+        self._next_phase = 0
+
+    def begin_frame(self):
+        self.frame += 1
+
+    def tier_for(self, enemy, view_left, view_right):
+        """Pick the tick tier for an enemy this frame; the view is in world x."""
+        # Bosses run their pattern logic every frame regardless of distance
+        if hasattr(enemy, 'difficulty') and hasattr(enemy, 'projectiles'):
+            return NEAR
+
+        distance = max(view_left - enemy.rect.right, enemy.rect.left - view_right, 0)
+        if distance < self.near_margin or getattr(enemy, 'player_spotted', False):
+            return NEAR
+        if distance < self.far_margin:
+            return MID
+        if (hasattr(enemy, 'patrol_step') and getattr(enemy, 'on_ground', False)
+                and not enemy.should_ignore_edges()):
+            return FAR
+        return MID
+
+    def update(self, enemy, player, dt, obstacles, scroll_offset):
+        """Tick one enemy according to its tier. Returns the tier used."""
+        if not hasattr(enemy, 'lod_dt'):
+            enemy.lod_dt = 0.0
+            enemy.lod_lane = None
+            enemy.lod_phase = self._next_phase
+            self._next_phase = (self._next_phase + 1) % self.mid_interval
+
+        # Drawing uses scroll_offset even on frames the AI is skipped
+        enemy.scroll_offset = scroll_offset
+        enemy.lod_dt += dt
+
+        tier = self.tier_for(enemy, scroll_offset, scroll_offset + self.view_width)
+
+        if tier == FAR:
+            if enemy.lod_lane is None:
+                enemy.lod_lane = self.patrol_lane(enemy, obstacles)
+            step_dt, enemy.lod_dt = enemy.lod_dt, 0.0
+            self.patrol(enemy, step_dt)
+            return tier
+
+        # Leaving FAR: the lane may be stale once full physics runs again
+        enemy.lod_lane = None
+
+        if tier == MID and (self.frame + enemy.lod_phase) % self.mid_interval:
+            self.coast(enemy, obstacles)
+            return tier
+
+        step_dt, enemy.lod_dt = enemy.lod_dt, 0.0
+        enemy.update(player, dt=step_dt, obstacles=obstacles, scroll_offset=scroll_offset)
+        return tier
+
+    def coast(self, enemy, obstacles):
+        """A MID frame without a decision: the per-frame parts of update() still run."""
+        enemy.apply_physics(obstacles)
+        enemy.update_animation()
+
+    def patrol(self, enemy, dt):
+        """Cheap FAR-tier movement: the enemy picks dx, the lane stands in for edge/wall checks."""
+        dx = enemy.patrol_step(dt)
+        if not dx:
+            return
+
+        lane = enemy.lod_lane
+        if lane is None:
+            return
+
+        # Only the leading edge is tested so an enemy straddling the lane end can still walk back
+        new_left = enemy.rect.x + dx
+        if (dx < 0 and new_left < lane[0]) or (dx > 0 and new_left + enemy.rect.width > lane[1]):
+            enemy.handle_wall_collision()
+        else:
+            enemy.rect.x += dx
+
+    def patrol_lane(self, enemy, obstacles):
+        """Return the (left, right) world x span the enemy can walk without leaving its ground.
+
+        Computed once when an enemy drops to FAR: the run of ground under its
+        feet, cut short by any wall at body height.
+        """
+        rect = enemy.rect
+        ground = []
+        walls = []
+        for obstacle in obstacles:
+            if not getattr(obstacle, 'solid', True):
+                continue
+            obstacle_rect = obstacle.get_rect()
+            ox = getattr(obstacle, 'original_x', obstacle_rect.x)
+            oy = getattr(obstacle, 'original_y', obstacle_rect.y)
+            if oy == rect.bottom:
+                ground.append((ox, ox + obstacle_rect.width))
+            elif oy < rect.bottom and oy + obstacle_rect.height > rect.top:
+                walls.append((ox, ox + obstacle_rect.width))
+
+        if not ground:
+            return None
+
+        # Merge the ground under the enemy into one contiguous run
+        ground.sort()
+        left = right = None
+        for start, stop in ground:
+            if right is not None and start - right <= GROUND_GAP:
+                right = max(right, stop)
+                continue
+            if right is not None and left <= rect.centerx <= right:
+                break
+            left, right = start, stop
+        if not (left <= rect.centerx <= right):
+            return None
+
+        for start, stop in walls:
+            if stop <= rect.left:
+                left = max(left, stop)
+            elif start >= rect.right:
+                right = min(right, start)
+
+        return (left, right)
@@ -0,0 +1,136 @@
+"""
+Parallel image decoding for level loads.
+
+Levels used to decode background layers, tilesets and sprite sheets one
+file at a time on the main thread. A level now lists every image it will
+need up front (prefetch()), they are decoded concurrently on a small thread
+pool - pygame.image.load releases the GIL while reading and decoding - and
+the loaders pick the results up through load(). Converting to the display
+format (convert/convert_alpha) still happens on the main thread.
+
+Files whose frames are already in the on-disk frame cache are skipped, so a
+warm start doesn't decode anything it won't use. Prefetches for enemies that
+spawn later stay pending until their first spawn asks for them.
+"""
+
+import glob
+import os
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+from pytmx.util_pygame import handle_transformation, smart_convert
+
+import frame_cache
+
+MAX_WORKERS = 8
+
+_executor = None
+_pending = {}   # normalized path -> Future resolving to an unconverted Surface
+
+
+def _key(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _pool():
+    global _executor
+    if _executor is None:
+        workers = max(2, min(MAX_WORKERS, os.cpu_count() or 1))
+        _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset-decode")
+    return _executor
+
+
+def prefetch(paths):
+    """Start decoding `paths` in the background, replacing whatever the previous level left unused."""
+    discard()
+    for path in paths:
+        key = _key(path)
+        if key in _pending or not os.path.exists(path) or not frame_cache.needs_decode(path):
+            continue
+        _pending[key] = _pool().submit(pygame.image.load, path)
+
+
+def load(path):
+    """Decoded (not yet converted) image for path, from its prefetch if there is one."""
+    future = _pending.pop(_key(path), None)
+    if future is not None:
+        return future.result()
+    return pygame.image.load(path)
+
+
+def load_async(paths):
+    """Futures decoding each of paths (prefetched ones are reused), in order, for bulk loads."""
+    futures = []
+    for path in paths:
+        future = _pending.pop(_key(path), None)
+        if future is None:
+            future = _pool().submit(pygame.image.load, path)
+        futures.append(future)
+    return futures
+
+
+def discard():
+    """Drop prefetches nobody asked for."""
+    for future in _pending.values():
+        future.cancel()
+    _pending.clear()
+
+
+# ===== Collecting a level's files =====
+
+def manifest_files(manifest):
+    """Sprite sheets named by an animation manifest (see entities.ANIM_MANIFEST)."""
+    return [spec["file"] for spec in manifest.values() if "file" in spec]
+
+
+def folder_images(folder):
+    return sorted(glob.glob(os.path.join(folder, "**", "*.png"), recursive=True))
+
+
+def tilemap_images(tmx_file):
+    """Image files a TMX map's tilesets (inline or external .tsx) and image layers reference."""
+    images = []
+
+    def collect(element, base_dir):
+        for image in element.iter("image"):
+            source = image.get("source")
+            if source:
+                images.append(os.path.join(base_dir, source))
+
+    try:
+        root = ET.parse(tmx_file).getroot()
+    except (OSError, ET.ParseError) as e:
+        print(f"⚠️ Could not scan {tmx_file} for images: {e}")
+        return images
+
+    map_dir = os.path.dirname(tmx_file)
+    for tileset in root.findall("tileset"):
+        source = tileset.get("source")
+        if source:
+            tsx_file = os.path.join(map_dir, source)
+            try:
+                collect(ET.parse(tsx_file).getroot(), os.path.dirname(tsx_file))
+            except (OSError, ET.ParseError):
+                continue
+        else:
+            collect(tileset, map_dir)
+    for layer in root.iter("imagelayer"):
+        collect(layer, map_dir)
+    return images
+
+
+def tmx_image_loader(filename, colorkey, **kwargs):
+    """pytmx image loader (same behaviour as pytmx.util_pygame's) that reads prefetched images."""
+    if colorkey:
+        colorkey = pygame.Color("#{0}".format(colorkey))
+    pixelalpha = kwargs.get("pixelalpha", True)
+    image = load(filename)
+
+    def load_tile(rect=None, flags=None):
+        tile = image.subsurface(rect) if rect else image.copy()
+        if flags:
+            tile = handle_transformation(tile, flags)
+        return smart_convert(tile, colorkey, pixelalpha)
+
+    return load_tile
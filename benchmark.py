@@ -0,0 +1,509 @@
+"""
+Scenario benchmarks for the shipped levels.
+
+Runs Level1, Level2 and FinalBossLevel through their real run() loops under
+the SDL dummy drivers, with scripted key input instead of a player, and
+reports frame-time percentiles, the update/render split, the surface memory
+the level holds, allocations per frame and the level's load breakdown
+(load_profile.py) as JSON, so numbers can be compared from build to build
+(perf_gate.py does that against a baseline).
+
+    python benchmark.py                          # every scenario, JSON on stdout
+    python benchmark.py level1_run_right --frames 600 --json out.json
+    python benchmark.py --sweep --json sweep.json   # stress maps, see below
+
+How a frame is measured:
+- The level's Clock is swapped for BenchClock, whose tick() marks the frame
+  boundary, doesn't sleep, and ends the scenario after the requested frames.
+- The level draws into a TimedSurface; its blits and fills, pygame.draw and
+  display.flip count as render time, everything else in the frame as update.
+  The game interleaves the two (enemies draw themselves inside
+  update_enemies), so this is a split by call, not by phase.
+- CPython has no cheap allocation counter, so allocations come from a second
+  pass of the same scenario under tracemalloc (which slows it down too much
+  to time): bytes allocated at the frame's peak and net memory blocks.
+
+The player's lives are topped up every frame so a scenario always runs its
+full length; game chatter on stdout is discarded unless --verbose.
+
+--sweep runs Level2 on maps from stress_map.py instead: first growing map
+width with a fixed entity count, then a growing entity count on a fixed
+width. Each point reports the same percentiles, and the two curves are
+drawn (with pygame, to keep the tool dependency-free) to .cache/stress/sweep.png.
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import contextlib
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import pygame
+
+WIDTH, HEIGHT = 960, 640
+FPS = 60
+REPORT_VERSION = 1
+
+
+# ===== Scripted input =====
+
+class ScriptedKeys:
+    """Stand-in for pygame.key.get_pressed(): the keys the script holds this frame."""
+
+    def __init__(self):
+        self.held = frozenset()
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+def run_right(frame):
+    """Hold right, hop over obstacles, swing now and then and dash every 1.5 s."""
+    held = {pygame.K_RIGHT}
+    if frame % 40 < 8:
+        held.add(pygame.K_UP)
+    if frame % 25 == 0:
+        held.add(pygame.K_a)
+    if frame % 90 == 5:
+        held.add(pygame.K_LSHIFT)
+    return held
+
+
+def stand_still(frame):
+    return ()
+
+
+def level1(width=WIDTH, height=HEIGHT):
+    from game import Level1
+    return Level1(width, height)
+
+
+def level2(width=WIDTH, height=HEIGHT):
+    from game import Level2
+    return Level2(width, height)
+
+
+def boss(difficulty):
+    def build(width=WIDTH, height=HEIGHT):
+        from game import FinalBossLevel
+        return FinalBossLevel(width, height, difficulty)
+    return build
+
+
+def stress_level(path):
+    """Level2 on a generated map (see stress_map.py)."""
+    def build(width=WIDTH, height=HEIGHT):
+        from game import Level2
+        return Level2(width, height, tilemap_file=path)
+    return build
+
+
+# name -> (level factory, input script, frames)
+SCENARIOS = {
+    "level1_run_right": (level1, run_right, 60 * FPS),
+    "level2_run_right": (level2, run_right, 60 * FPS),
+    "boss_easy_arena": (boss("easy"), stand_still, 60 * FPS),
+    "boss_hard_arena": (boss("hard"), stand_still, 60 * FPS),
+}
+
+
+# ===== Frame instrumentation =====
+
+class _ScenarioDone(Exception):
+    pass
+
+
+class TimedSurface(pygame.Surface):
+    """Frame target that adds the time spent blitting and filling to `render_s`."""
+
+    render_s = 0.0
+
+    def blit(self, *args, **kwargs):
+        t = time.perf_counter()
+        try:
+            return super().blit(*args, **kwargs)
+        finally:
+            TimedSurface.render_s += time.perf_counter() - t
+
+    def blits(self, *args, **kwargs):
+        t = time.perf_counter()
+        try:
+            return super().blits(*args, **kwargs)
+        finally:
+            TimedSurface.render_s += time.perf_counter() - t
+
+    def fill(self, *args, **kwargs):
+        t = time.perf_counter()
+        try:
+            return super().fill(*args, **kwargs)
+        finally:
+            TimedSurface.render_s += time.perf_counter() - t
+
+
+def _timed(func):
+    def wrapper(*args, **kwargs):
+        t = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            TimedSurface.render_s += time.perf_counter() - t
+    return wrapper
+
+
+@contextlib.contextmanager
+def render_timing():
+    """Count pygame.draw.* and display.flip/update as render time while active."""
+    patched = [(pygame.display, "flip"), (pygame.display, "update")]
+    patched += [(pygame.draw, name) for name in ("rect", "circle", "ellipse", "line", "lines",
+                                                  "aaline", "aalines", "polygon", "arc")]
+    originals = [(module, name, getattr(module, name)) for module, name in patched]
+    for module, name, func in originals:
+        setattr(module, name, _timed(func))
+    try:
+        yield
+    finally:
+        for module, name, func in originals:
+            setattr(module, name, func)
+
+
+class BenchClock:
+    """Replaces a level's pygame Clock: records each frame and drives the input script."""
+
+    def __init__(self, level, script, keys, frames, warmup, alloc):
+        self.level = level
+        self.script = script
+        self.keys = keys
+        self.frames = frames
+        self.warmup = warmup
+        self.alloc = alloc
+        self.frame = 0
+        self.lives = None
+        self.samples = []   # (frame ms, render ms) or (peak bytes, net blocks) per measured frame
+        self._start = None
+        self._blocks = None
+
+    def _begin_frame(self):
+        self.keys.held = frozenset(self.script(self.frame))
+        TimedSurface.render_s = 0.0
+        if self.alloc:
+            tracemalloc.reset_peak()
+            self._base = tracemalloc.get_traced_memory()[0]
+            self._blocks = sys.getallocatedblocks()
+        self._start = time.perf_counter()
+
+    def tick(self, framerate=0):
+        if self._start is None:
+            # End of run()'s first frame, which includes reset_game() and the GC freeze: not measured
+            self._begin_frame()
+            return 0
+
+        elapsed = time.perf_counter() - self._start
+        player = getattr(self.level, "player", None)
+        if player is not None:
+            if self.lives is None:
+                self.lives = player.lives
+            player.lives = max(player.lives, self.lives)
+
+        if self.frame >= self.warmup:
+            if self.alloc:
+                peak = tracemalloc.get_traced_memory()[1] - self._base
+                self.samples.append((peak, sys.getallocatedblocks() - self._blocks))
+            else:
+                self.samples.append((elapsed * 1000, TimedSurface.render_s * 1000))
+
+        self.frame += 1
+        if self.frame >= self.frames + self.warmup:
+            raise _ScenarioDone()
+        self._begin_frame()
+        return elapsed * 1000
+
+    def get_fps(self):
+        return 0.0
+
+
+# ===== Running =====
+
+def percentiles(values):
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0, "mean": 0.0}
+    ordered = sorted(values)
+
+    def rank(p):
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+    return {
+        "p50": round(rank(50), 3),
+        "p95": round(rank(95), 3),
+        "p99": round(rank(99), 3),
+        "max": round(ordered[-1], 3),
+        "mean": round(sum(ordered) / len(ordered), 3),
+    }
+
+
+def play(scenario, frames=None, warmup=30, alloc=False, verbose=False):
+    """Build the scenario's level, run it for `frames` measured frames; returns (level, clock, result, load seconds).
+
+    scenario is a (level factory, input script, frames) tuple as in SCENARIOS.
+    """
+    import gc_policy
+    import hitch_watch
+    import load_profile
+
+    load_profile.enable(print_report=verbose)
+    # Frames here are measured, not played: keep them out of the hitch log and off its bookkeeping
+    budget_ms = hitch_watch.BUDGET_MS
+    hitch_watch.configure(budget_ms=0)
+    factory, script, default_frames = scenario
+    frames = frames or default_frames
+    keys = ScriptedKeys()
+
+    with open(os.devnull, "w") as devnull, \
+            (contextlib.nullcontext() if verbose else contextlib.redirect_stdout(devnull)):
+        gc_policy.transition()
+        t = time.perf_counter()
+        level = factory()
+        load_s = time.perf_counter() - t
+
+        screen = pygame.display.get_surface()
+        target = TimedSurface(screen.get_size(), 0, screen)
+        clock = BenchClock(level, script, keys, frames, warmup, alloc)
+        level.clock = clock
+
+        get_pressed = pygame.key.get_pressed
+        pygame.key.get_pressed = lambda: keys
+        if alloc:
+            tracemalloc.start()
+        try:
+            with render_timing():
+                result = level.run(target)
+        except _ScenarioDone:
+            result = "frames"
+        finally:
+            pygame.key.get_pressed = get_pressed
+            if alloc:
+                tracemalloc.stop()
+            hitch_watch.configure(budget_ms=budget_ms)
+            gc_policy.transition()
+    return level, clock, result, load_s
+
+
+def measure(scenario, frames=None, warmup=30, alloc=True, verbose=False):
+    """Time the scenario, then (if alloc) replay it under tracemalloc; returns its report dict."""
+    import load_profile
+    import memory_report
+
+    level, clock, result, load_s = play(scenario, frames, warmup, verbose=verbose)
+    frame_ms = [total for total, _ in clock.samples]
+    render_ms = [render for _, render in clock.samples]
+    # Surfaces the level holds itself; shared caches depend on what ran earlier in the process
+    surfaces, _ = memory_report.surface_bytes(level)
+    report = {
+        "frames": len(clock.samples),
+        "load_s": round(load_s, 3),
+        "ended": result,
+        "scroll": level.ground_scroll,
+        "frame_ms": percentiles(frame_ms),
+        "update_ms": percentiles([total - render for total, render in clock.samples]),
+        "render_ms": percentiles(render_ms),
+        "surface_bytes": sum(size for owner, size in surfaces.items() if not owner.startswith("shared:")),
+        "load": load_profile.snapshot(),
+    }
+    del level
+
+    if alloc:
+        _, clock, _, _ = play(scenario, frames, warmup, alloc=True, verbose=verbose)
+        report["alloc"] = {
+            "peak_bytes_per_frame": percentiles([peak for peak, _ in clock.samples]),
+            "net_blocks_per_frame": percentiles([blocks for _, blocks in clock.samples]),
+        }
+    return report
+
+
+def run_scenario(name, frames=None, warmup=30, alloc=True, verbose=False):
+    return measure(SCENARIOS[name], frames, warmup, alloc, verbose)
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+    }
+
+
+def run_all(names, frames=None, warmup=30, alloc=True, verbose=False):
+    report = {"version": REPORT_VERSION, "environment": environment(), "scenarios": {}}
+    for name in names:
+        print(f"⏱️ {name}...", file=sys.stderr)
+        result = run_scenario(name, frames, warmup, alloc, verbose)
+        frame = result["frame_ms"]
+        print(f"   p50 {frame['p50']:.2f} ms  p95 {frame['p95']:.2f} ms  p99 {frame['p99']:.2f} ms"
+              f"  (update {result['update_ms']['p50']:.2f} / render {result['render_ms']['p50']:.2f})",
+              file=sys.stderr)
+        if result["load"]:
+            stage, slowest = max(result["load"]["steps"].items(), key=lambda item: item[1]["ms"])
+            print(f"   load {result['load_s'] * 1000:.0f} ms (slowest stage: {stage} {slowest['ms']:.1f} ms)",
+                  file=sys.stderr)
+        report["scenarios"][name] = result
+    return report
+
+
+# ===== Stress sweep =====
+
+SWEEP_WIDTHS = (160, 320, 640, 1280, 2560)    # Map widths in tiles, with SWEEP_BASE_ENTITIES
+SWEEP_ENTITIES = (0, 50, 100, 200, 400, 800)   # Entity counts, on a SWEEP_BASE_WIDTH map
+SWEEP_BASE_WIDTH = 320
+SWEEP_BASE_ENTITIES = 40
+SWEEP_FRAMES = 300
+SWEEP_DIR = os.path.join(".cache", "stress")
+
+
+def stress_counts(total):
+    """Split `total` entities like the dungeon does: 60% enemies, 25% traps, 15% powerups."""
+    import stress_map
+
+    def spread(types, n):
+        return {typ: n // len(types) + (i < n % len(types)) for i, typ in enumerate(types)}
+
+    enemies = int(total * 0.6)
+    traps = int(total * 0.25)
+    return {
+        "enemies": spread(stress_map.ENEMY_TYPES, enemies),
+        "traps": spread(tuple(stress_map.TRAP_TYPES), traps),
+        "powerups": spread(stress_map.POWERUP_TYPES, total - enemies - traps),
+    }
+
+
+def sweep_point(out_dir, width, entities, frames, warmup, verbose):
+    import stress_map
+
+    path = os.path.join(out_dir, f"stress_w{width}_e{entities}.tmx")
+    summary = stress_map.generate(path, width, **stress_counts(entities))
+    result = measure((stress_level(path), run_right, frames), None, warmup, alloc=False, verbose=verbose)
+    point = {"width": width, "entities": entities, "solid_tiles": summary["solid_tiles"], **result}
+    print(f"   {width:5d} tiles  {entities:4d} entities  p50 {result['frame_ms']['p50']:.2f} ms"
+          f"  p95 {result['frame_ms']['p95']:.2f} ms  (update {result['update_ms']['p50']:.2f}"
+          f" / render {result['render_ms']['p50']:.2f})", file=sys.stderr)
+    return point
+
+
+def sweep(out_dir=SWEEP_DIR, frames=SWEEP_FRAMES, warmup=30, verbose=False):
+    """Run Level2 on generated maps of growing width, then growing entity count."""
+    print("⏱️ Sweeping map width...", file=sys.stderr)
+    by_width = [sweep_point(out_dir, width, SWEEP_BASE_ENTITIES, frames, warmup, verbose)
+                for width in SWEEP_WIDTHS]
+    print("⏱️ Sweeping entity count...", file=sys.stderr)
+    by_entities = [sweep_point(out_dir, SWEEP_BASE_WIDTH, entities, frames, warmup, verbose)
+                   for entities in SWEEP_ENTITIES]
+    return {"map_width": by_width, "entities": by_entities}
+
+
+PLOT_SERIES = (("frame_ms", "p95", (220, 60, 60)),
+               ("frame_ms", "p50", (40, 90, 200)),
+               ("update_ms", "p50", (60, 160, 80)),
+               ("render_ms", "p50", (150, 150, 150)))
+
+
+def _plot_panel(surface, area, font, points, axis, label):
+    plot = area.inflate(-90, -80).move(20, 0)
+    xs = [point[axis] for point in points]
+    top = max(point[metric][stat] for point in points for metric, stat, _ in PLOT_SERIES) * 1.1 or 1.0
+    x_lo, x_hi = min(xs), max(xs)
+
+    def to_screen(x, y):
+        fx = (x - x_lo) / (x_hi - x_lo) if x_hi > x_lo else 0.5
+        return plot.left + fx * plot.width, plot.bottom - y / top * plot.height
+
+    pygame.draw.rect(surface, (0, 0, 0), plot, 1)
+    for i in range(5):
+        y = top * i / 4
+        sy = to_screen(x_lo, y)[1]
+        pygame.draw.line(surface, (225, 225, 225), (plot.left + 1, sy), (plot.right - 2, sy))
+        text = font.render(f"{y:.1f}", True, (0, 0, 0))
+        surface.blit(text, text.get_rect(midright=(plot.left - 4, sy)))
+    for x in xs:
+        sx = to_screen(x, 0)[0]
+        text = font.render(str(x), True, (0, 0, 0))
+        surface.blit(text, text.get_rect(midtop=(sx, plot.bottom + 4)))
+
+    for metric, stat, color in PLOT_SERIES:
+        line = [to_screen(point[axis], point[metric][stat]) for point in points]
+        if len(line) > 1:
+            pygame.draw.lines(surface, color, False, line, 2)
+        for pos in line:
+            pygame.draw.circle(surface, color, pos, 3)
+
+    text = font.render(label, True, (0, 0, 0))
+    surface.blit(text, text.get_rect(midtop=(plot.centerx, plot.bottom + 22)))
+    text = font.render("ms", True, (0, 0, 0))
+    surface.blit(text, text.get_rect(bottomright=(plot.left - 4, plot.top - 4)))
+
+
+def plot_sweep(results, path):
+    """Frame time against map width and against entity count, side by side, saved as an image."""
+    panel_w, panel_h = 520, 360
+    surface = pygame.Surface((panel_w * 2, panel_h + 30))
+    surface.fill((255, 255, 255))
+    font = pygame.font.Font(None, 20)
+
+    x = 10
+    for metric, stat, color in PLOT_SERIES:
+        text = font.render(f"{metric[:-3]} {stat}", True, color)
+        surface.blit(text, (x, 8))
+        x += text.get_width() + 20
+
+    panels = (("map_width", "width", f"map width (tiles), {SWEEP_BASE_ENTITIES} entities"),
+              ("entities", "entities", f"entities, {SWEEP_BASE_WIDTH}-tile map"))
+    for i, (series, axis, label) in enumerate(panels):
+        area = pygame.Rect(i * panel_w, 30, panel_w, panel_h)
+        _plot_panel(surface, area, font, results[series], axis, label)
+    pygame.image.save(surface, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Shroomlight scenario benchmarks")
+    parser.add_argument("scenarios", nargs="*", help=f"scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--frames", type=int, help="measured frames per scenario (default: each scenario's own)")
+    parser.add_argument("--warmup", type=int, default=30, help="frames run before measuring")
+    parser.add_argument("--no-alloc", action="store_true", help="skip the tracemalloc allocation pass")
+    parser.add_argument("--json", metavar="PATH", help="write the report here instead of stdout")
+    parser.add_argument("--verbose", action="store_true", help="keep the game's own console output")
+    parser.add_argument("--sweep", action="store_true",
+                        help=f"run the stress-map sweep instead of the scenarios (maps and plot go to {SWEEP_DIR})")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    if args.sweep:
+        report = {"version": REPORT_VERSION, "environment": environment(),
+                  "sweep": sweep(SWEEP_DIR, args.frames or SWEEP_FRAMES, args.warmup, args.verbose)}
+        plot_path = os.path.join(SWEEP_DIR, "sweep.png")
+        plot_sweep(report["sweep"], plot_path)
+        print(f"📈 Plot written to {plot_path}", file=sys.stderr)
+    else:
+        report = run_all(args.scenarios or list(SCENARIOS), args.frames, args.warmup,
+                         not args.no_alloc, args.verbose)
+    pygame.quit()
+
+    text = json.dumps(report, indent=2)
+    if args.json:
+        with open(args.json, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,7 @@
 import pygame
+import asset_loader
+import frame_cache
+import texture_atlas
 
 def rescaleObject(object, scale_factor):
     scaledObject = pygame.transform.scale_by(object, scale_factor)
@@ -36,11 +39,16 @@ class AnimatedTrap(block):
     def __init__(self, x, y, spritesheet_path, frame_width, frame_height, damage=1, cooldown=1000):
 
         super().__init__(x, y)
-        spritesheet = pygame.image.load(spritesheet_path).convert_alpha()
-        self.frames = []
-        for i in range(spritesheet.get_width() // frame_width):
-            frame = spritesheet.subsurface(pygame.Rect(i * frame_width, 0, frame_width, frame_height))
-            self.frames.append(frame)
+        def build():
+            spritesheet = asset_loader.load(spritesheet_path).convert_alpha()
+            frames = []
+            for i in range(spritesheet.get_width() // frame_width):
+                frames.append(spritesheet.subsurface(pygame.Rect(i * frame_width, 0, frame_width, frame_height)))
+            return frames
+
+        # Shared views into the sprite atlas; the list itself is per trap
+        self.frames = list(frame_cache.load_frames(
+            [spritesheet_path], ("trap", frame_width, frame_height), build, atlas=texture_atlas.SPRITES))
 
         self.current_frame = 0
         self.image = self.frames[self.current_frame]
@@ -122,12 +130,14 @@ class FrameBasedTrap(AnimatedTrap):
 
 class LightningTrap(FrameBasedTrap):
     """Lightning trap that only damages on the strike frame"""
+    SPRITESHEET = 'assets/Level2/Traps/LightningTrap.png'
+
     def __init__(self, x, y, damage=1, cooldown=2000):
         # Lightning sprite: 960x96 = 10 frames at 96x96 each
         # The actual lightning strike happens in the middle frames
         super().__init__(
             x, y, 
-            'assets/Level2/Traps/LightningTrap.png',
+            self.SPRITESHEET,
             frame_width=96,
             frame_height=96,
             damage=damage,
@@ -138,12 +148,14 @@ class LightningTrap(FrameBasedTrap):
 
 class FireTrap(FrameBasedTrap):
     """Fire trap that damages during the flame burst frames"""
+    SPRITESHEET = 'assets/Level2/Traps/FireTrap.png'
+
     def __init__(self, x, y, damage=1, cooldown=1500):
         # Fire sprite: 384x64 = 6 frames at 64x64 each
         # Fire builds up then bursts
         super().__init__(
             x, y,
-            'assets/Level2/Traps/FireTrap.png',
+            self.SPRITESHEET,
             frame_width=64,
             frame_height=64,
             damage=damage,
@@ -5,6 +5,13 @@ from blocks import Ice, Spikes, block, end, EndWithDifficulty
 from weapons.weapons import WeaponSystem, handle_projectile_collisions
 from weapons.projectiles import ProjectileManager, ChargedProjectile
 from particles import ScreenDropletParticle, DashTrailParticle, DoubleJumpParticle
+import sfx
+import asset_loader
+import frame_cache
+import fonts
+import object_pool
+import perf_counters
+import texture_atlas
 
 
 # ===== Sprite Animation System (one-row spritesheets) =====
@@ -76,13 +83,16 @@ def build_state_animations_from_manifest(manifest: dict[str, dict]) -> dict[str,
         frame_count = spec.get("frame_count")
         scale_to = spec.get("scale_to", FRAME_TARGET_SIZE)  # Allow custom scale_to from manifest
         if file not in cache:
-            try:
-                sheet = pygame.image.load(file).convert_alpha()
-            except FileNotFoundError as exc:
-                raise FileNotFoundError(f"Sprite sheet not found: {file}") from exc
-            except pygame.error as exc:
-                raise RuntimeError(f"Failed to load sprite sheet '{file}': {exc}") from exc
-            cache[file] = _slice_one_row(sheet, frame_width=frame_width, frame_count=frame_count, scale_to=scale_to)
+            def build():
+                try:
+                    sheet = asset_loader.load(file).convert_alpha()
+                except FileNotFoundError as exc:
+                    raise FileNotFoundError(f"Sprite sheet not found: {file}") from exc
+                except pygame.error as exc:
+                    raise RuntimeError(f"Failed to load sprite sheet '{file}': {exc}") from exc
+                return _slice_one_row(sheet, frame_width=frame_width, frame_count=frame_count, scale_to=scale_to)
+            cache[file] = frame_cache.load_frames(
+                [file], ("one_row", frame_width, frame_count, scale_to), build, atlas=texture_atlas.SPRITES)
         anims[state] = cache[file]
         return anims[state]
 
@@ -90,20 +100,6 @@ def build_state_animations_from_manifest(manifest: dict[str, dict]) -> dict[str,
         resolve(key)
     return anims
 
-# ===== SFX =====
-pygame.mixer.init()
-
-# ===== Load global sounds =====
-# ==== Attack Sounds ====
-FISH_THROW_SOUND = pygame.mixer.Sound("assets/SFX/FishThrow.mp3")
-FISH_THROW_SOUND.set_volume(0.3)
-SCRATCH_SOUND = pygame.mixer.Sound("assets/SFX/ScratchAttack.mp3")
-SCRATCH_SOUND.set_volume(0.3)
-
-#==== Hurt Sounds ====
-PLAYER_HURT_SOUND = pygame.mixer.Sound("assets/SFX/playerhurt.mp3")
-PLAYER_HURT_SOUND.set_volume(1.0)
-
 class mainCharacter(WeaponSystem):
 
     MAX_SLOWDOWN_PARTICLES = 40
@@ -121,10 +117,18 @@ class mainCharacter(WeaponSystem):
         
         # Load sprite animations
         self.anims = build_state_animations_from_manifest(ANIM_MANIFEST)
+        # Mirrored copies built once so facing left doesn't flip a frame every tick
+        self.anims_flipped = {
+            state: [pygame.transform.flip(frame, True, False) for frame in frames]
+            for state, frames in self.anims.items()
+        }
         self.image = self._get_initial_image()
 
         self.rect = self.image.get_rect()
         self.rect.topleft = (x, y)
+
+        # Decode attack/hurt sounds with the level instead of on the first hit
+        sfx.preload("fish_throw", "scratch", "player_hurt")
         
         # Animation variables
         self.anim_tick = 0
@@ -194,6 +198,10 @@ class mainCharacter(WeaponSystem):
         self.dash_particles = []
         self.double_jump_particles = []
 
+        # Scratch rects reused by the collision queries (no per-frame Rect allocation)
+        self._enemy_probe = pygame.Rect(0, 0, 0, 0)
+        self._ground_probe = pygame.Rect(0, 0, 0, 0)
+
     def _get_initial_image(self) -> pygame.Surface:
         """Return the first available animation frame for the player sprite."""
         if not self.anims:
@@ -263,8 +271,8 @@ class mainCharacter(WeaponSystem):
 
         idx = self._anim_index(state)
         if self.anims.get(state):
-            img = self.anims[state][idx]
-            self.image = img if self.facing_right else pygame.transform.flip(img, True, False)
+            frames = self.anims[state] if self.facing_right else self.anims_flipped[state]
+            self.image = frames[idx]
     
     def move(self, dx, dy, obstacles=None):
         old_x, old_y = self.rect.x, self.rect.y
@@ -272,20 +280,60 @@ class mainCharacter(WeaponSystem):
         # Handle horizontal movement
         if dx != 0:
             self.rect.x += dx
-            if obstacles and self.check_collision_with_obstacles(obstacles):
+            if self.is_blocked(obstacles):
                 self.rect.x = old_x
 
         if dy != 0:
             self.rect.y += dy
-            if obstacles and self.check_collision_with_obstacles(obstacles):
+            if self.is_blocked(obstacles):
                 self.rect.y = old_y
-                
+
+    def is_blocked(self, obstacles):
+        """True if the player rect overlaps a solid obstacle or a live enemy body."""
+        if obstacles and self.check_collision_with_obstacles(obstacles):
+            return True
+        return self.find_blocking_enemy(self.rect) is not None
+
+    def find_blocking_enemy(self, rect):
+        """Return the world rect of the first live enemy overlapping `rect` (screen space), or None.
+
+        Enemies live in world space, so instead of copying every enemy rect into
+        screen space we shift a single scratch probe into world space and test
+        against the enemy rects directly.
+        """
+        if not self.enemies or not hasattr(self, 'level'):
+            return None
+
+        probe = self._enemy_probe
+        probe.update(rect.x + self.level.ground_scroll, rect.y, rect.width, rect.height)
+
+        # Narrow to the enemies around the probe when the level keeps them sorted by x
+        window = getattr(self.level, 'enemy_window', None)
+        if window is not None and window.items is self.enemies:
+            window.sync(self.enemies)
+            lo, hi = window.bounds(probe.left, probe.right, margin=0)
+        else:
+            lo, hi = 0, len(self.enemies)
+
+        for i in range(lo, hi):
+            enemy = self.enemies[i]
+            # Collectibles (like mushrooms) don't block movement
+            if getattr(enemy, 'is_collectible', False) or not getattr(enemy, 'alive', True):
+                continue
+            if probe.colliderect(enemy.rect):
+                return enemy.rect
+
+        return None
 
     def check_collision_with_obstacles(self, obstacles):
+        if perf_counters.enabled:
+            perf_counters.add("rect_tests", len(obstacles))
         for obstacle in obstacles:
             obstacle_rect = self._resolve_rect(obstacle)
 
             if self.rect.colliderect(obstacle_rect):
+                if perf_counters.enabled:
+                    perf_counters.add("rect_hits")
                 if isinstance(obstacle, (Spikes, end, EndWithDifficulty, Ice)):
                     obstacle.collideHurt(self)
 
@@ -312,7 +360,7 @@ class mainCharacter(WeaponSystem):
             
             # Spawn double jump particles (smoke/cloud effect)
             for _ in range(8):  # Create 8 particles
-                particle = DoubleJumpParticle(0, 0)  # Position is relative
+                particle = object_pool.acquire(DoubleJumpParticle, 0, 0)  # Position is relative
                 self.double_jump_particles.append(particle)
     
     def trigger_dash(self):
@@ -330,7 +378,7 @@ class mainCharacter(WeaponSystem):
             self.dash_direction = 1 if self.facing_right else -1
         print("DASH!")
     
-    def update_dash(self, all_collidables):
+    def update_dash(self, obstacles):
         """Update dash movement"""
         if self.dash_duration > 0:
             # Dash with invincibility
@@ -338,7 +386,7 @@ class mainCharacter(WeaponSystem):
             
             # Store old position to check if we got blocked
             old_x = self.rect.x
-            self.move(self.dash_direction * dash_distance, 0, all_collidables)
+            self.move(self.dash_direction * dash_distance, 0, obstacles)
             
             # If we didn't move (hit a wall), cancel the dash
             if self.rect.x == old_x:
@@ -353,7 +401,7 @@ class mainCharacter(WeaponSystem):
             
             # Spawn dash trail particles continuously during dash
             for _ in range(3):  # 3 particles per frame
-                particle = DashTrailParticle(0, 0, self.dash_direction)  # Position is relative
+                particle = object_pool.acquire(DashTrailParticle, 0, 0, self.dash_direction)  # Position is relative
                 self.dash_particles.append(particle)
         else:
             # End dash
@@ -373,27 +421,17 @@ class mainCharacter(WeaponSystem):
     def update(self, keys, obstacles, enemies):
         self.update_weapon_system()
         self.enemies = enemies  
-        
-        enemy_screen_rects = []
-        for enemy in enemies:
-            # Skip collectibles (like mushrooms) - they don't block movement
-            if hasattr(enemy, 'is_collectible') and enemy.is_collectible:
-                continue
-            screen_rect = enemy.rect.copy()
-            screen_rect.x -= self.level.ground_scroll 
-            enemy_screen_rects.append(screen_rect)
-        
-        all_collidables = obstacles + enemy_screen_rects
+
         if pygame.time.get_ticks() > self.slow_until:
             self.speed_boost = 1.0
 
         actual_speed = self.base_speed * self.speed_boost
 
         if keys[pygame.K_LEFT]:
-            self.move(-actual_speed, 0, all_collidables)
+            self.move(-actual_speed, 0, obstacles)
             self.scroll_speed = -0.5
         if keys[pygame.K_RIGHT]:
-            self.move(actual_speed, 0, all_collidables)
+            self.move(actual_speed, 0, obstacles)
             self.scroll_speed = 0.5
         
         # Jump logic with double jump support (all levels)
@@ -413,7 +451,7 @@ class mainCharacter(WeaponSystem):
         self.jump_key_was_pressed = jump_key_pressed
         
         if keys[pygame.K_DOWN]:
-            self.move(0, 3.5, all_collidables)  # Fast fall
+            self.move(0, 3.5, obstacles)  # Fast fall
         
         # Level 2+ - Special Abilities (Level 2 and Boss Level)
         if hasattr(self, 'current_level') and self.current_level >= 2:
@@ -427,7 +465,7 @@ class mainCharacter(WeaponSystem):
             self.dash_key_was_pressed = dash_key_pressed
             
             if self.dashing:
-                self.update_dash(all_collidables)
+                self.update_dash(obstacles)
             if self.dash_cooldown > 0:
                 self.dash_cooldown -= 1
             
@@ -449,7 +487,7 @@ class mainCharacter(WeaponSystem):
         if keys[pygame.K_a]:
             if self.attack_timer <= 0:  # start new attack only if not already attacking
                 hit_enemies = self.melee_attack(self.enemies, obstacles)
-                SCRATCH_SOUND.play()
+                sfx.play("scratch")
                 self.attack_timer = self.attack_cooldown_frames
                 if hit_enemies:
                     print(f"Hit {len(hit_enemies)} enemies!")
@@ -467,7 +505,7 @@ class mainCharacter(WeaponSystem):
                     self.projectile_manager.add_projectile(projectile)
                     self.set_shooting_cooldown()
                     print("Quick Shot fired!")
-                    FISH_THROW_SOUND.play()
+                    sfx.play("fish_throw")
 
         # Charged Shot (hold C)
         if keys[pygame.K_c]:
@@ -482,14 +520,14 @@ class mainCharacter(WeaponSystem):
                     self.projectile_manager.add_projectile(projectile)
                     self.set_shooting_cooldown()
                     print("Charged Shot fired!")
-                    FISH_THROW_SOUND.play()
+                    sfx.play("fish_throw")
             
 
         # Update animation based on current state
         self.update_animation(keys)
         
         # Apply physics (gravity and movement)
-        self.applyGrav(all_collidables)
+        self.applyGrav(obstacles)
         
         # Update weapon system
         self.projectile_manager.update()
@@ -620,7 +658,7 @@ class mainCharacter(WeaponSystem):
             print("Player defeated!")
         else:
             # Brief invulnerability after taking damage
-            PLAYER_HURT_SOUND.play()
+            sfx.play("player_hurt")
             self.iFrame()
             self.hurt_timer = self.hurt_frames
             # You might want to add a timer to reset invulnerability
@@ -720,31 +758,48 @@ class mainCharacter(WeaponSystem):
         # Draw the player sprite
         surface.blit(self.image, self.rect)
 
-    def check_collision(self, all_collidables):
-        for entity in all_collidables:
+    def resolve_vertical(self, entity_rect):
+        """Push the player out of entity_rect along y; True if a collision was resolved."""
+        if self.y_velocity > 0:
+            self.rect.bottom = entity_rect.top
+            self.jumping = False
+            self.on_ground = True
+            self.y_velocity = 0
+            return True
+
+        elif self.y_velocity < 0:
+            self.rect.top = entity_rect.bottom
+            self.y_velocity = 0
+            return True
+
+        return False
+
+    def check_collision(self, obstacles):
+        if perf_counters.enabled:
+            perf_counters.add("rect_tests", len(obstacles) * (2 if self.on_ground else 1))
+        for entity in obstacles:
             entity_rect = self._resolve_rect(entity)
 
             if self.rect.colliderect(entity_rect):
+                if perf_counters.enabled:
+                    perf_counters.add("rect_hits")
                 if isinstance(entity, (Spikes, Ice, end, EndWithDifficulty)):
                     entity.collideHurt(self)
                 if getattr(entity, 'solid', True):
-                    if self.y_velocity > 0:
-                        self.rect.bottom = entity_rect.top
-                        self.jumping = False
-                        self.on_ground = True
-                        self.y_velocity = 0
-                        return True 
-
-                    elif self.y_velocity < 0:
-                        self.rect.top = entity_rect.bottom
-                        self.y_velocity = 0
-                        return True 
+                    if self.resolve_vertical(entity_rect):
+                        return True
+
+        # Enemy bodies are solid too; y is unscrolled so the world rect's top/bottom apply directly
+        enemy_rect = self.find_blocking_enemy(self.rect)
+        if enemy_rect is not None and self.resolve_vertical(enemy_rect):
+            return True
 
         if self.on_ground:
-            ground_check_rect = pygame.Rect(self.rect.x, self.rect.y + 1, self.rect.width, 1)
+            ground_check_rect = self._ground_probe
+            ground_check_rect.update(self.rect.x, self.rect.y + 1, self.rect.width, 1)
             still_on_ground = False
             
-            for block in all_collidables:
+            for block in obstacles:
                 block_rect = self._resolve_rect(block)
 
                 if getattr(block, 'solid', True) and ground_check_rect.colliderect(block_rect):
@@ -752,6 +807,9 @@ class mainCharacter(WeaponSystem):
                     if isinstance(block, Ice):
                         block.collideHurt(self)
                     break 
+
+            if not still_on_ground and self.find_blocking_enemy(ground_check_rect) is not None:
+                still_on_ground = True
             
             if not still_on_ground:
                 self.on_ground = False
@@ -780,12 +838,14 @@ class mainCharacter(WeaponSystem):
             particle.update()
             if particle.is_dead():
                 self.dash_particles.remove(particle)
+                object_pool.release(particle)
         
         # Update double jump particles
         for particle in self.double_jump_particles[:]:
             particle.update()
             if particle.is_dead():
                 self.double_jump_particles.remove(particle)
+                object_pool.release(particle)
 
     def draw(self, surface):
         # Calculate anchor position for particles (player center in screen space)
@@ -873,13 +933,13 @@ class mainCharacter(WeaponSystem):
             pygame.draw.rect(surface, bar_color, fill_rect)
         
         # Draw text label
-        font = pygame.font.Font(None, 24)
+        font = fonts.get(None, 24)
         if self.dash_cooldown <= 0:
-            text = font.render("DASH READY", True, (255, 255, 255))
+            text = fonts.render(font, "DASH READY", (255, 255, 255))
         else:
             frames_left = self.dash_cooldown
             seconds_left = frames_left / 60.0  # Convert frames to seconds (60 FPS)
-            text = font.render(f"DASH: {seconds_left:.1f}s", True, (255, 255, 255))
+            text = fonts.render(font, f"DASH: {seconds_left:.1f}s", (255, 255, 255))
         
         text_rect = text.get_rect(center=(bar_x + bar_width // 2, bar_y + bar_height // 2))
         surface.blit(text, text_rect)
@@ -0,0 +1,74 @@
+"""
+Font registry and rendered-text cache.
+
+Menus, the HUD and the dialogue screens built pygame.font.Font objects over
+and over - several per frame in the HUD - and re-rasterized the same labels
+every frame. get() hands out one Font per (path, size) for the whole run and
+render() keeps a bounded LRU of text surfaces keyed by (font, text, colour,
+antialias, background), so an unchanged label is a dictionary lookup.
+
+Rendered surfaces are shared, so nothing may call set_alpha() on one. Faded
+text asks for render(..., alpha=a), which returns a private copy with that
+alpha (not cached - fades change it every frame); code that keeps a surface
+and fades it itself takes a .copy() first.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+import perf_counters
+
+DEFAULT_FONT = "assets/yoster.ttf"
+MAX_TEXT_SURFACES = 512
+
+_fonts = {}             # (path, size) -> Font
+_text = OrderedDict()   # (font, text, colour, antialias, background) -> Surface, least recent first
+
+
+def get(path, size, fallback_size=None):
+    """Shared Font for (path, size); path None is pygame's default font.
+
+    If the file can't be loaded, pygame's default font at fallback_size (or
+    size) is used instead, as the old try/except blocks did.
+    """
+    key = (path, size)
+    font = _fonts.get(key)
+    if font is None:
+        try:
+            font = pygame.font.Font(path, size)
+        except (OSError, pygame.error) as e:
+            if path is None:
+                raise
+            print(f"⚠️ Could not load font {path}: {e}")
+            font = get(None, fallback_size or size)
+        _fonts[key] = font
+    return font
+
+
+def render(font, text, color, antialias=True, background=None, alpha=None):
+    """font.render(text, antialias, color, background), cached; with alpha, a faded copy."""
+    if alpha is not None:
+        surface = render(font, text, color, antialias, background).copy()
+        surface.set_alpha(alpha)
+        return surface
+
+    key = (font, text, tuple(color), antialias, tuple(background) if background is not None else None)
+    surface = _text.get(key)
+    if surface is not None:
+        _text.move_to_end(key)
+        return surface
+
+    surface = font.render(text, antialias, color, background)
+    if perf_counters.enabled:
+        perf_counters.add("font_renders")
+        perf_counters.add("surfaces")
+    _text[key] = surface
+    if len(_text) > MAX_TEXT_SURFACES:
+        _text.popitem(last=False)
+    return surface
+
+
+def clear():
+    """Drop all cached text surfaces (fonts are kept)."""
+    _text.clear()
@@ -0,0 +1,168 @@
+"""
+On-disk cache of decoded, pre-scaled sprite frames.
+
+Loading a sprite sheet means decoding the PNG and then scaling every frame,
+and the result is the same on every launch. The loaders in entities,
+BossEnemy, level2_powerup_loader and game hand their work to load_frames()
+together with the files it reads and the transform parameters it applies.
+The final frames are stored as one raw RGBA blob per entry plus a small JSON
+index, named by a hash of the source files' contents and those parameters.
+
+On a warm start the blob is mmapped and each frame is wrapped with
+pygame.image.frombuffer() and converted to the display format, so no PNG is
+decoded and nothing is rescaled.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+
+import pygame
+
+import hitch_watch
+
+CACHE_DIR = os.path.join(".cache", "frames")
+SOURCES_DIR = os.path.join(CACHE_DIR, "sources")   # One empty marker per source file content already cached
+CACHE_VERSION = 1   # Bump when the blob/index layout changes
+
+_file_hashes = {}   # (path, mtime_ns, size) -> content hash, so each file is hashed once per run
+
+
+def _file_hash(path):
+    stat = os.stat(path)
+    stamp = (path, stat.st_mtime_ns, stat.st_size)
+    digest = _file_hashes.get(stamp)
+    if digest is None:
+        with open(path, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        _file_hashes[stamp] = digest
+    return digest
+
+
+def cache_key(sources, params):
+    """Content address for the frames built from `sources` with `params`."""
+    h = hashlib.sha1(f"v{CACHE_VERSION}|{params!r}".encode())
+    for path in sources:
+        h.update(_file_hash(path).encode())
+    return h.hexdigest()
+
+
+def _source_marker(path):
+    return os.path.join(SOURCES_DIR, _file_hash(path))
+
+
+def needs_decode(path):
+    """False if frames built from this exact file content are already cached."""
+    try:
+        return not os.path.exists(_source_marker(path))
+    except OSError:
+        return True
+
+
+def _mark_sources(sources):
+    os.makedirs(SOURCES_DIR, exist_ok=True)
+    for path in sources:
+        with open(_source_marker(path), "w"):
+            pass
+
+
+def _read(key):
+    index_path = os.path.join(CACHE_DIR, key + ".json")
+    if not os.path.exists(index_path):
+        return None
+    with open(index_path) as f:
+        index = json.load(f)
+
+    frames = []
+    with open(os.path.join(CACHE_DIR, key + ".rgba"), "rb") as f:
+        if index["size"] == 0:
+            return [pygame.Surface((0, 0), pygame.SRCALPHA) for _ in index["frames"]]
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as blob:
+            if len(blob) != index["size"]:
+                return None
+            view = memoryview(blob)
+            try:
+                for width, height, offset in index["frames"]:
+                    pixels = view[offset:offset + width * height * 4]
+                    # frombuffer wraps the mapped bytes; convert_alpha copies them out
+                    frames.append(pygame.image.frombuffer(pixels, (width, height), "RGBA").convert_alpha())
+                    pixels.release()
+            finally:
+                view.release()
+    return frames
+
+
+def _write(key, frames):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    entries = []
+    offset = 0
+    blob_path = os.path.join(CACHE_DIR, key + ".rgba")
+    with open(blob_path + ".tmp", "wb") as f:
+        for frame in frames:
+            data = pygame.image.tobytes(frame, "RGBA")
+            f.write(data)
+            entries.append((frame.get_width(), frame.get_height(), offset))
+            offset += len(data)
+    os.replace(blob_path + ".tmp", blob_path)
+
+    # The index goes last so a half-written entry is never picked up
+    index_path = os.path.join(CACHE_DIR, key + ".json")
+    with open(index_path + ".tmp", "w") as f:
+        json.dump({"size": offset, "frames": entries}, f)
+    os.replace(index_path + ".tmp", index_path)
+
+
+def load_frames(sources, params, build, atlas=None):
+    """Return the frames build() would produce, from the cache when possible.
+
+    sources - files build() reads; their contents are part of the key
+    params  - everything else that affects the output (sizes, crop, scale...), must repr() stably
+    build   - callable returning a list of Surfaces, run on a cache miss
+    atlas   - optional TextureAtlas; frames come back as views into it, shared per key
+    """
+    try:
+        key = cache_key(sources, params)
+    except OSError:
+        # Missing source: let build() raise its own, more specific error
+        return build()
+
+    if atlas is not None and key in atlas:
+        return atlas.get(key)
+
+    with hitch_watch.loading("frames", sources[0] if sources else key[:12]):
+        frames = _load(key, sources, build)
+    if atlas is not None:
+        frames = atlas.pack(key, frames)
+    return frames
+
+
+def load_image(path, size=None, scale=None, atlas=None):
+    """Load one image, optionally scaled to `size` or by `scale`, through the cache."""
+    def build():
+        image = pygame.image.load(path).convert_alpha()
+        if size:
+            image = pygame.transform.scale(image, size)
+        elif scale:
+            image = pygame.transform.scale_by(image, scale)
+        return [image]
+
+    return load_frames([path], ("image", size, scale), build, atlas)[0]
+
+
+def _load(key, sources, build):
+    try:
+        frames = _read(key)
+    except (OSError, ValueError, KeyError, pygame.error) as e:
+        print(f"⚠️ Frame cache entry {key[:12]} unreadable, rebuilding: {e}")
+        frames = None
+    if frames is not None:
+        return frames
+
+    frames = build()
+    try:
+        _write(key, frames)
+        _mark_sources(sources)
+    except (OSError, pygame.error) as e:
+        print(f"⚠️ Could not write frame cache: {e}")
+    return frames
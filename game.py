@@ -1,16 +1,40 @@
 import pygame
 import pytmx
-from entities import mainCharacter
-from Level1Enemies import BreakableBlock, Level1Enemy, Archer, Warrior, Mushroom
-from Level2Enemies import MushroomPickup, MutatedMushroom, Skeleton, FlyingEye
-from BossEnemy import EasyDungeonBoss, HardDungeonBoss
-from blocks import block, Spikes, start, end, EndWithDifficulty, Ice, AnimatedTrap, LightningTrap, FireTrap
+import asset_loader
+import frame_cache
+import fonts
+import gc_policy
+import memory_report
+import hitch_watch
+import load_profile
+import perf_counters
+import sampling_profiler
+import object_pool
+import texture_atlas
+from entities import mainCharacter, ANIM_MANIFEST
+from Level1Enemies import Level1Enemy, WARRIOR_ANIM, ARCHER_ANIM
+from Level2Enemies import Skeleton, SKELETON_ANIM, MUSHROOM_ANIM, FLYING_EYE_ANIM
+from BossEnemy import EasyDungeonBoss, HardDungeonBoss, BOSS_ASSETS_PATH
+from blocks import block, start, LightningTrap, FireTrap
 from particles import LeafParticle
-from level2_powerup_loader import load_mushroom_sprites, create_level2_powerup_with_sprite, TILED_OBJECT_TO_POWERUP
+from level2_powerup_loader import load_mushroom_sprites, MUSHROOM_SHEET
+from spatial_window import SpatialWindow
+from ai_scheduler import AIScheduler
+from spawn_table import SpawnTable
+from spawn_registry import LAZY_KINDS, LEVEL_TILES, BOSS_TILES, LEVEL1_SPAWNS, LEVEL2_SPAWNS, BOSS_SPAWNS, SAW_TRAP_SHEET
 import random
 
+def _is_alive(entity):
+    return entity.alive
+
+
+def _is_powerup_live(powerup):
+    return not powerup.collected or powerup.collection_particles
+
+
 class Game:
     def __init__(self, width=960, height=640):
+        load_profile.begin(type(self).__name__)
         self.WIDTH = width
         self.HEIGHT = height
         self.scroll_threshold = width / 4
@@ -30,35 +54,75 @@ class Game:
 
         self.debug_mode = False # Start with debug mode off
         
-        self.font = pygame.font.Font(None, 36)
+        self.font = fonts.get(None, 36)
         self.heart = None
         self.mushroom_icon = None
+        self.counter_icon = None
         self.mushroomCount = 0
         
         self.player = None
         self.enemies = []
         self.arrows = []
         self.doScroll = True
+
+        # Sorted-by-x activation windows; only entities near the view get visited
+        self.enemy_window = SpatialWindow(margin=700)
+        self.trap_window = SpatialWindow(margin=100)
+        self.powerup_window = SpatialWindow(margin=100)
+
+        # Distant enemies tick less often (see ai_scheduler.py)
+        self.ai_scheduler = AIScheduler(view_width=width)
+
+        # Enemies and traps are built only once the camera gets near them
+        self.spawn_table = SpawnTable(spawn_radius=900, hibernate_radius=2400)
+        self.spawn_registry = {}
+        self.spawn_prototypes = {}   # factory -> pristine clone source, see SpawnEntry.build
         
         self.leaf_particles = [LeafParticle(random.randint(0, 960), random.randint(-200, 0)) for _ in range(50)]
         
+    def prefetch_assets(self, bg_folder, num_layers, tilemap_file, manifests=(), files=()):
+        """Start decoding every image this level needs on the asset thread pool (see asset_loader.py)"""
+        paths = [f'{bg_folder}/Layer_{i}.png' for i in range(num_layers)]
+        paths += asset_loader.tilemap_images(tilemap_file)
+        for manifest in (ANIM_MANIFEST,) + tuple(manifests):
+            paths += asset_loader.manifest_files(manifest)
+        paths.append(MUSHROOM_SHEET)
+        paths += files
+        with load_profile.step("prefetch"):
+            asset_loader.prefetch(paths)
+
     def load_background(self, bg_folder, num_layers):
-        self.bg_images = []
-        for i in range(num_layers):
-            bg_image = pygame.image.load(f'{bg_folder}/Layer_{i}.png').convert_alpha()
-            bg_image = pygame.transform.scale(bg_image, (self.WIDTH, self.HEIGHT))
-            self.bg_images.append(bg_image)
+        layer_files = [f'{bg_folder}/Layer_{i}.png' for i in range(num_layers)]
+
+        def build():
+            bg_images = []
+            for layer_file in layer_files:
+                bg_image = asset_loader.load(layer_file).convert_alpha()
+                bg_images.append(pygame.transform.scale(bg_image, (self.WIDTH, self.HEIGHT)))
+            return bg_images
+
+        with load_profile.step("background"):
+            self.bg_images = frame_cache.load_frames(layer_files, ("background", self.WIDTH, self.HEIGHT), build)
         self.bg_width = self.bg_images[0].get_width()
         
     def load_tilemap(self, tilemap_file):
-        self.tmx_data = pytmx.util_pygame.load_pygame(tilemap_file)
+        # Same as pytmx.util_pygame.load_pygame, with tileset images taken from the prefetch pool
+        with load_profile.step("tmx"):
+            self.tmx_data = pytmx.TiledMap(tilemap_file, image_loader=asset_loader.tmx_image_loader)
         
     def load_ui_assets(self):
-        heart = pygame.image.load('assets/heart.png').convert_alpha()
-        self.heart = pygame.transform.scale_by(heart, 0.05)
-        
-        mushroom_icon = pygame.image.load('assets/mushroom.png').convert_alpha()
-        self.mushroom_icon = pygame.transform.scale(mushroom_icon, (30, 30))
+        with load_profile.step("ui_assets"):
+            self.heart = frame_cache.load_image('assets/heart.png', scale=0.05, atlas=texture_atlas.UI)
+            self.mushroom_icon = frame_cache.load_image('assets/mushroom.png', size=(30, 30), atlas=texture_atlas.UI)
+
+            # Larger icon for the mushroom counter, loaded once instead of every frame
+            try:
+                self.counter_icon = frame_cache.load_image('assets/mushroom.png', size=(40, 40), atlas=texture_atlas.UI)
+            except Exception as e:
+                print(f"Error loading mushroom icon: {e}")
+                # Fallback: create a simple surface
+                self.counter_icon = pygame.Surface((40, 40), pygame.SRCALPHA)
+                pygame.draw.circle(self.counter_icon, (220, 80, 80), (20, 20), 18)
         
     def reset_game(self):
         if self.player:
@@ -86,6 +150,9 @@ class Game:
                     self.screen.blit(i, (bg_pos_x, 0))
                 speed += 0.1
             
+        self.draw_leaf_particles()
+
+    def draw_leaf_particles(self):
         for particle in self.leaf_particles:
             particle.draw(self.screen, self.scroll if self.doScroll else 0)
                 
@@ -98,6 +165,20 @@ class Game:
         # Skip particle-obstacle collision for performance (particles are visual only)
         for particle in self.leaf_particles:
             particle.update([], self.scroll)  # Pass empty list instead of all obstacles
+
+    def update_arrows(self):
+        """Move archer arrows and check player hits; dead arrows go back to their pool"""
+        alive = 0
+        for arrow in self.arrows:
+            if arrow.alive:
+                arrow.update(self.obstacles)
+                arrow.collide(self.player, scroll_offset=self.ground_scroll)
+            if arrow.alive:
+                self.arrows[alive] = arrow  # Compact in place instead of building a new list each frame
+                alive += 1
+            else:
+                object_pool.release(arrow)
+        del self.arrows[alive:]
         
     def handle_scrolling(self):
         if not self.player or not self.doScroll:
@@ -123,14 +204,9 @@ class Game:
                     if self.ground_scroll < 0:
                         self.ground_scroll = 0
                         
-    def draw_debug_info(self):
-        fps = self.clock.get_fps()
-        fps_text = self.font.render(f"FPS: {fps:.1f}", True, (255, 255, 255))
-        self.screen.blit(fps_text, (self.WIDTH - 150, 10))
-    
     def draw_mushroom_count(self):
         self.screen.blit(self.mushroom_icon, (self.WIDTH - 150, 50))
-        mushroom_text = self.font.render(f"x {self.mushroomCount}", True, (255, 255, 255))
+        mushroom_text = fonts.render(self.font, f"x {self.mushroomCount}", (255, 255, 255))
         self.screen.blit(mushroom_text, (self.WIDTH - 110, 55))
         
     def draw_tilemap(self):
@@ -163,13 +239,14 @@ class Game:
         print("Building spatial hash...")
         TILE_SIZE = 32
         self.spatial_hash.clear()
-        for obstacle in self.obstacles:
-            # Determine which grid cell(s) the obstacle overlaps with.
-            # For simplicity, we'll use its top-left corner.
-            key = (int(obstacle.rect.x // TILE_SIZE), int(obstacle.rect.y // TILE_SIZE))
-            if key not in self.spatial_hash:
-                self.spatial_hash[key] = []
-            self.spatial_hash[key].append(obstacle)
+        with load_profile.step("spatial_hash"):
+            for obstacle in self.obstacles:
+                # Determine which grid cell(s) the obstacle overlaps with.
+                # For simplicity, we'll use its top-left corner.
+                key = (int(obstacle.rect.x // TILE_SIZE), int(obstacle.rect.y // TILE_SIZE))
+                if key not in self.spatial_hash:
+                    self.spatial_hash[key] = []
+                self.spatial_hash[key].append(obstacle)
                             
     def update_obstacles(self):
         for obstacle in self.obstacles:
@@ -177,39 +254,154 @@ class Game:
             obstacle.update()
             obstacle.draw(self.screen)
             
+    def window_bounds(self, window, items):
+        """Sync `window` with `items` and return the index range active around the view."""
+        window.sync(items)
+        return window.bounds(self.ground_scroll, self.ground_scroll + self.WIDTH)
+
+    def load_spawns(self, tile_types, registry):
+        """Build the level from the tilemap - one dispatch path shared by every level.
+
+        tile_types maps a tile's `type` property to an obstacle class (default block);
+        registry maps a Tiled object `type` to its SpawnEntry (see spawn_registry.py).
+        """
+        TILE_SIZE = 32
+        self.obstacles = []
+        self.enemies = []
+        self.spawn_table.clear()
+        self.spawn_prototypes.clear()
+        self.spawn_registry = registry
+        self.start_position = (0, 100)
+
+        tile_layer = self.tmx_data.get_layer_by_name("Tile Layer 1")
+        if isinstance(tile_layer, pytmx.TiledTileLayer):
+            for x, y, gid in tile_layer.iter_data():
+                if not gid:
+                    continue
+
+                props = self.tmx_data.get_tile_properties_by_gid(gid) or {}
+                obstacle_class = tile_types.get(props.get("type"), block)
+                with load_profile.step(f"tile:{obstacle_class.__name__}"):
+                    self.obstacles.append(obstacle_class(x * TILE_SIZE, y * TILE_SIZE))
+
+        objectLayer = self.tmx_data.get_layer_by_name("Object Layer 1")
+        if isinstance(objectLayer, pytmx.TiledObjectGroup):
+            for obj in objectLayer:
+                typ = getattr(obj, "type", None) or (obj.properties or {}).get("type")
+                entry = registry.get(typ)
+                if entry is None:
+                    continue
+
+                x, y = entry.position(obj)
+                props = {"gid": obj.gid}
+
+                if entry.kind == "start":
+                    self.obstacles.append(start(obj.x, obj.y))
+                    self.start_position = (x, y)
+                elif entry.kind in LAZY_KINDS:
+                    self.spawn_table.add(typ, x, y, props)
+                else:
+                    with load_profile.step(f"{entry.kind}:{typ}"):
+                        entity = entry.build(self, x, y, props)
+                    if entry.kind == "obstacle":
+                        self.obstacles.append(entity)
+                    elif entry.kind == "powerup":
+                        self.powerups.append(entity)
+                        print(f"Spawned {entity.powerup_type} powerup at ({x}, {y})")
+                    elif entry.kind == "boss":
+                        entity.level = self
+                        self.boss = entity
+                        self.enemies.append(entity)
+                        print(f"Spawned {self.difficulty.upper()} Boss at ({x}, {y})")
+                    if entry.label and entry.kind != "boss":
+                        print(f"Found {entry.label} object at ({x}, {y})")
+
+    def spawn_entity(self, record):
+        """Build the entity for a spawn record from the level's spawn registry."""
+        entry = self.spawn_registry.get(record.type)
+        if entry is None:
+            return None
+        with load_profile.spawned(record.type):
+            entity = entry.build(self, record.x, record.y, record.props)
+        if entity is None:
+            return None
+        entity.level = self
+        if entry.label:
+            print(f"Spawned {entry.label} at ({record.x}, {record.y})")
+        return entity
+
+    def teardown(self):
+        """The level is over: drop its spawn prototypes and pending spawn records."""
+        self.spawn_prototypes.clear()
+        self.spawn_table.clear()
+
+    def update_spawns(self):
+        """Materialize spawn records near the camera and hibernate enemies left far behind."""
+        table = self.spawn_table
+        for record in table.take(self.ground_scroll, self.ground_scroll + self.WIDTH):
+            entity = self.spawn_entity(record)
+            if entity is None:
+                continue
+            table.restore(entity, record)
+            if isinstance(entity, block):
+                self.animated_traps.append(entity)
+            else:
+                self.enemies.append(entity)
+
+        if table.hibernate_radius is None:
+            return
+
+        # Enemies are sorted by x, so anything far enough behind is at the front of the list
+        cutoff = self.ground_scroll - table.hibernate_radius
+        window = self.enemy_window
+        window.sync(self.enemies)
+        behind, _ = window.bounds(cutoff, cutoff, margin=0)
+        if not behind:
+            return
+        for enemy in self.enemies[:behind]:
+            if enemy.alive and hasattr(enemy, 'spawn_record'):
+                table.hibernate(enemy)
+                enemy.alive = False
+        window.prune(0, behind, _is_alive)
+
     def update_enemies(self):
-        # Calculate screen bounds for culling
-        screen_left = self.ground_scroll - 200  # Extra margin for spawning/attacks
-        screen_right = self.ground_scroll + self.WIDTH + 200
+        self.update_spawns()
+
+        # Only enemies inside the activation window are visited; the rest cost nothing
+        lo, hi = self.window_bounds(self.enemy_window, self.enemies)
+        self.ai_scheduler.begin_frame()
         
-        for enemy in self.enemies:
+        for i in range(lo, hi):
+            enemy = self.enemies[i]
             if not enemy.alive:
                 continue
             
-            # Simple culling: skip enemies far off-screen (but still process nearby ones)
-            if enemy.rect.right < screen_left - 500 or enemy.rect.left > screen_right + 500:
-                continue
-            
             # Check if it's a boss enemy (from BossEnemy.py)
             if hasattr(enemy, 'projectiles') and hasattr(enemy, 'difficulty'):
                 # Boss enemies need obstacles for collision detection
                 enemy.update(self.player, dt=1.0, obstacles=self.obstacles, scroll_offset=self.ground_scroll)
-            # Level 1 and Level 2 enemies both use the same update signature
+            # Level 1 and Level 2 enemies both use the same update signature;
+            # the scheduler decides how much AI they get this frame
             elif isinstance(enemy, Level1Enemy) or hasattr(enemy, 'scroll_offset'):
-                enemy.update(self.player, dt=1.0, obstacles=self.obstacles, scroll_offset=self.ground_scroll)
+                self.ai_scheduler.update(enemy, self.player, 1.0, self.obstacles, self.ground_scroll)
             else:
                 # Fallback for other enemy types
                 enemy.update(self.player)
             
             enemy.draw(self.screen)
         
-        self.enemies = [e for e in self.enemies if e.alive]
+        if perf_counters.enabled:
+            perf_counters.add("entities_updated", hi - lo)
+            perf_counters.add("entities_culled", len(self.enemies) - (hi - lo))
+        hi = self.enemy_window.prune(lo, hi, _is_alive)
+        self.enemy_window.refresh(lo, hi)
     
     def check_mushroom_collection(self):
         if not self.player:
             return
         
-        for enemy in self.enemies[:]:
+        lo, hi = self.window_bounds(self.enemy_window, self.enemies)
+        for enemy in self.enemies[lo:hi]:
             if hasattr(enemy, 'is_collectible') and enemy.is_collectible:
                 if enemy.check_player_collision(self.player, self.ground_scroll):
                     enemy.collect()
@@ -246,6 +438,32 @@ class Game:
             obstacle_screen_rect = obstacle.rect.copy()
             obstacle_screen_rect.x -= self.ground_scroll
             pygame.draw.rect(self.screen, (255, 0, 0), obstacle_screen_rect, 1)
+
+        # Garbage collector time in the last frame, and the worst pause this level
+        gc_text = fonts.render(self.font, f"GC: {gc_policy.frame_pause_ms():.1f} ms (max {gc_policy.max_pause_ms:.1f})", (255, 255, 255))
+        self.screen.blit(gc_text, (10, self.HEIGHT - 40))
+
+        fps_text = fonts.render(self.font, f"FPS: {self.clock.get_fps():.1f}", (255, 255, 255))
+        self.screen.blit(fps_text, (self.WIDTH - 150, 10))
+        self.draw_perf_counters()
+
+    def draw_perf_counters(self):
+        """Last frame's engine counters (perf_counters.py), under the FPS readout."""
+        c = perf_counters.last_frame
+        lines = (
+            f"blits {c.get('blits', 0)}  fills {c.get('fills', 0)}  draws {c.get('draws', 0)}",
+            f"surfaces {c.get('surfaces', 0)}  image loads {c.get('image_loads', 0)}  font renders {c.get('font_renders', 0)}",
+            f"rect tests {c.get('rect_tests', 0)}  hits {c.get('rect_hits', 0)}",
+            f"entities {c.get('entities_updated', 0)} updated, {c.get('entities_culled', 0)} culled",
+            f"particles {hitch_watch.entity_counts(self)['particles']}",
+        )
+        font = fonts.get(None, 22)
+        texts = [fonts.render(font, line, (255, 255, 255)) for line in lines]
+        panel = pygame.Rect(0, 88, max(text.get_width() for text in texts) + 12, len(texts) * 18 + 4)
+        panel.right = self.WIDTH - 4
+        self.screen.fill((0, 0, 0), panel)
+        for i, text in enumerate(texts):
+            self.screen.blit(text, text.get_rect(topright=(self.WIDTH - 10, 90 + i * 18)))
                 
 
     def check_win_lose_conditions(self):
@@ -258,11 +476,18 @@ class Game:
     def run(self, screen):
         self.screen = screen
         self.reset_game()
+        gc_policy.enter_gameplay()
+        memory_report.level_start(self)
+        hitch_watch.level_start(self)
+        load_profile.level_start(self)
+        sampling_profiler.set_scene(type(self).__name__)
         
         running = True
         esc_was_pressed = False  # Track ESC key state to avoid multiple triggers
         
         while running:
+            perf_counters.set_enabled(self.debug_mode)  # Debug toggles (B) take effect here, between frames
+            self.screen = perf_counters.target(screen)
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     return "quit"
@@ -277,12 +502,15 @@ class Game:
                         
                         # Capture current game state
                         game_surface = self.screen.copy()
+                        gc_policy.collect_now()  # Nobody sees a collection while paused
                         
                         # Show pause menu
                         pause_action = pause_menu(self.WIDTH, self.HEIGHT, self.screen, game_surface)
+                        hitch_watch.skip_frame()
                         
                         if pause_action == 'restart':
                             self.reset_game()
+                            gc_policy.enter_gameplay()
                         elif pause_action == 'main_menu':
                             return "start"
                         elif pause_action == 'quit':
@@ -293,30 +521,21 @@ class Game:
                     if event.key == pygame.K_ESCAPE:
                         esc_was_pressed = False  # Reset when key is released
                     
+            hitch_watch.mark("events")
             self.screen.fill((0, 0, 0))
             self.draw_bg()
             
             self.update_obstacles()
             self.draw_tilemap()
+            hitch_watch.mark("world")
             self.update_particles()
             self.update_enemies()
+            hitch_watch.mark("enemies")
             
             if hasattr(self, 'powerups'):
                 self.update_powerups()
             
-            # MEMORY LEAK FIX: More efficient arrow cleanup
-            active_arrows = []
-            for arrow in self.arrows:
-                if not arrow.alive:
-                    continue
-
-                arrow.update(self.obstacles)
-                arrow.collide(self.player, scroll_offset=self.ground_scroll)
-
-                if arrow.alive:
-                    active_arrows.append(arrow)
-
-            self.arrows = active_arrows
+            self.update_arrows()
 
             for arrow in self.arrows:
                 arrow.draw(self.screen, scroll_offset=self.ground_scroll)
@@ -327,19 +546,23 @@ class Game:
             # Check for mushroom collection
             self.check_mushroom_collection()
             self.draw_debug_info()
+            hitch_watch.mark("arrows_pickups")
 
             keys = pygame.key.get_pressed()
             self.handle_input(keys)
             
             # For damage with animated traps
             if self.player:
-                for trap in self.animated_traps:
+                lo, hi = self.window_bounds(self.trap_window, self.animated_traps)
+                for trap in self.animated_traps[lo:hi]:
                     trap.update(self.player, scroll_offset=self.ground_scroll)
                     self.screen.blit(trap.image, (trap.rect.x - self.ground_scroll, trap.rect.y))
+            hitch_watch.mark("traps")
 
             if self.player:
                 self.player.update(keys, self.obstacles, self.enemies)
                 self.player.draw(self.screen)
+            hitch_watch.mark("player")
             
             self.handle_scrolling()
             
@@ -350,9 +573,15 @@ class Game:
             game_state = self.check_win_lose_conditions()
             if game_state != "playing":
                 return game_state
+            hitch_watch.mark("hud")
             
             pygame.display.flip()
+            hitch_watch.mark("flip")
             self.clock.tick(60)
+            gc_policy.end_frame()
+            memory_report.tick(self)
+            hitch_watch.end_frame(self)
+            perf_counters.end_frame()
             
         return "menu"
 
@@ -360,6 +589,7 @@ class Level1(Game):
     def __init__(self, width=960, height=640):
         super().__init__(width, height)
         
+        self.prefetch_assets('assets/BGL', 11, "forestMap.tmx", manifests=(WARRIOR_ANIM, ARCHER_ANIM))
         self.load_background('assets/BGL', 11)
         self.load_tilemap("forestMap.tmx")
         self.load_ui_assets()
@@ -368,70 +598,21 @@ class Level1(Game):
         self.min_mushrooms = 5  # Minimum required to complete level 1
         self.level_gate_message_timer = 0  # Timer for showing message
         
-        self.mushroom_sprites = load_mushroom_sprites()
+        with load_profile.step("mushroom_sprites"):
+            self.mushroom_sprites = load_mushroom_sprites()
         print(f"✅ Loaded {len(self.mushroom_sprites)} mushroom powerup sprites")
         
-        self.process_tilemap()
-        self.initialize_game_objects()
+        with load_profile.step("process_tilemap"):
+            self.process_tilemap()
+        with load_profile.step("initialize_game_objects"):
+            self.initialize_game_objects()
+        load_profile.finish(self)
         
     def process_tilemap(self):
-        TILE_SIZE = 32
-        self.obstacles = []
-        self.enemies = []
-        self.start_position = (0, 100)
-        
-        objectLayer = self.tmx_data.get_layer_by_name("Object Layer 1")
-        tile_layer = self.tmx_data.get_layer_by_name("Tile Layer 1")
-        if isinstance(tile_layer, pytmx.TiledTileLayer):
-            for x, y, gid in tile_layer.iter_data():
-                if not gid:
-                    continue
-
-                props = self.tmx_data.get_tile_properties_by_gid(gid) or {}
-                typ = props.get("type")
-                
-                # Handle different obstacle types
-                if typ == "tombstone":
-                    self.obstacles.append(Spikes(x * TILE_SIZE, y * TILE_SIZE))
-                elif typ == "ice":
-                    self.obstacles.append(Ice(x * TILE_SIZE, y * TILE_SIZE))
-                else:
-                    # Default block
-                    self.obstacles.append(block(x * TILE_SIZE, y * TILE_SIZE))
-        
-        
-        if isinstance(objectLayer, pytmx.TiledObjectGroup):
-            for obj in objectLayer:
-                typ = getattr(obj, "type", None) or (obj.properties or {}).get("type")
-                block_image = self.tmx_data.get_tile_image_by_gid(obj.gid)
-                
-                if typ == "end":
-                    self.obstacles.append(end(obj.x, obj.y))
-                elif typ == "start":
-                    self.obstacles.append(start(obj.x, obj.y))
-                    self.start_position = (obj.x + 30, obj.y - 70)
-                elif typ == "breakable":
-                    self.enemies.append(BreakableBlock(obj.x, obj.y, block_image))
-                elif typ == "mushroom":
-                    self.enemies.append(Mushroom(obj.x, obj.y, block_image))
-                elif typ == "archer":
-                    enemy = Archer(obj.x, obj.y - 32)
-                    enemy.level = self
-                    self.enemies.append(enemy)
-                elif typ == "warrior":
-                    enemy = Warrior(obj.x, obj.y - 32)
-                    enemy.level = self
-                    self.enemies.append(enemy)
-                elif typ in TILED_OBJECT_TO_POWERUP:
-                    powerup_type = TILED_OBJECT_TO_POWERUP[typ]
-                    powerup = create_level2_powerup_with_sprite(
-                        obj.x - 30, obj.y - 30, powerup_type, self.mushroom_sprites
-                    )
-                    self.powerups.append(powerup)
-                    print(f"Spawned {powerup_type} powerup at ({obj.x - 30}, {obj.y - 30})")
+        self.load_spawns(LEVEL_TILES, LEVEL1_SPAWNS)
                     
         print(f"Level 1 - Number of obstacles created: {len(self.obstacles)}")
-        print(f"Level 1 - Number of enemies spawned: {len(self.enemies)}")
+        print(f"Level 1 - Number of enemies spawned: {len(self.enemies)} (+{len(self.spawn_table)} deferred until in range)")
         print(f"Level 1 - Number of powerups spawned: {len(self.powerups)}")
         
     def initialize_game_objects(self):
@@ -441,24 +622,24 @@ class Level1(Game):
         self.player.enemies = self.enemies
     
     def update_powerups(self):
-        for powerup in self.powerups[:]:
-            if not powerup.collected:
-                powerup.update(self.player, dt=1.0, scroll_offset=self.ground_scroll)
-            else:
-                powerup.update(self.player, dt=1.0, scroll_offset=self.ground_scroll)
-                if not powerup.collection_particles:
-                    self.powerups.remove(powerup)
+        lo, hi = self.window_bounds(self.powerup_window, self.powerups)
+        for i in range(lo, hi):
+            self.powerups[i].update(self.player, dt=1.0, scroll_offset=self.ground_scroll)
+        # Collected powerups stay until their particles are gone
+        self.powerup_window.prune(lo, hi, _is_powerup_live)
     
     def draw_powerups(self):
-        for powerup in self.powerups:
-            powerup.draw(self.screen, self.ground_scroll)
+        lo, hi = self.window_bounds(self.powerup_window, self.powerups)
+        for i in range(lo, hi):
+            self.powerups[i].draw(self.screen, self.ground_scroll)
     
     def check_mushroom_collection(self):
         """Override to track mushroom count for Level 1"""
         if not self.player:
             return
         
-        for enemy in self.enemies[:]:
+        lo, hi = self.window_bounds(self.enemy_window, self.enemies)
+        for enemy in self.enemies[lo:hi]:
             if hasattr(enemy, 'is_collectible') and enemy.is_collectible:
                 if enemy.check_player_collision(self.player, self.ground_scroll):
                     enemy.collect()
@@ -470,15 +651,7 @@ class Level1(Game):
     
     def draw_mushroom_count(self):
         """Draw mushroom counter with requirement indicator for Level 1"""
-        # Load mushroom sprite icon
-        try:
-            mushroom_icon = pygame.image.load("assets/mushroom.png").convert_alpha()
-            mushroom_icon = pygame.transform.scale(mushroom_icon, (40, 40))
-        except Exception as e:
-            print(f"Error loading mushroom icon: {e}")
-            # Fallback: create a simple surface
-            mushroom_icon = pygame.Surface((40, 40), pygame.SRCALPHA)
-            pygame.draw.circle(mushroom_icon, (220, 80, 80), (20, 20), 18)
+        mushroom_icon = self.counter_icon
         
         # Position in top-right corner
         icon_x = self.WIDTH - 150
@@ -486,56 +659,44 @@ class Level1(Game):
         self.screen.blit(mushroom_icon, (icon_x, icon_y))
         
         # Draw count
-        try:
-            font = pygame.font.Font("assets/yoster.ttf", 36)
-        except:
-            font = pygame.font.Font(None, 48)
+        font = fonts.get(fonts.DEFAULT_FONT, 36, fallback_size=48)
         count_text = f"x {self.mushroom_count}"
-        text_surf = font.render(count_text, True, (255, 255, 255))
+        text_surf = fonts.render(font, count_text, (255, 255, 255))
         text_rect = text_surf.get_rect(left=icon_x + 40, centery=icon_y + 16)
         
         # Draw text with shadow for readability
-        shadow_surf = font.render(count_text, True, (0, 0, 0))
+        shadow_surf = fonts.render(font, count_text, (0, 0, 0))
         shadow_rect = text_surf.get_rect(left=icon_x + 42, centery=icon_y + 18)
         self.screen.blit(shadow_surf, shadow_rect)
         self.screen.blit(text_surf, text_rect)
         
         # Draw requirement indicator if needed
         if self.mushroom_count < self.min_mushrooms:
-            try:
-                small_font = pygame.font.Font("assets/yoster.ttf", 14)
-            except:
-                small_font = pygame.font.Font(None, 16)
+            small_font = fonts.get(fonts.DEFAULT_FONT, 14, fallback_size=16)
             req_text = f"Need {self.min_mushrooms} to finish"
-            req_surf = small_font.render(req_text, True, (255, 200, 100))
+            req_surf = fonts.render(small_font, req_text, (255, 200, 100))
             req_rect = req_surf.get_rect(left=icon_x, top=icon_y + 40)
             self.screen.blit(req_surf, req_rect)
         else:
             # Player has enough mushrooms - show "READY!"
-            try:
-                small_font = pygame.font.Font("assets/yoster.ttf", 18)
-            except:
-                small_font = pygame.font.Font(None, 20)
+            small_font = fonts.get(fonts.DEFAULT_FONT, 18, fallback_size=20)
             ready_text = "READY!"
-            ready_surf = small_font.render(ready_text, True, (100, 255, 100))
+            ready_surf = fonts.render(small_font, ready_text, (100, 255, 100))
             ready_rect = ready_surf.get_rect(left=icon_x, top=icon_y + 40)
             self.screen.blit(ready_surf, ready_rect)
         
         # Draw warning message if player tried to finish without enough mushrooms
         if self.level_gate_message_timer > 0:
             self.level_gate_message_timer -= 1
-            try:
-                warning_font = pygame.font.Font("assets/yoster.ttf", 32)
-            except:
-                warning_font = pygame.font.Font(None, 36)
+            warning_font = fonts.get(fonts.DEFAULT_FONT, 32, fallback_size=36)
             warning_text = f"Need {self.min_mushrooms} mushrooms to finish!"
-            warning_surf = warning_font.render(warning_text, True, (255, 100, 100))
+            warning_surf = fonts.render(warning_font, warning_text, (255, 100, 100))
             warning_rect = warning_surf.get_rect(center=(self.WIDTH // 2, 100))
             
             # Draw with pulsing effect
             pulse = abs(int(self.level_gate_message_timer % 30 - 15)) + 10
             for i in range(3):
-                glow_surf = warning_font.render(warning_text, True, (255, 50, 50, pulse * (3 - i)))
+                glow_surf = fonts.render(warning_font, warning_text, (255, 50, 50, pulse * (3 - i)))
                 glow_rect = warning_surf.get_rect(center=(self.WIDTH // 2 + i, 100 + i))
                 self.screen.blit(glow_surf, glow_rect)
             
@@ -564,12 +725,15 @@ class Level1(Game):
 
 
 class Level2(Game):
-    def __init__(self, width=960, height=640):
+    def __init__(self, width=960, height=640, tilemap_file="DungeonMapActual.tmx"):
        super().__init__(width, height)
 
        #--- Assets loading ---
+       self.prefetch_assets('assets/BGL2', 5, tilemap_file,
+                            manifests=(SKELETON_ANIM, MUSHROOM_ANIM, FLYING_EYE_ANIM),
+                            files=(SAW_TRAP_SHEET, LightningTrap.SPRITESHEET, FireTrap.SPRITESHEET))
        self.load_background('assets/BGL2', 5)
-       self.load_tilemap("DungeonMapActual.tmx")
+       self.load_tilemap(tilemap_file)  # Benchmarks pass generated stress maps (stress_map.py)
        self.load_ui_assets()
        self.animated_traps = []
        self.powerups = []  # Level 2 powerups
@@ -579,138 +743,21 @@ class Level2(Game):
        self.boss_gate_message_timer = 0  # Timer for showing message
        
        # Load mushroom sprites for powerups
-       self.mushroom_sprites = load_mushroom_sprites()
+       with load_profile.step("mushroom_sprites"):
+           self.mushroom_sprites = load_mushroom_sprites()
        print(f"✅ Loaded {len(self.mushroom_sprites)} mushroom powerup sprites")
 
-       self.process_tilemap()
-       self.initialize_game_objects()
+       with load_profile.step("process_tilemap"):
+           self.process_tilemap()
+       with load_profile.step("initialize_game_objects"):
+           self.initialize_game_objects()
+       load_profile.finish(self)
 
     def process_tilemap(self):
-        TILE_SIZE = 32
-        self.obstacles = []
-        self.enemies = []
-        self.start_position = (0, 100)
-        
-        objectLayer = self.tmx_data.get_layer_by_name("Object Layer 1")
-        tile_layer = self.tmx_data.get_layer_by_name("Tile Layer 1")
-        if isinstance(tile_layer, pytmx.TiledTileLayer):
-            for x, y, gid in tile_layer.iter_data():
-
-                if not gid:
-                    continue
-
-                props = self.tmx_data.get_tile_properties_by_gid(gid) or {}
-                typ = props.get("type")
-                
-                # Handle different obstacle types
-                if typ == "tombstone":
-                    self.obstacles.append(Spikes(x * TILE_SIZE, y * TILE_SIZE))
-                elif typ == "ice":
-                    self.obstacles.append(Ice(x * TILE_SIZE, y * TILE_SIZE))
-                else:
-                    # Default block
-                    self.obstacles.append(block(x * TILE_SIZE, y * TILE_SIZE))
-        
-        
-        if isinstance(objectLayer, pytmx.TiledObjectGroup):
-            for obj in objectLayer:
-                typ = getattr(obj, "type", None) or (obj.properties or {}).get("type")
-                
-                if typ == "end":
-                    self.obstacles.append(end(obj.x, obj.y))
-                elif typ == "start":
-                    self.obstacles.append(start(obj.x, obj.y))
-                    self.start_position = (obj.x , obj.y - 70)
-                    continue
-                
-                # === LEVEL 2 ENEMY SPAWNING ===
-                elif typ == "skeleton":
-                    # Spawn at ground level - obj.y is bottom of object in Tiled
-                    enemy = Skeleton(obj.x, obj.y - 96)  # Adjusted for 128px sprite + centering
-                    enemy.level = self
-                    self.enemies.append(enemy)
-                    print(f"Spawned Skeleton at ({obj.x}, {obj.y - 96})")
-                    continue
-                
-                elif typ == "mushroom_enemy":
-                    # Spawn at ground level
-                    enemy = MutatedMushroom(obj.x, obj.y - 96)  # Adjusted for 128px sprite + centering
-                    enemy.level = self
-                    self.enemies.append(enemy)
-                    print(f"Spawned Mutated Mushroom at ({obj.x}, {obj.y - 96})")
-                    continue
-                
-                elif typ == "flyingeye":
-                    # Flying enemy - spawn in air
-                    enemy = FlyingEye(obj.x, obj.y - 64)  # Different offset for flying
-                    enemy.level = self
-                    self.enemies.append(enemy)
-                    print(f"Spawned Flying Eye at ({obj.x}, {obj.y - 64})")
-                    continue
-                
-                # === TRAPS ===
-                elif typ == "sawtrap":
-                    anchor_x = obj.x + obj.width / 2
-                    anchor_y = obj.y 
-                    trap = AnimatedTrap(anchor_x, anchor_y, 'assets/Level2/Traps/SawTrap.png', 64, 32)
-                    trap.level = self
-                    self.animated_traps.append(trap)
-                    continue
-                
-                elif typ == "lightningtrap":
-                    anchor_x = obj.x + obj.width / 2
-                    anchor_y = obj.y
-                    trap = LightningTrap(anchor_x, anchor_y, damage=1, cooldown=2000)
-                    trap.level = self
-                    self.animated_traps.append(trap)
-                    continue
-                
-                elif typ == "firetrap":
-                    anchor_x = obj.x + obj.width / 2
-                    anchor_y = obj.y
-                    trap = FireTrap(anchor_x, anchor_y, damage=1, cooldown=3000)
-                    trap.level = self
-                    self.animated_traps.append(trap)
-                    continue
-                
-                # === COLLECTIBLES ===
-                elif typ == "mushroom4":
-                    # Get the mushroom image directly from the tile object's gid
-                    # (since it's placed as a tile from the sprite sheet in Tiled)
-                    mushroom_image = self.tmx_data.get_tile_image_by_gid(obj.gid)
-                    
-                    if mushroom_image:
-                        mushroom_image = pygame.transform.scale(mushroom_image, (32, 32))
-                        mushroom = MushroomPickup(obj.x, obj.y, mushroom_image)
-                        self.enemies.append(mushroom)
-                    else:
-                        print(f"Warning: Could not load mushroom image for object at ({obj.x}, {obj.y})")
-                    continue
-                
-                # === LEVEL 2 POWERUPS ===
-                elif typ in TILED_OBJECT_TO_POWERUP:
-                    # Map Tiled object name to powerup type
-                    powerup_type = TILED_OBJECT_TO_POWERUP[typ]
-                    # Center the 60x60 collision box on the Tiled object position
-                    # Subtract 30 (half of 60) to center it
-                    powerup = create_level2_powerup_with_sprite(
-                        obj.x - 30, obj.y - 30, powerup_type, self.mushroom_sprites
-                    )
-                    self.powerups.append(powerup)
-                    print(f"Spawned {powerup_type} powerup at ({obj.x - 30}, {obj.y - 30})")
-                    continue
-
-                # ===BOSS FIGHT DIFFICULTIES===
-                elif typ == "EasyEnd":
-                    self.obstacles.append(EndWithDifficulty(obj.x, obj.y, "easy"))
-                    print(f"Found EasyEnd object at ({obj.x}, {obj.y})")
-                elif typ == "HardEnd":
-                    self.obstacles.append(EndWithDifficulty(obj.x, obj.y, "hard"))
-                    print(f"Found HardEnd object at ({obj.x}, {obj.y})")
+        self.load_spawns(LEVEL_TILES, LEVEL2_SPAWNS)
         
         print(f"Level 2 - Number of obstacles created: {len(self.obstacles)}")
-        print(f"Level 2 - Number of enemies spawned: {len(self.enemies)}")
-        print(f"Level 2 - Number of traps spawned: {len(self.animated_traps)}")
+        print(f"Level 2 - Number of enemies and traps deferred until in range: {len(self.spawn_table)}")
         print(f"Level 2 - Number of powerups spawned: {len(self.powerups)}")
         print(f"Level 2 - Final boss difficulty: {self.boss_difficulty}")
         
@@ -729,37 +776,28 @@ class Level2(Game):
             print("Warning: No start position found in tilemap. Defaulting to (100, 100).")
 
     def update_powerups(self):
-        """Update all Level 2 powerups"""
-        for powerup in self.powerups[:]:
-            if not powerup.collected:
-                was_collected = powerup.collected
-                powerup.update(self.player, dt=1.0, scroll_offset=self.ground_scroll)
-                # Check if powerup was just collected
-                if not was_collected and powerup.collected:
-                    self.mushroom_count += 1
-                    print(f"Mushroom collected! Total: {self.mushroom_count}/{self.min_mushrooms_for_boss}")
-            else:
-                # Keep updating until particles are gone
-                powerup.update(self.player, dt=1.0, scroll_offset=self.ground_scroll)
-                if not powerup.collection_particles:
-                    self.powerups.remove(powerup)
+        """Update the Level 2 powerups inside the activation window"""
+        lo, hi = self.window_bounds(self.powerup_window, self.powerups)
+        for i in range(lo, hi):
+            powerup = self.powerups[i]
+            was_collected = powerup.collected
+            powerup.update(self.player, dt=1.0, scroll_offset=self.ground_scroll)
+            # Check if powerup was just collected
+            if not was_collected and powerup.collected:
+                self.mushroom_count += 1
+                print(f"Mushroom collected! Total: {self.mushroom_count}/{self.min_mushrooms_for_boss}")
+        # Keep collected powerups until their particles are gone
+        self.powerup_window.prune(lo, hi, _is_powerup_live)
     
     def draw_powerups(self):
-        """Draw all Level 2 powerups with scroll offset"""
-        for powerup in self.powerups:
-            powerup.draw(self.screen, self.ground_scroll)
+        """Draw the Level 2 powerups near the view with scroll offset"""
+        lo, hi = self.window_bounds(self.powerup_window, self.powerups)
+        for i in range(lo, hi):
+            self.powerups[i].draw(self.screen, self.ground_scroll)
     
     def draw_mushroom_count(self):
         """Draw mushroom counter on the right side of screen"""
-        # Load mushroom sprite icon
-        try:
-            mushroom_icon = pygame.image.load("assets/mushroom.png").convert_alpha()
-            mushroom_icon = pygame.transform.scale(mushroom_icon, (40, 40))
-        except Exception as e:
-            print(f"Error loading mushroom icon: {e}")
-            # Fallback: create a simple surface
-            mushroom_icon = pygame.Surface((40, 40), pygame.SRCALPHA)
-            pygame.draw.circle(mushroom_icon, (220, 80, 80), (20, 20), 18)
+        mushroom_icon = self.counter_icon
         
         # Position on right side of screen
         icon_x = self.WIDTH - 180  # More space for text
@@ -769,56 +807,44 @@ class Level2(Game):
         self.screen.blit(mushroom_icon, (icon_x, icon_y))
         
         # Draw count text with pixel font
-        try:
-            font = pygame.font.Font("assets/yoster.ttf", 36)
-        except:
-            font = pygame.font.Font(None, 48)
+        font = fonts.get(fonts.DEFAULT_FONT, 36, fallback_size=48)
         count_text = f"x {self.mushroom_count}"
-        text_surf = font.render(count_text, True, (255, 255, 255))
+        text_surf = fonts.render(font, count_text, (255, 255, 255))
         text_rect = text_surf.get_rect(left=icon_x + 40, centery=icon_y + 16)
         
         # Draw text with shadow for readability
-        shadow_surf = font.render(count_text, True, (0, 0, 0))
+        shadow_surf = fonts.render(font, count_text, (0, 0, 0))
         shadow_rect = text_surf.get_rect(left=icon_x + 42, centery=icon_y + 18)
         self.screen.blit(shadow_surf, shadow_rect)
         self.screen.blit(text_surf, text_rect)
         
         # Draw requirement indicator if needed
         if self.mushroom_count < self.min_mushrooms_for_boss:
-            try:
-                small_font = pygame.font.Font("assets/yoster.ttf", 14)
-            except:
-                small_font = pygame.font.Font(None, 16)
+            small_font = fonts.get(fonts.DEFAULT_FONT, 14, fallback_size=16)
             req_text = f"Need {self.min_mushrooms_for_boss} for boss"
-            req_surf = small_font.render(req_text, True, (255, 200, 100))
+            req_surf = fonts.render(small_font, req_text, (255, 200, 100))
             req_rect = req_surf.get_rect(left=icon_x, top=icon_y + 40)
             self.screen.blit(req_surf, req_rect)
         else:
             # Player has enough mushrooms - show "READY!"
-            try:
-                small_font = pygame.font.Font("assets/yoster.ttf", 18)
-            except:
-                small_font = pygame.font.Font(None, 20)
+            small_font = fonts.get(fonts.DEFAULT_FONT, 18, fallback_size=20)
             ready_text = "BOSS READY!"
-            ready_surf = small_font.render(ready_text, True, (100, 255, 100))
+            ready_surf = fonts.render(small_font, ready_text, (100, 255, 100))
             ready_rect = ready_surf.get_rect(left=icon_x, top=icon_y + 40)
             self.screen.blit(ready_surf, ready_rect)
         
         # Draw warning message if player tried to enter boss without enough mushrooms
         if self.boss_gate_message_timer > 0:
             self.boss_gate_message_timer -= 1
-            try:
-                warning_font = pygame.font.Font("assets/yoster.ttf", 32)
-            except:
-                warning_font = pygame.font.Font(None, 36)
+            warning_font = fonts.get(fonts.DEFAULT_FONT, 32, fallback_size=36)
             warning_text = f"Need {self.min_mushrooms_for_boss} mushrooms to fight boss!"
-            warning_surf = warning_font.render(warning_text, True, (255, 100, 100))
+            warning_surf = fonts.render(warning_font, warning_text, (255, 100, 100))
             warning_rect = warning_surf.get_rect(center=(self.WIDTH // 2, 100))
             
             # Draw with pulsing effect
             pulse = abs(int(self.boss_gate_message_timer % 30 - 15)) + 10
             for i in range(3):
-                glow_surf = warning_font.render(warning_text, True, (255, 50, 50, pulse * (3 - i)))
+                glow_surf = fonts.render(warning_font, warning_text, (255, 50, 50, pulse * (3 - i)))
                 glow_rect = warning_surf.get_rect(center=(self.WIDTH // 2 + i, 100 + i))
                 self.screen.blit(glow_surf, glow_rect)
             
@@ -827,9 +853,16 @@ class Level2(Game):
     def run(self, screen):
         self.screen = screen
         self.reset_game()
+        gc_policy.enter_gameplay()
+        memory_report.level_start(self)
+        hitch_watch.level_start(self)
+        load_profile.level_start(self)
+        sampling_profiler.set_scene(type(self).__name__)
         
         running = True
         while running:
+            perf_counters.set_enabled(self.debug_mode)  # Debug toggles (B) take effect here, between frames
+            self.screen = perf_counters.target(screen)
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.quit()
@@ -840,37 +873,31 @@ class Level2(Game):
                     if event.key == pygame.K_ESCAPE or event.key == pygame.K_p:
                         from menus import pause_menu
                         game_surface = self.screen.copy()
+                        gc_policy.collect_now()
                         pause_action = pause_menu(self.WIDTH, self.HEIGHT, self.screen, game_surface)
+                        hitch_watch.skip_frame()
                         
                         if pause_action == 'restart':
                             self.reset_game()
+                            gc_policy.enter_gameplay()
                         elif pause_action == 'main_menu':
                             return "start"
                         elif pause_action == 'quit':
                             pygame.quit()
                             exit()
                     
+            hitch_watch.mark("events")
             self.screen.fill((0, 0, 0))
             self.draw_bg()
             
             self.update_obstacles()
             self.draw_tilemap()
+            hitch_watch.mark("world")
             self.update_particles()
             self.update_enemies()
+            hitch_watch.mark("enemies")
             
-            # MEMORY LEAK FIX: More efficient arrow cleanup
-            active_arrows = []
-            for arrow in self.arrows:
-                if not arrow.alive:
-                    continue
-
-                arrow.update(self.obstacles)
-                arrow.collide(self.player, scroll_offset=self.ground_scroll)
-
-                if arrow.alive:
-                    active_arrows.append(arrow)
-
-            self.arrows = active_arrows
+            self.update_arrows()
 
             for arrow in self.arrows:
                 arrow.draw(self.screen, scroll_offset=self.ground_scroll)
@@ -883,24 +910,23 @@ class Level2(Game):
             self.draw_powerups()
             
             self.draw_debug_info()
+            hitch_watch.mark("arrows_pickups")
 
             keys = pygame.key.get_pressed()
             self.handle_input(keys)
             
-            # For damage with animated traps - with culling optimization
+            # For damage with animated traps - only the ones in the activation window
             if self.player:
-                screen_left = self.ground_scroll - 100
-                screen_right = self.ground_scroll + self.WIDTH + 100
-                
-                for trap in self.animated_traps:
-                    # Only update traps that are near the screen
-                    if trap.rect.right >= screen_left and trap.rect.left <= screen_right:
-                        trap.update(self.player, scroll_offset=self.ground_scroll)
-                        self.screen.blit(trap.image, (trap.rect.x - self.ground_scroll, trap.rect.y))
+                lo, hi = self.window_bounds(self.trap_window, self.animated_traps)
+                for trap in self.animated_traps[lo:hi]:
+                    trap.update(self.player, scroll_offset=self.ground_scroll)
+                    self.screen.blit(trap.image, (trap.rect.x - self.ground_scroll, trap.rect.y))
+            hitch_watch.mark("traps")
 
             if self.player:
                 self.player.update(keys, self.obstacles, self.enemies)
                 self.player.draw(self.screen)
+            hitch_watch.mark("player")
             
             self.handle_scrolling()
             
@@ -911,9 +937,15 @@ class Level2(Game):
             game_state = self.check_win_lose_conditions()
             if game_state != "playing":
                 return game_state
+            hitch_watch.mark("hud")
             
             pygame.display.flip()
+            hitch_watch.mark("flip")
             self.clock.tick(60)
+            gc_policy.end_frame()
+            memory_report.tick(self)
+            hitch_watch.end_frame(self)
+            perf_counters.end_frame()
             
         return "menu"
     
@@ -954,6 +986,9 @@ class FinalBossLevel(Game):
     
     def __init__(self, width=960, height=640, difficulty="normal"):
         super().__init__(width, height)
+        self.prefetch_assets('assets/BossBGL', 7, "FinalBossMap.tmx", manifests=(MUSHROOM_ANIM,),
+                             files=asset_loader.folder_images(BOSS_ASSETS_PATH) +
+                                   [SAW_TRAP_SHEET, LightningTrap.SPRITESHEET, FireTrap.SPRITESHEET])
         self.difficulty = difficulty
         self.boss = None
         self.boss_defeated = False
@@ -978,136 +1013,35 @@ class FinalBossLevel(Game):
         
         # Load Level 2 powerups
         from level2_powerup_loader import load_mushroom_sprites
-        self.mushroom_sprites = load_mushroom_sprites()
+        with load_profile.step("mushroom_sprites"):
+            self.mushroom_sprites = load_mushroom_sprites()
         print(f'Boss Level - Loaded {len(self.mushroom_sprites)} mushroom powerup sprites')
 
         # Load boss level assets
         self.load_background('assets/BossBGL', 7)
         self.load_tilemap("FinalBossMap.tmx")
         self.load_ui_assets()
-        self.process_tilemap()
-        self.initialize_game_objects()
+        with load_profile.step("process_tilemap"):
+            self.process_tilemap()
+        with load_profile.step("initialize_game_objects"):
+            self.initialize_game_objects()
+        load_profile.finish(self)
         
         print(f"Final Boss Level initialized with difficulty: {self.difficulty}")
         
     def process_tilemap(self):
         """Process tilemap to spawn boss, Level 2 mushrooms and traps"""
-        TILE_SIZE = 32
-        self.obstacles = []
-        self.enemies = []
-        self.start_position = (0, 100)
-        
-        # Process tile layer for solid blocks
-        tile_layer = self.tmx_data.get_layer_by_name("Tile Layer 1")
-        if isinstance(tile_layer, pytmx.TiledTileLayer):
-            for x, y, gid in tile_layer.iter_data():
-                if not gid:
-                        continue
-                        
-                props = self.tmx_data.get_tile_properties_by_gid(gid) or {}
-                typ = props.get("type")
-                
-                # Create solid blocks
-                self.obstacles.append(block(x * TILE_SIZE, y * TILE_SIZE))
-        
-        # Process object layer for entities
-        objectLayer = self.tmx_data.get_layer_by_name("Object Layer 1")
-        if isinstance(objectLayer, pytmx.TiledObjectGroup):
-            for obj in objectLayer:
-                typ = getattr(obj, "type", None) or (obj.properties or {}).get("type")
-                
-                # === LEVEL MARKERS ===
-                if typ == "end":
-                    self.obstacles.append(end(obj.x, obj.y))
-                elif typ == "start":
-                    self.obstacles.append(start(obj.x, obj.y))
-                    self.start_position = (obj.x, obj.y - 70)
-                    continue
-                
-                # === BOSS SPAWNING ===
-                elif typ == "final_boss" or typ == "boss_spawn":
-                    if self.difficulty == "easy":
-                        self.boss = EasyDungeonBoss(obj.x, obj.y - 128)
-                    elif self.difficulty == "hard":
-                        self.boss = HardDungeonBoss(obj.x, obj.y - 128)
-                    else:  # normal difficulty defaults to easy
-                        self.boss = EasyDungeonBoss(obj.x, obj.y - 128)
-                    
-                    self.boss.level = self
-                    self.enemies.append(self.boss)
-                    print(f"Spawned {self.difficulty.upper()} Boss at ({obj.x}, {obj.y - 128})")
-                    continue
-                
-                # === LEVEL 2 MUSHROOM MINIONS ===
-                elif typ == "mushroom_enemy" or typ == "mushroom_minion":
-                    from Level2Enemies import MutatedMushroom
-                    enemy = MutatedMushroom(obj.x, obj.y - 96)
-                    enemy.level = self
-                    enemy.max_hp = 50  # Reduced HP for boss level
-                    enemy.current_hp = 50
-                    self.enemies.append(enemy)
-                    print(f"Spawned Mushroom Minion at ({obj.x}, {obj.y - 96})")
-                    continue
-                
-                # === COLLECTIBLE MUSHROOMS ===
-                elif typ == "mushroom4":
-                    mushroom_image = self.tmx_data.get_tile_image_by_gid(obj.gid)
-                    
-                    if mushroom_image:
-                        mushroom_image = pygame.transform.scale(mushroom_image, (32, 32))
-                        mushroom = MushroomPickup(obj.x, obj.y, mushroom_image)
-                        self.enemies.append(mushroom)
-                        print(f"Spawned collectible mushroom at ({obj.x}, {obj.y})")
-                    else:
-                        print(f"Warning: Could not load mushroom image for object at ({obj.x}, {obj.y})")
-                    continue
-
-                # === LEVEL 2 POWERUPS ===
-                elif typ in TILED_OBJECT_TO_POWERUP:
-                    powerup_type = TILED_OBJECT_TO_POWERUP[typ]
-                    powerup = create_level2_powerup_with_sprite(
-                        obj.x - 30, obj.y - 30, powerup_type, self.mushroom_sprites
-                    )
-                    self.powerups.append(powerup)
-                    print(f"Spawned {powerup_type} powerup at ({obj.x - 30}, {obj.y - 30})")
-                    continue
-                
-                # === LEVEL 2 TRAPS ===
-                elif typ == "firetrap":
-                    anchor_x = obj.x + obj.width / 2
-                    anchor_y = obj.y
-                    trap = FireTrap(anchor_x, anchor_y, damage=2, cooldown=2000)  # Increased damage for boss level
-                    trap.level = self
-                    self.animated_traps.append(trap)
-                    print(f"Spawned Fire Trap at ({anchor_x}, {anchor_y})")
-                    continue
-                
-                elif typ == "lightningtrap":
-                    anchor_x = obj.x + obj.width / 2
-                    anchor_y = obj.y
-                    trap = LightningTrap(anchor_x, anchor_y, damage=2, cooldown=1500)  # Increased damage
-                    trap.level = self
-                    self.animated_traps.append(trap)
-                    print(f"Spawned Lightning Trap at ({anchor_x}, {anchor_y})")
-                    continue
-                
-                elif typ == "sawtrap":
-                    anchor_x = obj.x + obj.width / 2
-                    anchor_y = obj.y
-                    trap = AnimatedTrap(anchor_x, anchor_y, 'assets/Level2/Traps/SawTrap.png', 64, 32)
-                    trap.level = self
-                    self.animated_traps.append(trap)
-                    print(f"Spawned Saw Trap at ({anchor_x}, {anchor_y})")
-                    continue
+        self.load_spawns(BOSS_TILES, BOSS_SPAWNS)
                 
         # If no boss was spawned from tilemap, create one manually
         if not self.boss:
-            if self.difficulty == "easy":
-                self.boss = EasyDungeonBoss(400, 300)  # Center of screen
-            elif self.difficulty == "hard":
-                self.boss = HardDungeonBoss(400, 300)
-            else:  # normal difficulty defaults to easy
-                self.boss = EasyDungeonBoss(400, 300)
+            with load_profile.step("boss"):
+                if self.difficulty == "easy":
+                    self.boss = EasyDungeonBoss(400, 300)  # Center of screen
+                elif self.difficulty == "hard":
+                    self.boss = HardDungeonBoss(400, 300)
+                else:  # normal difficulty defaults to easy
+                    self.boss = EasyDungeonBoss(400, 300)
             
             self.boss.level = self
             self.enemies.append(self.boss)
@@ -1115,7 +1049,7 @@ class FinalBossLevel(Game):
         
         print(f"Boss Level - Obstacles: {len(self.obstacles)}")
         print(f"Boss Level - Enemies: {len(self.enemies)} (Boss: {'Yes' if self.boss else 'No'})")
-        print(f"Boss Level - Traps: {len(self.animated_traps)}")
+        print(f"Boss Level - Minions, traps and pickups deferred until in range: {len(self.spawn_table)}")
         print(f"Boss Level - Powerups: {len(self.powerups)}")
         self.build_spatial_hash()
                             
@@ -1157,8 +1091,9 @@ class FinalBossLevel(Game):
         keys = pygame.key.get_pressed()
         self.player.update(keys, self.obstacles, self.enemies)
         
-        # Update enemies (including boss) using proper method
-        for enemy in self.enemies[:]:  # Copy list to avoid modification issues
+        # Update enemies (including boss) inside the activation window
+        lo, hi = self.window_bounds(self.enemy_window, self.enemies)
+        for enemy in self.enemies[lo:hi]:  # Copy the slice to avoid modification issues
             if enemy.alive:
                 # Check if it's a boss enemy (from BossEnemy.py)
                 if hasattr(enemy, 'projectiles') and hasattr(enemy, 'difficulty'):
@@ -1177,35 +1112,34 @@ class FinalBossLevel(Game):
                     self.boss_defeated = True
                     self.level_complete = True
                     print(f"🏆 BOSS DEFEATED! Victory!")
-                self.enemies.remove(enemy)
+        if perf_counters.enabled:
+            perf_counters.add("entities_updated", hi - lo)
+            perf_counters.add("entities_culled", len(self.enemies) - (hi - lo))
+        hi = self.enemy_window.prune(lo, hi, _is_alive)
+        self.enemy_window.refresh(lo, hi)
         
         # Handle boss summoning minions (hard mode)
         if self.boss and hasattr(self.boss, 'summon_event') and self.boss.summon_event:
             self.spawn_boss_minions(self.boss.summon_event)
             self.boss.summon_event = None
         
-        # Update traps - with culling optimization
-        screen_left = self.ground_scroll - 100
-        screen_right = self.ground_scroll + self.WIDTH + 100
-        for trap in self.animated_traps:
-            # Only update traps that are near the screen
-            if trap.rect.right >= screen_left and trap.rect.left <= screen_right:
-                trap.update(self.player, scroll_offset=self.ground_scroll)
+        # Update traps - only the ones in the activation window
+        lo, hi = self.window_bounds(self.trap_window, self.animated_traps)
+        for trap in self.animated_traps[lo:hi]:
+            trap.update(self.player, scroll_offset=self.ground_scroll)
         
         # Update powerups
-        for powerup in self.powerups[:]:
-            if not powerup.collected:
-                was_collected = powerup.collected
-                powerup.update(self.player, dt=dt, scroll_offset=self.ground_scroll)
-                # Check if powerup was just collected
-                if not was_collected and powerup.collected:
-                    self.mushroom_count += 1
-                    print(f"Mushroom collected! Total: {self.mushroom_count}/{self.min_mushrooms_for_boss}")
-            else:
-                # Keep updating until particles are gone
-                powerup.update(self.player, dt=dt, scroll_offset=self.ground_scroll)
-                if not powerup.collection_particles:
-                    self.powerups.remove(powerup)
+        lo, hi = self.window_bounds(self.powerup_window, self.powerups)
+        for i in range(lo, hi):
+            powerup = self.powerups[i]
+            was_collected = powerup.collected
+            powerup.update(self.player, dt=dt, scroll_offset=self.ground_scroll)
+            # Check if powerup was just collected
+            if not was_collected and powerup.collected:
+                self.mushroom_count += 1
+                print(f"Mushroom collected! Total: {self.mushroom_count}/{self.min_mushrooms_for_boss}")
+        # Keep collected powerups until their particles are gone
+        self.powerup_window.prune(lo, hi, _is_powerup_live)
         
         # Handle scrolling
         self.handle_scrolling()
@@ -1247,15 +1181,18 @@ class FinalBossLevel(Game):
         self.draw_tilemap()
         
         # Draw traps
-        for trap in self.animated_traps:
+        lo, hi = self.window_bounds(self.trap_window, self.animated_traps)
+        for trap in self.animated_traps[lo:hi]:
             surface.blit(trap.image, (trap.rect.x - self.ground_scroll, trap.rect.y))
         
         # Draw powerups
-        for powerup in self.powerups:
+        lo, hi = self.window_bounds(self.powerup_window, self.powerups)
+        for powerup in self.powerups[lo:hi]:
             powerup.draw(surface, self.ground_scroll)
         
         # Draw enemies (boss will have special effects)
-        for enemy in self.enemies:
+        lo, hi = self.window_bounds(self.enemy_window, self.enemies)
+        for enemy in self.enemies[lo:hi]:
             enemy.draw(surface)
         
         # Draw player
@@ -1283,26 +1220,20 @@ class FinalBossLevel(Game):
             return
         
         # Boss name and difficulty - using pixelated font
-        try:
-            font = pygame.font.Font("assets/yoster.ttf", 32)
-        except:
-            font = pygame.font.Font(None, 36)
+        font = fonts.get(fonts.DEFAULT_FONT, 32, fallback_size=36)
         boss_name = f"FINAL BOSS - {self.difficulty.upper()} MODE"
-        text_surf = font.render(boss_name, True, (255, 215, 0))  # Gold color
+        text_surf = fonts.render(font, boss_name, (255, 215, 0))  # Gold color
         text_rect = text_surf.get_rect(center=(surface.get_width() // 2, 30))
         
         # Text shadow
-        shadow_surf = font.render(boss_name, True, (0, 0, 0))
+        shadow_surf = fonts.render(font, boss_name, (0, 0, 0))
         surface.blit(shadow_surf, (text_rect.x + 2, text_rect.y + 2))
         surface.blit(text_surf, text_rect)
         
         # Phase indicator
         if hasattr(self.boss, 'phase') and self.boss.phase == 2:
-            try:
-                phase_font = pygame.font.Font("assets/yoster.ttf", 24)
-            except:
-                phase_font = pygame.font.Font(None, 28)
-            phase_text = phase_font.render("PHASE 2 - ENRAGED", True, (255, 100, 100))
+            phase_font = fonts.get(fonts.DEFAULT_FONT, 24, fallback_size=28)
+            phase_text = fonts.render(phase_font, "PHASE 2 - ENRAGED", (255, 100, 100))
             phase_rect = phase_text.get_rect(center=(surface.get_width() // 2, 60))
             surface.blit(phase_text, phase_rect)
     
@@ -1317,27 +1248,21 @@ class FinalBossLevel(Game):
             surface.blit(victory_surf, victory_rect)
             
             # Victory text
-            try:
-                font = pygame.font.Font("assets/yoster.ttf", 48)
-            except:
-                font = pygame.font.Font(None, 48)
-            victory_text = font.render("VICTORY!", True, (255, 215, 0))
+            font = fonts.get(fonts.DEFAULT_FONT, 48)
+            victory_text = fonts.render(font, "VICTORY!", (255, 215, 0))
             text_rect = victory_text.get_rect(center=victory_rect.center)
             text_rect.y -= 30
             
             # Text glow effect
             for offset in [(2, 2), (-2, -2), (2, -2), (-2, 2)]:
-                glow_surf = font.render("VICTORY!", True, (255, 255, 100))
+                glow_surf = fonts.render(font, "VICTORY!", (255, 255, 100))
                 surface.blit(glow_surf, (text_rect.x + offset[0], text_rect.y + offset[1]))
             
             surface.blit(victory_text, text_rect)
             
             # Difficulty completed text
-            try:
-                diff_font = pygame.font.Font("assets/yoster.ttf", 28)
-            except:
-                diff_font = pygame.font.Font(None, 32)
-            diff_text = diff_font.render(f"{self.difficulty.upper()} MODE COMPLETED", True, (255, 255, 255))
+            diff_font = fonts.get(fonts.DEFAULT_FONT, 28, fallback_size=32)
+            diff_text = fonts.render(diff_font, f"{self.difficulty.upper()} MODE COMPLETED", (255, 255, 255))
             diff_rect = diff_text.get_rect(center=(victory_rect.centerx, victory_rect.centery + 20))
             surface.blit(diff_text, diff_rect)
         
@@ -1350,17 +1275,12 @@ class FinalBossLevel(Game):
         
         # Ending text (appears after fade is complete)
         if self.fade_complete and self.ending_text_alpha > 0:
-            try:
-                title_font = pygame.font.Font("assets/yoster.ttf", 48)
-                text_font = pygame.font.Font("assets/yoster.ttf", 24)
-            except:
-                title_font = pygame.font.Font(None, 52)
-                text_font = pygame.font.Font(None, 28)
+            title_font = fonts.get(fonts.DEFAULT_FONT, 48, fallback_size=52)
+            text_font = fonts.get(fonts.DEFAULT_FONT, 24, fallback_size=28)
             
             # Title
-            title_text = title_font.render("The End", True, (255, 215, 0))
+            title_text = fonts.render(title_font, "The End", (255, 215, 0), alpha=int(self.ending_text_alpha))
             title_rect = title_text.get_rect(center=(surface.get_width() // 2, 150))
-            title_text.set_alpha(int(self.ending_text_alpha))
             surface.blit(title_text, title_rect)
             
             # Ending remarks (placeholder)
@@ -1377,9 +1297,8 @@ class FinalBossLevel(Game):
             
             y_offset = 250
             for line in ending_lines:
-                text_surf = text_font.render(line, True, (255, 255, 255))
+                text_surf = fonts.render(text_font, line, (255, 255, 255), alpha=int(self.ending_text_alpha))
                 text_rect = text_surf.get_rect(center=(surface.get_width() // 2, y_offset))
-                text_surf.set_alpha(int(self.ending_text_alpha))
                 surface.blit(text_surf, text_rect)
                 y_offset += 35
     
@@ -1400,9 +1319,16 @@ class FinalBossLevel(Game):
         """Run the boss level game loop"""
         self.screen = screen
         self.reset_game()
+        gc_policy.enter_gameplay()
+        memory_report.level_start(self)
+        hitch_watch.level_start(self)
+        load_profile.level_start(self)
+        sampling_profiler.set_scene(type(self).__name__)
         
         running = True
         while running:
+            perf_counters.set_enabled(self.debug_mode)  # Debug toggles (B) take effect here, between frames
+            self.screen = perf_counters.target(screen)
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     return "quit"
@@ -1412,15 +1338,19 @@ class FinalBossLevel(Game):
                     if event.key == pygame.K_ESCAPE or event.key == pygame.K_p:
                         from menus import pause_menu
                         game_surface = self.screen.copy()
+                        gc_policy.collect_now()
                         pause_action = pause_menu(self.WIDTH, self.HEIGHT, self.screen, game_surface)
+                        hitch_watch.skip_frame()
                         
                         if pause_action == 'restart':
                             self.reset_game()
+                            gc_policy.enter_gameplay()
                         elif pause_action == 'main_menu':
                             return "start"
                         elif pause_action == 'quit':
                             return "quit"
             
+            hitch_watch.mark("events")
             # Clear screen and draw background
             self.screen.fill((0, 0, 0))
             self.draw_bg()
@@ -1428,12 +1358,15 @@ class FinalBossLevel(Game):
             # Update and draw obstacles and tilemap
             self.update_obstacles()
             self.draw_tilemap()
+            hitch_watch.mark("world")
             self.update_particles()
             self.update_enemies()
+            hitch_watch.mark("enemies")
             
             # Update boss level specific elements
             dt = 1.0
             result = self.update(dt)
+            hitch_watch.mark("boss")
             
             # Check for level completion or game over
             if result == "victory":
@@ -1448,19 +1381,20 @@ class FinalBossLevel(Game):
             elif win_lose_result == "victory":
                 return "victory"
             
-            # Draw traps and powerups - with culling
-            screen_left = self.ground_scroll - 100
-            screen_right = self.ground_scroll + self.WIDTH + 100
-            for trap in self.animated_traps:
-                if trap.rect.right >= screen_left and trap.rect.left <= screen_right:
-                    self.screen.blit(trap.image, (trap.rect.x - self.ground_scroll, trap.rect.y))
+            # Draw traps and powerups - only the activation window
+            lo, hi = self.window_bounds(self.trap_window, self.animated_traps)
+            for trap in self.animated_traps[lo:hi]:
+                self.screen.blit(trap.image, (trap.rect.x - self.ground_scroll, trap.rect.y))
             
-            for powerup in self.powerups:
+            lo, hi = self.window_bounds(self.powerup_window, self.powerups)
+            for powerup in self.powerups[lo:hi]:
                 powerup.draw(self.screen, self.ground_scroll)
+            hitch_watch.mark("traps_pickups")
             
             # Draw player
             if self.player:
                 self.player.draw(self.screen)
+            hitch_watch.mark("player")
             
             # Handle scrolling and UI
             self.handle_scrolling()
@@ -1475,23 +1409,21 @@ class FinalBossLevel(Game):
             # Draw victory message
             if self.level_complete:
                 self.draw_victory_message(self.screen)
+            hitch_watch.mark("hud")
             
             pygame.display.flip()
+            hitch_watch.mark("flip")
             self.clock.tick(60)
+            gc_policy.end_frame()
+            memory_report.tick(self)
+            hitch_watch.end_frame(self)
+            perf_counters.end_frame()
         
         return "menu"
     
     def draw_mushroom_count(self):
         """Draw mushroom counter on the right side of screen for boss level"""
-        # Load mushroom sprite icon
-        try:
-            mushroom_icon = pygame.image.load("assets/mushroom.png").convert_alpha()
-            mushroom_icon = pygame.transform.scale(mushroom_icon, (40, 40))
-        except Exception as e:
-            print(f"Error loading mushroom icon: {e}")
-            # Fallback: create a simple surface
-            mushroom_icon = pygame.Surface((40, 40), pygame.SRCALPHA)
-            pygame.draw.circle(mushroom_icon, (220, 80, 80), (20, 20), 18)
+        mushroom_icon = self.counter_icon
         
         # Position on right side of screen
         icon_x = self.WIDTH - 180  # More space for text
@@ -1501,16 +1433,13 @@ class FinalBossLevel(Game):
         self.screen.blit(mushroom_icon, (icon_x, icon_y))
         
         # Draw count text with pixel font
-        try:
-            font = pygame.font.Font("assets/yoster.ttf", 36)
-        except:
-            font = pygame.font.Font(None, 48)
+        font = fonts.get(fonts.DEFAULT_FONT, 36, fallback_size=48)
         count_text = f"x {self.mushroom_count}"
-        text_surf = font.render(count_text, True, (255, 255, 255))
+        text_surf = fonts.render(font, count_text, (255, 255, 255))
         text_rect = text_surf.get_rect(left=icon_x + 40, centery=icon_y + 16)
         
         # Draw text with shadow for readability
-        shadow_surf = font.render(count_text, True, (0, 0, 0))
+        shadow_surf = fonts.render(font, count_text, (0, 0, 0))
         shadow_rect = text_surf.get_rect(left=icon_x + 42, centery=icon_y + 18)
         self.screen.blit(shadow_surf, shadow_rect)
         self.screen.blit(text_surf, text_rect)
@@ -0,0 +1,132 @@
+"""
+Garbage collector policy: quiet during gameplay, thorough between scenes.
+
+CPython's automatic collector runs whenever enough objects have been
+allocated, wherever that happens to be - including a full (generation 2)
+pass through every sprite, tile and rect of the level halfway through a
+boss pattern, which showed up as 30-50 ms hitches.
+
+- enter_gameplay(): after a level has loaded, collect once, gc.freeze() what
+  survives (the level's long-lived data is then never traversed again) and
+  switch automatic collection off.
+- end_frame(): called once per gameplay frame; runs a young-generation
+  collection at the frame boundary when the allocation count says automatic
+  GC would have, and promotes to generation 1 the way CPython does. After
+  FULL_EVERY generation-1 collections (gc.get_count()[2]) it runs a full
+  one instead, so cyclic garbage that survived into generation 2 is freed
+  at least every FULL_EVERY * PROMOTE_EVERY * YOUNG_THRESHOLD (70,000)
+  net allocations. The level itself is frozen, so that pass only walks
+  what was allocated since enter_gameplay() and stays short.
+- collect_now(): a full collection while the game is showing something
+  static anyway - the pause menu.
+- transition(): menus, intros and level changes; unfreezes, turns automatic
+  collection back on and collects everything the previous scene left.
+
+Every collection is timed through gc.callbacks; pauses are kept in a
+bounded log, and frame_pause_ms() gives the GC time spent in the last frame
+for the debug overlay. Gameplay pauses over HITCH_MS are printed.
+"""
+
+import gc
+import time
+from collections import deque
+
+YOUNG_THRESHOLD = 700   # Allocations between young collections (CPython's default threshold0)
+PROMOTE_EVERY = 10      # Young collections per generation-1 collection (CPython's threshold1)
+FULL_EVERY = 10         # Generation-1 collections per full collection (CPython's threshold2)
+HITCH_MS = 8.0          # Gameplay GC pauses longer than this are reported
+MAX_LOG = 256           # Pauses kept in `pauses`
+
+GAMEPLAY, TRANSITION = "gameplay", "transition"
+
+phase = TRANSITION
+pauses = deque(maxlen=MAX_LOG)  # (phase, generation, ms, objects collected), oldest first
+max_pause_ms = 0.0
+
+_started = None
+_frame_ms = 0.0         # GC time since the last end_frame()
+_last_frame_ms = 0.0
+_frame_gens = []        # Generations collected since the last end_frame()
+_last_frame_gens = []
+_young_runs = 0
+
+
+def _on_gc(stage, info):
+    global _started, _frame_ms, max_pause_ms
+    if stage == "start":
+        _started = time.perf_counter()
+        return
+    if _started is None:
+        return
+    ms = (time.perf_counter() - _started) * 1000
+    _started = None
+    _frame_ms += ms
+    _frame_gens.append(info["generation"])
+    pauses.append((phase, info["generation"], ms, info["collected"]))
+    if phase == GAMEPLAY:
+        max_pause_ms = max(max_pause_ms, ms)
+        if ms > HITCH_MS:
+            print(f"⚠️ GC generation {info['generation']} took {ms:.1f} ms during gameplay")
+
+
+gc.callbacks.append(_on_gc)
+
+
+def enter_gameplay():
+    """The level is loaded: collect its load garbage, freeze the rest and stop automatic GC."""
+    global phase, _young_runs, max_pause_ms
+    gc.collect()
+    gc.freeze()
+    gc.disable()
+    phase = GAMEPLAY
+    _young_runs = 0
+    max_pause_ms = 0.0
+
+
+def end_frame():
+    """Run whatever young collection is due, at the frame boundary instead of mid-update."""
+    global _frame_ms, _last_frame_ms, _frame_gens, _last_frame_gens, _young_runs
+    if phase == GAMEPLAY and gc.get_count()[0] >= YOUNG_THRESHOLD:
+        _young_runs += 1
+        if _young_runs % PROMOTE_EVERY != 0:
+            gc.collect(0)
+        elif gc.get_count()[2] + 1 >= FULL_EVERY:
+            gc.collect(2)  # Bounds generation 2: see FULL_EVERY
+        else:
+            gc.collect(1)
+    _last_frame_ms = _frame_ms
+    _frame_ms = 0.0
+    _last_frame_gens, _frame_gens = _frame_gens, []
+
+
+def collect_now():
+    """Full collection of everything not frozen - for screens where a pause can't be seen."""
+    gc.collect()
+
+
+def transition():
+    """Leaving gameplay (menus, intros, scene changes): release the frozen level and collect it all."""
+    global phase
+    phase = TRANSITION
+    gc.unfreeze()
+    gc.enable()
+    gc.collect()
+
+
+def frame_pause_ms():
+    """GC time spent during the previous gameplay frame."""
+    return _last_frame_ms
+
+
+def frame_collections():
+    """Generations collected during the previous gameplay frame, in order."""
+    return list(_last_frame_gens)
+
+
+def stats():
+    return {
+        "phase": phase,
+        "frozen": gc.get_freeze_count(),
+        "max_gameplay_pause_ms": max_pause_ms,
+        "gameplay_collections": sum(1 for entry in pauses if entry[0] == GAMEPLAY),
+    }
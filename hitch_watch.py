@@ -0,0 +1,200 @@
+"""
+Frame hitch watchdog.
+
+Averages hide the stutters players notice: a boss switching patterns, a
+minion summon, a sound played for the first time. The level loops call
+mark(phase) after each stage of the frame and end_frame() once the frame is
+presented; any frame longer than BUDGET_MS (1.5x the 60 FPS target by
+default) is written to LOG_PATH as one JSON line with:
+- the time each phase took, and the phase that ran furthest over its own
+  running average ("overran"),
+- entity counts at that moment (enemies, arrows, boss projectiles, minions,
+  particles),
+- GC collections and time in the frame (from gc_policy),
+- every asset decoded during the frame (frame cache misses, sounds, images).
+
+The log is cut back to the latest MAX_RECORDS once it reaches twice that.
+Frames spent in the pause menu are skipped. `--hitch-budget MS` sets the
+budget; 0 turns the watchdog off.
+"""
+
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+import gc_policy
+
+BUDGET_MS = float(os.environ.get("SHROOMLIGHT_HITCH_BUDGET_MS", 1.5 * 1000 / 60))
+LOG_PATH = os.path.join(".cache", "hitches.log")
+MAX_RECORDS = 500
+AVERAGE_WEIGHT = 0.05   # How quickly a phase's running average follows its recent frames
+
+_enabled = BUDGET_MS > 0
+_NULL = nullcontext()
+
+_level_name = None      # Set while a level is running
+_frame = 0
+_frame_start = None
+_last_mark = None
+_phases = {}            # phase -> ms this frame
+_averages = {}          # phase -> running average ms
+_loads = []             # (kind, name, ms) decoded this frame
+_records = deque(maxlen=MAX_RECORDS)
+_written = 0            # Lines in LOG_PATH
+
+
+def configure(budget_ms=None, log_path=None):
+    global BUDGET_MS, LOG_PATH, _enabled, _level_name
+    if budget_ms is not None:
+        BUDGET_MS = budget_ms
+        _enabled = budget_ms > 0
+        if not _enabled:
+            _level_name = None  # Stop watching a level already running
+    if log_path is not None:
+        LOG_PATH = log_path
+
+
+def is_enabled():
+    return _enabled
+
+
+def level_start(level):
+    """Gameplay begins: the first frame is timed from here."""
+    global _level_name, _frame
+    if not _enabled:
+        return
+    _level_name = type(level).__name__
+    _frame = 0
+    _averages.clear()
+    skip_frame()
+
+
+def skip_frame():
+    """Don't judge the current frame (the pause menu was up); start timing afresh."""
+    global _frame_start, _last_mark
+    _frame_start = _last_mark = time.perf_counter()
+    _phases.clear()
+    _loads.clear()
+
+
+def mark(phase):
+    """The frame just finished `phase`; the time since the previous mark is charged to it."""
+    global _last_mark
+    if _level_name is None:
+        return
+    now = time.perf_counter()
+    _phases[phase] = _phases.get(phase, 0.0) + (now - _last_mark) * 1000
+    _last_mark = now
+
+
+def asset_load(kind, name, ms):
+    if _level_name is not None:
+        _loads.append((kind, name, round(ms, 2)))
+
+
+def loading(kind, name):
+    """Context manager reporting the asset decode inside it against the current frame."""
+    if _level_name is None:
+        return _NULL
+    return _timed_load(kind, name)
+
+
+@contextmanager
+def _timed_load(kind, name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        asset_load(kind, name, (time.perf_counter() - start) * 1000)
+
+
+def entity_counts(level):
+    """What the level was juggling: live entities and every *_particles list in play."""
+    enemies = getattr(level, "enemies", [])
+    counts = {"enemies": len(enemies), "arrows": len(getattr(level, "arrows", []))}
+    boss = getattr(level, "boss", None)
+    if boss is not None:
+        counts["boss_projectiles"] = len(getattr(boss, "projectiles", []))
+        counts["minions"] = len(getattr(level, "boss_summoned_minions", []))
+    player = getattr(level, "player", None)
+    if player is not None and hasattr(player, "projectile_manager"):
+        counts["player_projectiles"] = len(player.projectile_manager.projectiles)
+
+    particles = len(getattr(level, "leaf_particles", []))
+    for owner in [player, boss, *enemies]:
+        if owner is None:
+            continue
+        for name, value in vars(owner).items():
+            if name.endswith("_particles") and isinstance(value, list):
+                particles += len(value)
+    counts["particles"] = particles
+    return counts
+
+
+def end_frame(level):
+    """The frame is presented (and the clock ticked): log it if it blew the budget."""
+    global _frame
+    if _level_name is None:
+        return
+    now = time.perf_counter()
+    mark("clock_tick")
+    frame_ms = (now - _frame_start) * 1000
+    _frame += 1
+
+    if frame_ms > BUDGET_MS and _frame > 1:
+        # The phase furthest over what it usually takes, not just the biggest one
+        overran = max(_phases, key=lambda phase: _phases[phase] - _averages.get(phase, 0.0))
+        _log({
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "level": _level_name,
+            "frame": _frame,
+            "frame_ms": round(frame_ms, 2),
+            "budget_ms": round(BUDGET_MS, 2),
+            "overran": overran,
+            "phases": {phase: round(ms, 2) for phase, ms in _phases.items()},
+            "averages": {phase: round(ms, 2) for phase, ms in _averages.items()},
+            "counts": entity_counts(level),
+            "gc": {"ms": round(gc_policy.frame_pause_ms(), 2), "generations": gc_policy.frame_collections()},
+            "loads": list(_loads),
+        })
+
+    for phase, ms in _phases.items():
+        average = _averages.get(phase)
+        _averages[phase] = ms if average is None else average + (ms - average) * AVERAGE_WEIGHT
+    skip_frame()
+
+
+def level_end():
+    global _level_name
+    _level_name = None
+
+
+def _log(record):
+    """Append to the log, cutting it back to its own last MAX_RECORDS lines once it holds twice that."""
+    global _written
+    _records.append(record)
+    try:
+        os.makedirs(os.path.dirname(LOG_PATH) or ".", exist_ok=True)
+        if _written == 0 and os.path.exists(LOG_PATH):
+            with open(LOG_PATH) as f:
+                _written = sum(1 for _ in f)
+        with open(LOG_PATH, "a") as f:
+            f.write(json.dumps(record) + "\n")
+        _written += 1
+        if _written >= 2 * MAX_RECORDS:
+            # From the file, not _records: earlier sessions' hitches belong in the tail too
+            with open(LOG_PATH) as f:
+                tail = deque(f, maxlen=MAX_RECORDS)
+            with open(LOG_PATH + ".tmp", "w") as f:
+                f.writelines(tail)
+            os.replace(LOG_PATH + ".tmp", LOG_PATH)
+            _written = len(tail)
+    except OSError as e:
+        print(f"⚠️ Could not write hitch log: {e}")
+
+
+def records():
+    """Hitches recorded this session, oldest first."""
+    return list(_records)
@@ -4,9 +4,15 @@ Extracts mushroom sprites from the spritesheet and maps them to powerup types
 """
 
 import pygame
+import asset_loader
+import frame_cache
+import texture_atlas
 
 
-def load_mushroom_sprites(sprite_sheet_path="assets/Level2/mushroom level 2.png", 
+MUSHROOM_SHEET = "assets/Level2/mushroom level 2.png"
+
+
+def load_mushroom_sprites(sprite_sheet_path=MUSHROOM_SHEET, 
                         row=2, sprite_width=16, sprite_height=16):
     """
     Load mushroom sprites from a specific row of the spritesheet
@@ -21,9 +27,6 @@ def load_mushroom_sprites(sprite_sheet_path="assets/Level2/mushroom level 2.png"
         Dictionary mapping powerup types to their sprite images
     """
     try:
-        # Load the spritesheet
-        sheet = pygame.image.load(sprite_sheet_path).convert_alpha()
-        
         # Powerup types in order (6 types)
         powerup_types = [
             "health_burst",      # Column 0
@@ -34,22 +37,32 @@ def load_mushroom_sprites(sprite_sheet_path="assets/Level2/mushroom level 2.png"
             "forest_wisdom"      # Column 5
         ]
         
+        def build():
+            # Load the spritesheet
+            sheet = asset_loader.load(sprite_sheet_path).convert_alpha()
+            sprites = []
+            
+            # Extract each mushroom sprite from the row
+            for col in range(len(powerup_types)):
+                # Calculate the position in the spritesheet
+                x = col * sprite_width
+                y = row * sprite_height
+                
+                # Extract the sprite
+                sprite_rect = pygame.Rect(x, y, sprite_width, sprite_height)
+                sprite = sheet.subsurface(sprite_rect).copy()
+                
+                # Scale it up for better visibility (16x16 -> 24x24) - smaller, more subtle
+                sprites.append(pygame.transform.scale(sprite, (24, 24)))
+            return sprites
+        
+        sprites = frame_cache.load_frames(
+            [sprite_sheet_path], ("mushroom_row", row, sprite_width, sprite_height, (24, 24)), build,
+            atlas=texture_atlas.SPRITES)
+        
         # Dictionary to store the sprites
         mushroom_sprites = {}
-        
-        # Extract each mushroom sprite from the row
-        for col, powerup_type in enumerate(powerup_types):
-            # Calculate the position in the spritesheet
-            x = col * sprite_width
-            y = row * sprite_height
-            
-            # Extract the sprite
-            sprite_rect = pygame.Rect(x, y, sprite_width, sprite_height)
-            sprite = sheet.subsurface(sprite_rect).copy()
-            
-            # Scale it up for better visibility (16x16 -> 24x24) - smaller, more subtle
-            sprite = pygame.transform.scale(sprite, (24, 24))
-            
+        for col, (powerup_type, sprite) in enumerate(zip(powerup_types, sprites)):
             mushroom_sprites[powerup_type] = sprite
             print(f"Loaded {powerup_type} mushroom from column {col}")
         
@@ -0,0 +1,208 @@
+"""
+Level load-time breakdown.
+
+A level's __init__ runs a fixed sequence of stages - background, TMX parse,
+UI assets, mushroom sprites, process_tilemap, initialize_game_objects - and
+each is wrapped in step(name). Steps nest: inside process_tilemap every
+tile is timed under its obstacle class, every Tiled object under its type,
+and the spatial hash build gets its own step, so the report is a tree with
+total and self time per node:
+
+    === Load profile: Level2 (21.9 ms, 0.3 MB read) ===
+      prefetch                              3.7 ms  215 KB read
+      background                            8.5 ms  104 KB read
+      tmx                                   3.8 ms  12 KB read
+      ...
+      process_tilemap                       4.2 ms  (self 2.3 ms)
+        tile:block  x824                    1.0 ms
+        powerup:speed_mushroom  x8          0.1 ms
+        spatial_hash                        0.3 ms
+
+Top-level steps also record bytes read while they ran (rchar from
+/proc/self/io, Linux only), page-cache hits and the asset pool's prefetch
+reads included. Enemies and traps are built when the camera reaches them,
+so those spawns are collected under "deferred" while the level plays.
+`python main.py --load-profile` prints the tree after each load;
+benchmark.py puts it in its report.
+"""
+
+import os
+import time
+import weakref
+from contextlib import contextmanager, nullcontext
+
+_enabled = os.environ.get("SHROOMLIGHT_LOAD_PROFILE", "") not in ("", "0")
+_print = _enabled
+_NULL = nullcontext()
+
+_profile = None     # The load being profiled, see begin()
+_stack = []         # Open step nodes, innermost last
+_deferred = None    # Spawns after the load: {name: node}
+_last = None        # The latest finished profile
+_profiles = weakref.WeakKeyDictionary()  # Level -> its finished profile, until it plays
+
+
+def enable(print_report=True):
+    global _enabled, _print
+    _enabled = True
+    _print = print_report
+
+
+def is_enabled():
+    return _enabled
+
+
+def _bytes_read():
+    try:
+        with open("/proc/self/io") as f:
+            for line in f:
+                if line.startswith("rchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _node():
+    return {"ms": 0.0, "count": 0, "steps": {}}
+
+
+def begin(name):
+    """A level named `name` starts loading."""
+    global _profile, _deferred
+    if not _enabled:
+        return
+    _profile = {"level": name, "ms": 0.0, "steps": {}, "deferred": {},
+                "_start": time.perf_counter(), "_read": _bytes_read()}
+    _deferred = None
+    _stack.clear()
+
+
+def step(name):
+    """Context manager timing one load stage, nested under the step it runs inside."""
+    if _profile is None:
+        return _NULL
+    return _step(name)
+
+
+@contextmanager
+def _step(name):
+    parent = _stack[-1] if _stack else _profile
+    node = parent["steps"].get(name)
+    if node is None:
+        node = parent["steps"][name] = _node()
+    # Bytes only for top-level steps: reading /proc per tile would cost more than the tile
+    read = _bytes_read() if not _stack else None
+    _stack.append(node)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        node["ms"] += (time.perf_counter() - start) * 1000
+        node["count"] += 1
+        _stack.pop()
+        if read is not None:
+            node["bytes"] = node.get("bytes", 0) + _bytes_read() - read
+
+
+def spawned(name):
+    """Context manager timing an entity built after the load (see Game.spawn_entity)."""
+    if _deferred is None:
+        return _NULL
+    return _spawned(name)
+
+
+@contextmanager
+def _spawned(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        node = _deferred.get(name)
+        if node is None:
+            node = _deferred[name] = _node()
+        node["ms"] += (time.perf_counter() - start) * 1000
+        node["count"] += 1
+
+
+def finish(level):
+    """`level` is built: close its profile and print it if asked."""
+    global _profile, _last
+    if _profile is None:
+        return None
+    profile = _profile
+    _profile = None
+    _stack.clear()
+    profile["ms"] = (time.perf_counter() - profile.pop("_start")) * 1000
+    read = profile.pop("_read")
+    if read is not None:
+        profile["bytes"] = _bytes_read() - read
+    _last = _profiles[level] = profile
+    if _print:
+        print(report(profile))
+    return profile
+
+
+def level_start(level):
+    """Gameplay begins: collect deferred spawns into this level's profile.
+
+    Levels can be built well before they are played (main.py builds Level1
+    and Level2 up front), so this follows the level that is running rather
+    than the one that finished loading last.
+    """
+    global _deferred, _last
+    profile = _profiles.get(level)
+    if profile is None:
+        return
+    _deferred = profile["deferred"]
+    _last = profile
+
+
+def last():
+    """The profile of the level playing now, else the latest finished one."""
+    return _last
+
+
+def snapshot():
+    """A copy of last() with times rounded, for JSON reports."""
+    def rounded(node):
+        copy = {key: value for key, value in node.items() if key not in ("steps", "deferred")}
+        copy["ms"] = round(node["ms"], 3)
+        for key in ("steps", "deferred"):
+            if key in node:
+                copy[key] = {name: rounded(child) for name, child in node[key].items()}
+        return copy
+
+    return rounded(_last) if _last is not None else None
+
+
+def level_end():
+    """The level is over: print what was spawned during play."""
+    global _deferred
+    if _deferred is None:
+        return
+    if _print and _deferred:
+        print(f"=== Deferred spawns: {_last['level']} ===")
+        print("\n".join(_lines(_deferred, 1)))
+    _deferred = None
+
+
+def _lines(steps, depth):
+    lines = []
+    for name, node in steps.items():
+        children = node["steps"]
+        label = f"{'  ' * depth}{name}" + (f"  x{node['count']}" if node["count"] > 1 else "")
+        line = f"{label:<34} {node['ms']:8.1f} ms"
+        if children:
+            line += f"  (self {node['ms'] - sum(child['ms'] for child in children.values()):.1f} ms)"
+        if node.get("bytes"):
+            line += f"  {node['bytes'] / 1024:.0f} KB read"
+        lines.append(line)
+        lines += _lines(children, depth + 1)
+    return lines
+
+
+def report(profile):
+    read = f", {profile['bytes'] / 2**20:.1f} MB read" if "bytes" in profile else ""
+    return "\n".join([f"=== Load profile: {profile['level']} ({profile['ms']:.1f} ms{read}) ==="]
+                     + _lines(profile["steps"], 1))
@@ -1,12 +1,41 @@
+import startup_trace  # First import: its load time is the startup zero point
+import argparse
 import pygame
+import gc_policy
+import memory_report
+import hitch_watch
+import load_profile
+import perf_counters
+import sampling_profiler
 from game import Level1, Level2, FinalBossLevel
 from menus import retry_menu, start_menu, game_level, run_game_intro, run_BossIntro, run_level1_intro, run_level2_intro, run_victory_screen, run_defeat_screen, getLevel, pause_menu, music_manager, run_level2_tutorial, level1_completion_menu
 
+parser = argparse.ArgumentParser(description="Shroomlight : The Last Bloom")
+parser.add_argument("--trace-startup", action="store_true")
+parser.add_argument("--memory-report", action="store_true")
+parser.add_argument("--load-profile", action="store_true")
+parser.add_argument("--hitch-budget", type=float, metavar="MS", help="frame budget for the hitch log, 0 turns it off")
+parser.add_argument("--profile", action="store_true")
+parser.add_argument("--profile-rate", type=float, default=sampling_profiler.RATE_HZ, metavar="HZ")
+args, _ = parser.parse_known_args()
+
+if args.trace_startup:
+    startup_trace.enable()
+if args.memory_report:
+    memory_report.enable()
+if args.load_profile:
+    load_profile.enable()
+if args.hitch_budget is not None:
+    hitch_watch.configure(budget_ms=args.hitch_budget)
+if args.profile:
+    sampling_profiler.start(args.profile_rate)
+startup_trace.mark("imports")
 
 pygame.init()
 WIDTH, HEIGHT = 960, 640
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Shroomlight : The Last Bloom")
+startup_trace.mark("display init")
 game_state = "start"
 
 
@@ -23,16 +52,19 @@ def start_game_wrapper():
         run_level2_tutorial(WIDTH, HEIGHT, screen)
         music_manager.play('level1')  # Play Level 1 music
         result = level1.run(screen)
+        level1.teardown()
     elif game_level == 2:
         run_level2_intro(WIDTH, HEIGHT, screen)  # Dungeon level intro
         run_level2_tutorial(WIDTH, HEIGHT, screen)  # Show controls tutorial
         music_manager.play('level2')  # Play Level 2 music
         result = level2.run(screen)
+        level2.teardown()
     else:
         # Default to Level 1
         run_level1_intro(WIDTH, HEIGHT, screen)  # Forest level intro
         music_manager.play('level1')  # Play Level 1 music
         result = level1.run(screen)
+        level1.teardown()
     
     if result == "quit":
         game_state = "quit"
@@ -55,6 +87,13 @@ def quit_to_start():
 
 running = True
 while running:
+    # Every scene change passes through here: collect what the last scene left behind
+    memory_report.level_end()  # While the finished level is still loaded
+    hitch_watch.level_end()
+    load_profile.level_end()
+    perf_counters.set_enabled(False)  # Menus draw straight to the screen
+    sampling_profiler.set_scene("menu")
+    gc_policy.transition()
     if game_state == "start":
         start_menu(WIDTH, HEIGHT, screen, start_game_wrapper)
     elif game_state == "retry":
@@ -72,6 +111,7 @@ while running:
             music_manager.play('level2')
             level2 = Level2(WIDTH, HEIGHT)
             result = level2.run(screen)
+            level2.teardown()
             
             if result == "quit":
                 running = False
@@ -96,6 +136,7 @@ while running:
             music_manager.play('level2')
             level2 = Level2(WIDTH, HEIGHT)
             result = level2.run(screen)
+            level2.teardown()
             
             if result == "quit":
                 running = False
@@ -124,6 +165,7 @@ while running:
         # Create and run the boss level
         boss_level = FinalBossLevel(WIDTH, HEIGHT, difficulty)
         result = boss_level.run(screen)
+        boss_level.teardown()
         
         if result == "quit":
             running = False
@@ -0,0 +1,297 @@
+"""
+Per-level memory accounting and leak detector.
+
+Surface pixels live in SDL's heap, out of tracemalloc's sight, so
+surface_bytes() totals them by owner: "shared:<module>" for module-level
+caches (walked first, so shared frames count once there), then "<level
+attribute>" or "<level attribute>:<class>" for what the level holds. Python
+objects are traced with tracemalloc and grouped by the repo file that
+allocated them.
+
+Both are sampled at level start, every INTERVAL_S seconds and at level end.
+A category that grows at every one of at least MIN_SAMPLES samples by more
+than its GROWTH_MIN is flagged, as is memory that climbs between starts of
+the same level. Turned on by `python main.py --memory-report`;
+`python memory_report.py boss_easy_arena --runs 5` replays a scenario.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+import types
+import weakref
+from collections import deque
+
+_enabled = os.environ.get("SHROOMLIGHT_MEMORY_REPORT", "") not in ("", "0")
+
+INTERVAL_S = 5.0
+MIN_SAMPLES = 4
+GROWTH_MIN = {"surface": 64 * 1024, "python": 64 * 1024, "objects": 20}  # bytes, bytes, instances
+MAX_DEPTH = 12
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+_level = None        # weakref to the level being sampled
+_samples = []        # (seconds since level start, {category: value}) for the current level
+_start_snapshot = None
+_last_sample = 0.0
+_level_started = 0.0
+_starts = {}         # level class name -> {category: value} at each start, oldest first
+reports = []         # One dict per finished level, see level_end()
+
+
+def enable():
+    global _enabled
+    _enabled = True
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def is_enabled():
+    return _enabled
+
+
+if _enabled:
+    tracemalloc.start()
+
+
+# ===== Surfaces =====
+
+def _surface_size(surface):
+    return surface.get_pitch() * surface.get_height()
+
+
+def _walk(obj, category, totals, counts, seen, depth=0):
+    import pygame
+
+    if depth > MAX_DEPTH or id(obj) in seen:
+        return
+    seen.add(id(obj))
+
+    if isinstance(obj, pygame.Surface):
+        # Subsurfaces (atlas frames) share their parent's pixels: count the page once
+        while obj.get_parent() is not None:
+            obj = obj.get_parent()
+            if id(obj) in seen:
+                return
+            seen.add(id(obj))
+        totals[category] = totals.get(category, 0) + _surface_size(obj)
+        return
+    if isinstance(obj, (str, bytes, int, float, bool, type(None), types.ModuleType, type,
+                        types.FunctionType, types.BuiltinFunctionType, types.MethodType)):
+        return
+
+    if isinstance(obj, dict):
+        items = obj.values()
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        items = obj
+    elif hasattr(obj, "__dict__"):
+        counts[type(obj).__name__] = counts.get(type(obj).__name__, 0) + 1
+        items = vars(obj).values()
+    else:
+        return
+    for item in list(items):
+        _walk(item, category, totals, counts, seen, depth + 1)
+
+
+def _repo_modules():
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None) or ""
+        if name != __name__ and os.path.abspath(path).startswith(ROOT + os.sep):
+            yield name, module
+
+
+def surface_bytes(level):
+    """({owner category: surface bytes}, {class name: instances reachable from the level})."""
+    totals, counts, seen = {}, {}, {id(level), id(sys.modules[__name__])}
+
+    for name, module in _repo_modules():
+        category = f"shared:{name}"
+        for value in list(vars(module).values()):
+            if isinstance(value, type) and value.__module__ == name:
+                # Class-level caches (Arrow._images...)
+                for attr in list(vars(value).values()):
+                    if isinstance(attr, (dict, list)):
+                        _walk(attr, category, totals, {}, seen)
+            elif not isinstance(value, types.ModuleType):
+                _walk(value, category, totals, {}, seen)
+
+    for attr, value in list(vars(level).items()):
+        if isinstance(value, (list, tuple)) and value and hasattr(value[0], "__dict__"):
+            for item in value:
+                _walk(item, f"{attr}:{type(item).__name__}", totals, counts, seen)
+        else:
+            _walk(value, attr, totals, counts, seen)
+    return totals, counts
+
+
+# ===== Python heap =====
+
+def _python_bytes(snapshot):
+    """Traced bytes per repo file (everything else lumped under 'other')."""
+    totals = {}
+    for stat in snapshot.statistics("filename"):
+        path = os.path.abspath(stat.traceback[0].filename)
+        name = os.path.relpath(path, ROOT) if path.startswith(ROOT + os.sep) else "other"
+        totals[name] = totals.get(name, 0) + stat.size
+    return totals
+
+
+def _take_snapshot():
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ))
+
+
+def sample(level):
+    """Every tracked category for `level` right now, as {kind:name: value}."""
+    surfaces, counts = surface_bytes(level)
+    values = {f"surface:{name}": size for name, size in surfaces.items()}
+    values.update((f"objects:{name}", count) for name, count in counts.items())
+    if tracemalloc.is_tracing():
+        values.update((f"python:{name}", size) for name, size in _python_bytes(_take_snapshot()).items())
+    return values
+
+
+def growing(samples, min_samples=MIN_SAMPLES):
+    """Categories that grew at every step of `samples` (a list of {category: value}) by more than GROWTH_MIN."""
+    if len(samples) < min_samples:
+        return {}
+    flagged = {}
+    for category in samples[-1]:
+        series = [values.get(category, 0) for values in samples]
+        growth = series[-1] - series[0]
+        if growth > GROWTH_MIN[category.split(":", 1)[0]] and all(b > a for a, b in zip(series, series[1:])):
+            flagged[category] = series
+    return flagged
+
+
+# ===== Level hooks =====
+
+def level_start(level):
+    """The level is loaded and gameplay is about to begin."""
+    global _level, _samples, _start_snapshot, _last_sample, _level_started
+    if not _enabled:
+        return
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _level = weakref.ref(level)
+    _level_started = _last_sample = time.perf_counter()
+    _start_snapshot = _take_snapshot()
+    values = sample(level)
+    _samples = [(0.0, values)]
+    _starts.setdefault(type(level).__name__, []).append(values)
+
+
+def tick(level):
+    """Once per gameplay frame; samples every INTERVAL_S seconds."""
+    global _last_sample
+    if not _enabled or _level is None:
+        return
+    now = time.perf_counter()
+    if now - _last_sample < INTERVAL_S:
+        return
+    _last_sample = now
+    _samples.append((now - _level_started, sample(level)))
+
+
+def level_end():
+    """The level is over (main.py calls this before the scene change collects it)."""
+    global _level, _start_snapshot
+    if not _enabled or _level is None:
+        return None
+    level = _level()
+    _level = None
+    if level is None:
+        return None
+
+    _samples.append((time.perf_counter() - _level_started, sample(level)))
+    name = type(level).__name__
+    final = _samples[-1][1]
+    report = {
+        "level": name,
+        "seconds": round(_samples[-1][0], 1),
+        "samples": len(_samples),
+        "surface_bytes": {k.split(":", 1)[1]: v for k, v in final.items() if k.startswith("surface:")},
+        "python_bytes": {k.split(":", 1)[1]: v for k, v in final.items() if k.startswith("python:")},
+        "growing": growing([values for _, values in _samples]),
+        # The first start fills the shared caches; only later starts should stay flat
+        "growing_across_starts": growing(_starts[name][1:], min_samples=3),
+        "top_growth": [],
+    }
+    if _start_snapshot is not None:
+        for stat in _take_snapshot().compare_to(_start_snapshot, "lineno")[:8]:
+            if stat.size_diff > 0:
+                frame = stat.traceback[0]
+                path = os.path.abspath(frame.filename)
+                where = os.path.relpath(path, ROOT) if path.startswith(ROOT + os.sep) else frame.filename
+                report["top_growth"].append((f"{where}:{frame.lineno}",
+                                             stat.size_diff, stat.count_diff))
+    _start_snapshot = None
+    reports.append(report)
+    print_report(report)
+    return report
+
+
+def print_report(report):
+    surfaces = report["surface_bytes"]
+    print(f"🧠 Memory for {report['level']} after {report['seconds']} s ({report['samples']} samples): "
+          f"{sum(surfaces.values()) / 2**20:.1f} MB surfaces, "
+          f"{sum(report['python_bytes'].values()) / 2**20:.1f} MB traced Python")
+    for category, size in sorted(surfaces.items(), key=lambda item: -item[1])[:12]:
+        print(f"   {category:40s} {size / 1024:9.0f} KB")
+    for where, size, count in report["top_growth"]:
+        print(f"   + {where:38s} {size / 1024:9.1f} KB  ({count:+d} blocks)")
+    for label, flagged in (("during the level", report["growing"]),
+                           ("across level starts", report["growing_across_starts"])):
+        for category, series in flagged.items():
+            print(f"⚠️ {category} grew {label}: {' -> '.join(str(v) for v in series)}")
+
+
+# ===== Replay =====
+
+def main(argv=None):
+    import argparse
+    import benchmark
+    import gc_policy
+    import pygame
+
+    global INTERVAL_S
+    parser = argparse.ArgumentParser(description="Replay a level and check that its memory stays flat")
+    parser.add_argument("scenario", nargs="?", default="boss_easy_arena", choices=list(benchmark.SCENARIOS))
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--frames", type=int, default=600, help="frames per run")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between samples")
+    args = parser.parse_args(argv)
+
+    INTERVAL_S = args.interval
+    enable()
+    pygame.init()
+    pygame.display.set_mode((benchmark.WIDTH, benchmark.HEIGHT))
+    for run in range(args.runs):
+        level, *_ = benchmark.play(benchmark.SCENARIOS[args.scenario], args.frames, warmup=0)
+        with open(os.devnull, "w") as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                report = level_end()
+            finally:
+                sys.stdout = stdout
+        del level
+        gc_policy.transition()
+        print(f"Run {run + 1}/{args.runs}:")
+        print_report(report)
+    pygame.quit()
+
+    leaks = [report for report in reports if report["growing"] or report["growing_across_starts"]]
+    if leaks:
+        print(f"⚠️ Memory kept growing in {len(leaks)} of {len(reports)} runs")
+        sys.exit(1)
+    print(f"✅ No category grew across {len(reports)} runs of {args.scenario}")
+
+
+if __name__ == "__main__":
+    # game.py reports to the imported module, not to this script's own copy
+    import memory_report
+    memory_report.main()
@@ -1,9 +1,22 @@
 import pygame
+import functools
+import io
 import math
 import random
+import threading
+
+import frame_cache
+import fonts
+import startup_trace
+import texture_atlas
 
 game_level = 2
 
+
+def _ui_image(path):
+    """Menu/HUD image as a view into the UI atlas, decoded once per run (and cached on disk)"""
+    return frame_cache.load_image(path, atlas=texture_atlas.UI)
+
 # ============ MUSIC MANAGER ============
 class MusicManager:
     """Manages background music for different game states"""
@@ -12,6 +25,7 @@ class MusicManager:
         self.current_track = None
         self.music_volume = 0.5  # 50% volume (adjust as needed)
         self.initialized = False
+        self.prefetched = {}  # track name -> file bytes, filled by a background thread
         
         # Load music files
         self.tracks = {
@@ -37,7 +51,12 @@ class MusicManager:
         
         if track_name in self.tracks:
             try:
-                pygame.mixer.music.load(self.tracks[track_name])
+                data = self.prefetched.get(track_name)
+                if data is not None:
+                    # Streams from memory: no disk access on the frame that switches tracks
+                    pygame.mixer.music.load(io.BytesIO(data), "mp3")
+                else:
+                    pygame.mixer.music.load(self.tracks[track_name])
                 pygame.mixer.music.play(-1)  # -1 means loop forever
                 self.current_track = track_name
                 print(f"🎵 Playing {track_name} music")
@@ -46,6 +65,24 @@ class MusicManager:
         else:
             print(f"⚠️ Track {track_name} not found")
     
+    def preload(self, *track_names):
+        """Read tracks into memory on a background thread so switching to them is instant"""
+        pending = [name for name in track_names or self.tracks
+                   if name in self.tracks and name not in self.prefetched]
+        if not pending:
+            return
+
+        def read_tracks():
+            for name in pending:
+                try:
+                    with open(self.tracks[name], "rb") as f:
+                        self.prefetched[name] = f.read()
+                except OSError as e:
+                    self.prefetched[name] = None  # play() falls back to loading by path
+                    print(f"⚠️ Could not prefetch music {name}: {e}")
+
+        threading.Thread(target=read_tracks, daemon=True).start()
+    
     def stop(self):
         """Stop the current music"""
         pygame.mixer.music.stop()
@@ -66,15 +103,27 @@ class MusicManager:
 
 # Create a global music manager instance
 music_manager = MusicManager()
+_background = None
+
+
+def _menu_background():
+    """menuBack.jpeg scaled to the window, decoded once and shared by every menu"""
+    global _background
+    if _background is None:
+        with startup_trace.timed("asset decode"):
+            _background = pygame.transform.scale(pygame.image.load('assets/menuBack.jpeg').convert(), (960, 640))
+    return _background
+
+
 class baseMenu():
     def __init__(self,  buttons, title_img, selected_img):
         self.title_image = title_img
         self.selected_img = selected_img
         self.buttons = buttons
         self.selected_index = 0
-        self.font = pygame.font.Font(None, 50)
-        self.background = pygame.image.load('assets/menuBack.jpeg').convert()
-        self.background = pygame.transform.scale(self.background, (960, 640))
+        self.choice = None  # Set by a button's on_activate; the menu loop runs until it is
+        self.font = fonts.get(None, 50)
+        self.background = _menu_background()
         # Ambient particles for menu
         self.menu_particles = []
         for _ in range(20):
@@ -88,6 +137,17 @@ class baseMenu():
                 'size': random.randint(2, 5)
             })
     
+    def reset(self):
+        """Back to the first button with nothing chosen, for reopening a prebuilt menu"""
+        self.selected_index = 0
+        self.choice = None
+
+    def choose(self, choice):
+        self.choice = choice
+
+    def activate(self):
+        self.buttons[self.selected_index].activate()
+
     def move_selection(self, direction):
         self.selected_index = (self.selected_index + direction) % len(self.buttons)
         print(self.selected_index)
@@ -143,7 +203,7 @@ class Button():
         self.rect = self.image.get_rect(center=(self.x_pos, self.y_pos))
         self.topLeft = self.rect.topleft
         self.font = font
-        self.text = self.font.render(text, True, (255, 255, 255))
+        self.text = fonts.render(self.font, text, (255, 255, 255))
         
         
 
@@ -164,59 +224,47 @@ class Button():
             self.on_activate()
             print(self.topLeft)
 
+_menus = {}  # (name, WIDTH, HEIGHT) -> baseMenu, built on first open and kept for the rest of the run
+
+
+def _prebuilt_menu(name, WIDTH, HEIGHT, title_path, buttons):
+    """The menu called name, building it the first time. buttons: (image, y offset, text, choice) each.
+
+    Every later open just resets the selection, so reopening loads and allocates nothing.
+    """
+    key = (name, WIDTH, HEIGHT)
+    menu = _menus.get(key)
+    if menu is None:
+        menu = baseMenu([], _ui_image(title_path), _ui_image('assets/arrow_pointer.png'))
+        for image, y_offset, text, choice in buttons:
+            menu.buttons.append(Button(
+                images=(_ui_image(f'assets/{image}.png'),
+                        _ui_image(f'assets/{image}_highlighted.png')),
+                pos=(WIDTH // 2, HEIGHT // 2 + y_offset),
+                text=text,
+                font=fonts.get(None, 50),
+                on_activate=functools.partial(menu.choose, choice)
+            ))
+        _menus[key] = menu
+    menu.reset()
+    return menu
+
+
 def start_menu(WIDTH, HEIGHT, screen, start_game):
     music_manager.play('menu')  # Play menu music
-    running = True
+    music_manager.preload('level1', 'level2', 'boss')  # Ready before the player picks a level
     
-    def open_level_select():
-        nonlocal running
-        level_selected = level_select_menu(WIDTH, HEIGHT, screen)
-        # Only start the game if a level was actually selected (not if they pressed Back)
-        if level_selected:
-            start_game()
-            running = False
-    
-    levels_button = Button(
-        images=(pygame.image.load('assets/start_button.png').convert_alpha(),
-                pygame.image.load('assets/start_button_highlighted.png').convert_alpha()),
-        pos=(WIDTH // 2, HEIGHT // 2),
-        text="Levels",
-        font=pygame.font.Font(None, 50),
-        on_activate=open_level_select
-    )
-    
-    def show_manual():
-        nonlocal running
-        run_game_manual(WIDTH, HEIGHT, screen)
-    
-    manual_button = Button(
-        images=(pygame.image.load('assets/howtoplay_button.png').convert_alpha(),
-                pygame.image.load('assets/howtoplay_button_highlighted.png').convert_alpha()),
-        pos=(WIDTH // 2, HEIGHT // 2 + 100),
-        text="Manual",
-        font=pygame.font.Font(None, 50),
-        on_activate=show_manual
-    )
-    
-    def quit_game():
-        nonlocal running
-        running = False
-        pygame.quit()
-        exit()
-    
-    quit_button = Button(
-        images=(pygame.image.load('assets/quit_button.png').convert_alpha(),
-                pygame.image.load('assets/quit_button_highlighted.png').convert_alpha()),
-        pos=(WIDTH // 2, HEIGHT // 2 + 200),
-        text="Quit",
-        font=pygame.font.Font(None, 50),
-        on_activate=quit_game
-    )
-    main_menu = baseMenu ([levels_button, manual_button, quit_button], pygame.image.load('assets/title.png').convert_alpha(), pygame.image.load('assets/arrow_pointer.png').convert_alpha()) 
-    while running:
+    main_menu = _prebuilt_menu('start', WIDTH, HEIGHT, 'assets/title.png', [
+        ('start_button', 0, "Levels", 'levels'),
+        ('howtoplay_button', 100, "Manual", 'manual'),
+        ('quit_button', 200, "Quit", 'quit'),
+    ])
+    startup_trace.mark("menu built")
+    while main_menu.choice is None:
         
         
         main_menu.draw(screen)
+        startup_trace.first_frame()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
@@ -230,11 +278,20 @@ def start_menu(WIDTH, HEIGHT, screen, start_game):
                     main_menu.move_selection(1)
                     print("down")
                 if event.key == pygame.K_SPACE:
-                    main_menu.buttons[main_menu.selected_index].activate()
-                    running = False  # Exit menu after button press
+                    main_menu.activate()  # Exit menu after button press
 
         pygame.display.flip()
 
+    if main_menu.choice == 'levels':
+        # Only start the game if a level was actually selected (not if they pressed Back)
+        if level_select_menu(WIDTH, HEIGHT, screen):
+            start_game()
+    elif main_menu.choice == 'manual':
+        run_game_manual(WIDTH, HEIGHT, screen)
+    elif main_menu.choice == 'quit':
+        pygame.quit()
+        exit()
+
 def set_level(level_num):
     global game_level
     game_level = level_num
@@ -242,52 +299,13 @@ def set_level(level_num):
     
 
 def level_select_menu(WIDTH, HEIGHT, screen):
-    running = True
-    level_selected = False  # Track if a level was selected
-    
-    def select_level_and_exit(level_num):
-        nonlocal running, level_selected
-        set_level(level_num)
-        level_selected = True
-        running = False
-    
-    def go_back():
-        nonlocal running, level_selected
-        level_selected = False
-        running = False
-    
-    level1_button = Button(
-        images=(pygame.image.load('assets/level_1_button.png').convert_alpha(),
-                pygame.image.load('assets/level_1_button_highlighted.png').convert_alpha()),
-        pos=(WIDTH // 2, HEIGHT // 2 + 0),
-        text="Level 1",
-        font=pygame.font.Font(None, 50),
-        on_activate=lambda: select_level_and_exit(1)
-    )
+    level_menu = _prebuilt_menu('level_select', WIDTH, HEIGHT, 'assets/leveltitle.png', [
+        ('level_1_button', 0, "Level 1", 1),
+        ('level_2_button', 100, "Level 2", 2),
+        ('quit_button', 200, "Back", 'back'),
+    ])
     
-    level2_button = Button( 
-        images=(pygame.image.load('assets/level_2_button.png').convert_alpha(),
-                pygame.image.load('assets/level_2_button_highlighted.png').convert_alpha()),
-        pos=(WIDTH // 2, HEIGHT // 2 + 100),
-        text="Level 2",
-        font=pygame.font.Font(None, 50),
-        on_activate=lambda: select_level_and_exit(2)
-    )
-    
-    back_button = Button(
-        images=(pygame.image.load('assets/quit_button.png').convert_alpha(),
-                pygame.image.load('assets/quit_button_highlighted.png').convert_alpha()),
-        pos=(WIDTH // 2, HEIGHT // 2 + 200),
-        text="Back",
-        font=pygame.font.Font(None, 50),
-        on_activate=go_back
-    )
-    
-    level_menu = baseMenu([level1_button, level2_button, back_button],
-                        pygame.image.load('assets/leveltitle.png').convert_alpha(),
-                        pygame.image.load('assets/arrow_pointer.png').convert_alpha())
-    
-    while running:
+    while level_menu.choice is None:
         level_menu.draw(screen)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -300,40 +318,23 @@ def level_select_menu(WIDTH, HEIGHT, screen):
                 if event.key == pygame.K_DOWN:
                     level_menu.move_selection(1)
                 if event.key == pygame.K_SPACE:
-                    level_menu.buttons[level_menu.selected_index].activate()
-                    running = False
+                    level_menu.activate()
         
         pygame.display.flip()
     
-    return level_selected  # Return True if level was selected, False if Back was pressed
+    if level_menu.choice == 'back':
+        return False  # Back was pressed
+    set_level(level_menu.choice)
+    return True
         
 
 def retry_menu(WIDTH, HEIGHT, screen, retry_function, quit_function):
-    running = True
-    
-    retry_button = Button(
-        images=(pygame.image.load('assets/retry_button.png').convert_alpha(),
-                pygame.image.load('assets/retry_button_highlighted.png').convert_alpha()),
-        pos=(WIDTH // 2, HEIGHT // 2),
-        text="Retry",
-        font=pygame.font.Font(None, 50),
-        on_activate=retry_function
-    )
-    
-    quit_button = Button(
-        images=(pygame.image.load('assets/quit_button.png').convert_alpha(),
-                pygame.image.load('assets/quit_button_highlighted.png').convert_alpha()),
-        pos=(WIDTH // 2, HEIGHT // 2 + 100),
-        text="Quit",
-        font=pygame.font.Font(None, 50),
-        on_activate=quit_function
-    )
+    retry_menu_obj = _prebuilt_menu('retry', WIDTH, HEIGHT, 'assets/diedtitle.png', [
+        ('retry_button', 0, "Retry", 'retry'),
+        ('quit_button', 100, "Quit", 'quit'),
+    ])
     
-    retry_menu_obj = baseMenu([retry_button, quit_button],
-                            pygame.image.load('assets/diedtitle.png').convert_alpha(),
-                            pygame.image.load('assets/arrow_pointer.png').convert_alpha())
-    
-    while running:
+    while retry_menu_obj.choice is None:
         retry_menu_obj.draw(screen)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -346,11 +347,18 @@ def retry_menu(WIDTH, HEIGHT, screen, retry_function, quit_function):
                 if event.key == pygame.K_DOWN:
                     retry_menu_obj.move_selection(1)
                 if event.key == pygame.K_SPACE:
-                    retry_menu_obj.buttons[retry_menu_obj.selected_index].activate()
-                    running = False
+                    retry_menu_obj.activate()
 
         pygame.display.flip()
 
+    if retry_menu_obj.choice == 'retry':
+        retry_function()
+    else:
+        quit_function()
+
+
+_pause_overlays = {}  # (WIDTH, HEIGHT) -> semi-transparent Surface dimming the frozen game
+
 
 def pause_menu(WIDTH, HEIGHT, screen, game_surface):
     """
@@ -358,66 +366,22 @@ def pause_menu(WIDTH, HEIGHT, screen, game_surface):
     Returns: 'resume', 'restart', or 'main_menu'
     """
     music_manager.pause()  # Pause music when menu opens
-    running = True
-    action = 'resume'
-    
-    def resume_game():
-        nonlocal running, action
-        action = 'resume'
-        running = False
-    
-    def restart_level():
-        nonlocal running, action
-        action = 'restart'
-        running = False
-    
-    def show_controls():
-        # Show controls screen, then return to pause menu
-        run_level2_tutorial(WIDTH, HEIGHT, screen)
-    
-    def return_to_main():
-        nonlocal running, action
-        action = 'main_menu'
-        running = False
     
-    resume_button = Button(
-        images=(pygame.image.load('assets/resume_button.png').convert_alpha(),
-                pygame.image.load('assets/resume_button_highlighted.png').convert_alpha()),
-        pos=(WIDTH // 2, HEIGHT // 2),
-        text="Resume",
-        font=pygame.font.Font(None, 50),
-        on_activate=resume_game
-    )
-    
-    
-    restart_button = Button(
-        images=(pygame.image.load('assets/retry_button.png').convert_alpha(),
-                pygame.image.load('assets/retry_button_highlighted.png').convert_alpha()),
-        pos=(WIDTH // 2, HEIGHT // 2 + 100),
-        text="Restart",
-        font=pygame.font.Font(None, 50),
-        on_activate=restart_level
-    )
-    
-    main_menu_button = Button(
-        images=(pygame.image.load('assets/quit_button.png').convert_alpha(),
-                pygame.image.load('assets/quit_button_highlighted.png').convert_alpha()),
-        pos=(WIDTH // 2, HEIGHT // 2 + 200),
-        text="Main Menu",
-        font=pygame.font.Font(None, 50),
-        on_activate=return_to_main
-    )
+    pause_menu_obj = _prebuilt_menu('pause', WIDTH, HEIGHT, 'assets/title.png', [
+        ('resume_button', 0, "Resume", 'resume'),
+        ('retry_button', 100, "Restart", 'restart'),
+        ('quit_button', 200, "Main Menu", 'main_menu'),
+    ])
     
     # Create a semi-transparent overlay
-    overlay = pygame.Surface((WIDTH, HEIGHT))
-    overlay.set_alpha(128)
-    overlay.fill((0, 0, 0))
-    
-    pause_menu_obj = baseMenu([resume_button, restart_button, main_menu_button],
-                            pygame.image.load('assets/title.png').convert_alpha(),
-                            pygame.image.load('assets/arrow_pointer.png').convert_alpha())
-    
-    while running:
+    overlay = _pause_overlays.get((WIDTH, HEIGHT))
+    if overlay is None:
+        overlay = pygame.Surface((WIDTH, HEIGHT))
+        overlay.set_alpha(128)
+        overlay.fill((0, 0, 0))
+        _pause_overlays[(WIDTH, HEIGHT)] = overlay
+    
+    while pause_menu_obj.choice is None:
         # Draw the frozen game state
         screen.blit(game_surface, (0, 0))
         # Draw semi-transparent overlay
@@ -437,14 +401,14 @@ def pause_menu(WIDTH, HEIGHT, screen, game_surface):
                 if event.key == pygame.K_DOWN:
                     pause_menu_obj.move_selection(1)
                 if event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
-                    pause_menu_obj.buttons[pause_menu_obj.selected_index].activate()
+                    pause_menu_obj.activate()
                 # Allow ESC to resume
                 if event.key == pygame.K_ESCAPE:
-                    action = 'resume'
-                    running = False
+                    pause_menu_obj.choose('resume')
         
         pygame.display.flip()
     
+    action = pause_menu_obj.choice
     # Resume music if player continues playing
     if action == 'resume':
         music_manager.unpause()
@@ -461,59 +425,21 @@ def level1_completion_menu(WIDTH, HEIGHT, screen, level_name="Level 1"):
     Returns: 'dungeon' (Level 2), 'quit', or 'main_menu'
     """
     music_manager.play('menu')  # Play menu music for completion screen
-    running = True
-    action = 'main_menu'
-    
-    def go_to_dungeon():
-        nonlocal running, action
-        action = 'dungeon'
-        running = False
-    
-    def quit_game():
-        nonlocal running, action
-        action = 'quit'
-        running = False
-    
-    # Create buttons
-    dungeon_button = Button(
-        images=(pygame.image.load('assets/level_2_button.png').convert_alpha(),
-                pygame.image.load('assets/level_2_button_highlighted.png').convert_alpha()),
-        pos=(WIDTH // 2, HEIGHT // 2 + 50),
-        text="Dungeon",
-        font=pygame.font.Font(None, 50),
-        on_activate=go_to_dungeon
-    )
-    
-    quit_button = Button(
-        images=(pygame.image.load('assets/quit_button.png').convert_alpha(),
-                pygame.image.load('assets/quit_button_highlighted.png').convert_alpha()),
-        pos=(WIDTH // 2, HEIGHT // 2 + 150),
-        text="Quit",
-        font=pygame.font.Font(None, 50),
-        on_activate=quit_game
-    )
     
     # Create menu with buttons
-    completion_menu_obj = baseMenu([dungeon_button, quit_button],
-                                  pygame.image.load('assets/wontitle.png').convert_alpha(),
-                                  pygame.image.load('assets/arrow_pointer.png').convert_alpha())
-
-    font_title = pygame.font.Font("assets/yoster.ttf", 56)
-    font_subtitle = pygame.font.Font("assets/yoster.ttf", 32)
-    
+    completion_menu_obj = _prebuilt_menu('level_complete', WIDTH, HEIGHT, 'assets/wontitle.png', [
+        ('level_2_button', 50, "Dungeon", 'dungeon'),
+        ('quit_button', 150, "Quit", 'quit'),
+    ])
 
-    while running:
+    while completion_menu_obj.choice is None:
         # Draw menu background
         completion_menu_obj.draw(screen)
         
-        # Draw "LEVEL COMPLETE!" title with glow effect
-
-        
         # Handle events
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                action = 'quit'
-                running = False
+                completion_menu_obj.choose('quit')
             
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_UP:
@@ -521,11 +447,11 @@ def level1_completion_menu(WIDTH, HEIGHT, screen, level_name="Level 1"):
                 if event.key == pygame.K_DOWN:
                     completion_menu_obj.move_selection(1)
                 if event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
-                    completion_menu_obj.buttons[completion_menu_obj.selected_index].activate()
+                    completion_menu_obj.activate()
         
         pygame.display.flip()
     
-    return action
+    return completion_menu_obj.choice
 
 
 class DialogueScreen:
@@ -534,7 +460,7 @@ class DialogueScreen:
 
         # --- Main Text Customization ---
         self.text_to_display = text
-        self.font = pygame.font.Font("assets/yoster.ttf", font_size)
+        self.font = fonts.get(fonts.DEFAULT_FONT, font_size)
         self.text_color = text_color
         
         # Text wrapping logic
@@ -570,7 +496,7 @@ class DialogueScreen:
         prompt_pos_x = screen_rect.centerx
         prompt_pos_y = screen_rect.bottom - 50
 
-        self.prompt_surf = self.prompt_font.render(self.prompt_text, True, self.text_color)
+        self.prompt_surf = fonts.render(self.prompt_font, self.prompt_text, self.text_color).copy()  # Own copy: faded in below
         self.prompt_rect = self.prompt_surf.get_rect(center=(prompt_pos_x, prompt_pos_y))
     
     def _wrap_text(self, text, max_width):
@@ -625,7 +551,7 @@ class DialogueScreen:
         y_offset = 0
         for line in wrapped_current:
             if line:  # Only draw non-empty lines
-                rendered_text = self.font.render(line, True, self.text_color)
+                rendered_text = fonts.render(self.font, line, self.text_color)
                 surface.blit(rendered_text, (self.position[0], self.position[1] + y_offset))
                 y_offset += line_spacing
         
@@ -728,10 +654,10 @@ def run_game_manual(WIDTH, HEIGHT, screen):
     running = True
     current_page = 0
     
-    font_title = pygame.font.Font("assets/yoster.ttf", 48)
-    font_section = pygame.font.Font("assets/yoster.ttf", 28)
-    font_normal = pygame.font.Font("assets/yoster.ttf", 22)
-    font_small = pygame.font.Font("assets/yoster.ttf", 18)  # Same pixelated font
+    font_title = fonts.get(fonts.DEFAULT_FONT, 48)
+    font_section = fonts.get(fonts.DEFAULT_FONT, 28)
+    font_normal = fonts.get(fonts.DEFAULT_FONT, 22)
+    font_small = fonts.get(fonts.DEFAULT_FONT, 18)  # Same pixelated font
     
     # Define manual pages
     pages = [
@@ -897,8 +823,7 @@ def run_game_manual(WIDTH, HEIGHT, screen):
         page = pages[current_page]
         
         # Title
-        title_surf = font_title.render(page["title"], True, (255, 220, 120))
-        title_surf.set_alpha(fade_alpha)
+        title_surf = fonts.render(font_title, page["title"], (255, 220, 120), alpha=fade_alpha)
         title_rect = title_surf.get_rect(center=(WIDTH // 2, 50))
         screen.blit(title_surf, title_rect)
         
@@ -924,15 +849,14 @@ def run_game_manual(WIDTH, HEIGHT, screen):
             else:
                 text_color = (230, 230, 230)  # White for normal text
             
-            text_surf = font_normal.render(line, True, text_color)
-            text_surf.set_alpha(fade_alpha)
+            text_surf = fonts.render(font_normal, line, text_color, alpha=fade_alpha)
             # Center each line properly
             screen.blit(text_surf, (WIDTH // 2 - text_surf.get_width() // 2, y_offset))
             y_offset += 35
         
         # Page indicator with same white color as body text
         page_text = f"Page {current_page + 1} / {len(pages)}"
-        page_surf = font_small.render(page_text, True, (220, 220, 220))
+        page_surf = fonts.render(font_small, page_text, (220, 220, 220))
         page_rect = page_surf.get_rect(center=(WIDTH // 2, HEIGHT - 120))
         screen.blit(page_surf, page_rect)
         
@@ -946,13 +870,13 @@ def run_game_manual(WIDTH, HEIGHT, screen):
         else:
             nav_text = "<  Previous"
         
-        nav_surf = font_small.render(nav_text, True, nav_color)
+        nav_surf = fonts.render(font_small, nav_text, nav_color)
         nav_rect = nav_surf.get_rect(center=(WIDTH // 2, nav_y))
         screen.blit(nav_surf, nav_rect)
         
         # SPACE hint below with same white color and more spacing
         space_text = "- Press SPACE to Return to Main Menu -"
-        space_surf = font_small.render(space_text, True, nav_color)
+        space_surf = fonts.render(font_small, space_text, nav_color)
         space_rect = space_surf.get_rect(center=(WIDTH // 2, nav_y + 40))
         screen.blit(space_surf, space_rect)
         
@@ -973,10 +897,10 @@ def run_level2_tutorial(WIDTH, HEIGHT, screen):
         pygame.event.pump()
     
     running = True
-    font_title = pygame.font.Font("assets/yoster.ttf", 42)
-    font_section = pygame.font.Font("assets/yoster.ttf", 24)
-    font_normal = pygame.font.Font("assets/yoster.ttf", 20)
-    font_prompt = pygame.font.Font("assets/yoster.ttf", 22)
+    font_title = fonts.get(fonts.DEFAULT_FONT, 42)
+    font_section = fonts.get(fonts.DEFAULT_FONT, 24)
+    font_normal = fonts.get(fonts.DEFAULT_FONT, 20)
+    font_prompt = fonts.get(fonts.DEFAULT_FONT, 22)
     
     # Tutorial content - organized by sections
     title = "GAME CONTROLS"
@@ -1009,8 +933,7 @@ def run_level2_tutorial(WIDTH, HEIGHT, screen):
         screen.fill((20, 20, 30))  # Dark blue-gray background
         
         # Title with glow effect
-        title_surf = font_title.render(title, True, (255, 220, 120))
-        title_surf.set_alpha(fade_alpha)
+        title_surf = fonts.render(font_title, title, (255, 220, 120), alpha=fade_alpha)
         title_rect = title_surf.get_rect(center=(WIDTH // 2, 50))
         screen.blit(title_surf, title_rect)
         
@@ -1022,8 +945,7 @@ def run_level2_tutorial(WIDTH, HEIGHT, screen):
         y_offset = 110
         
         # === MOVEMENT SECTION ===
-        section_surf = font_section.render("MOVEMENT:", True, (120, 220, 255))
-        section_surf.set_alpha(fade_alpha)
+        section_surf = fonts.render(font_section, "MOVEMENT:", (120, 220, 255), alpha=fade_alpha)
         screen.blit(section_surf, (WIDTH // 2 - 230, y_offset))
         y_offset += 33
         
@@ -1033,16 +955,14 @@ def run_level2_tutorial(WIDTH, HEIGHT, screen):
             "Up Arrow twice  -  Double Jump"
         ]
         for control in movement_controls:
-            text_surf = font_normal.render(control, True, (230, 230, 230))
-            text_surf.set_alpha(fade_alpha)
+            text_surf = fonts.render(font_normal, control, (230, 230, 230), alpha=fade_alpha)
             screen.blit(text_surf, (WIDTH // 2 - 200, y_offset))
             y_offset += 28
         
         y_offset += 15
         
         # === COMBAT SECTION ===
-        section_surf = font_section.render("COMBAT:", True, (255, 150, 150))
-        section_surf.set_alpha(fade_alpha)
+        section_surf = fonts.render(font_section, "COMBAT:", (255, 150, 150), alpha=fade_alpha)
         screen.blit(section_surf, (WIDTH // 2 - 230, y_offset))
         y_offset += 33
         
@@ -1053,16 +973,14 @@ def run_level2_tutorial(WIDTH, HEIGHT, screen):
             "Hold C  -  Charge Shot"
         ]
         for control in combat_controls:
-            text_surf = font_normal.render(control, True, (230, 230, 230))
-            text_surf.set_alpha(fade_alpha)
+            text_surf = fonts.render(font_normal, control, (230, 230, 230), alpha=fade_alpha)
             screen.blit(text_surf, (WIDTH // 2 - 200, y_offset))
             y_offset += 28
         
         y_offset += 15
         
         # === POWERUPS SECTION ===
-        section_surf = font_section.render("POWERUPS - Mushrooms:", True, (150, 255, 180))
-        section_surf.set_alpha(fade_alpha)
+        section_surf = fonts.render(font_section, "POWERUPS - Mushrooms:", (150, 255, 180), alpha=fade_alpha)
         screen.blit(section_surf, (WIDTH // 2 - 230, y_offset))
         y_offset += 33
         
@@ -1075,8 +993,7 @@ def run_level2_tutorial(WIDTH, HEIGHT, screen):
             "Forest Wisdom  -  Special ability"
         ]
         for powerup in powerups:
-            text_surf = font_normal.render(powerup, True, (230, 230, 230))
-            text_surf.set_alpha(fade_alpha)
+            text_surf = fonts.render(font_normal, powerup, (230, 230, 230), alpha=fade_alpha)
             screen.blit(text_surf, (WIDTH // 2 - 200, y_offset))
             y_offset += 26
         
@@ -1086,8 +1003,7 @@ def run_level2_tutorial(WIDTH, HEIGHT, screen):
         prompt_color = (min(255, pulse_brightness + 150), 
                     min(255, pulse_brightness + 200), 
                     min(255, pulse_brightness + 100))
-        prompt_surf = font_prompt.render("Press SPACE to begin!", True, prompt_color)
-        prompt_surf.set_alpha(fade_alpha)
+        prompt_surf = fonts.render(font_prompt, "Press SPACE to begin!", prompt_color, alpha=fade_alpha)
         prompt_rect = prompt_surf.get_rect(center=(WIDTH // 2, y_offset))
         screen.blit(prompt_surf, prompt_rect)
         
@@ -1151,8 +1067,8 @@ def run_level2_intro(WIDTH, HEIGHT, screen):
 
 def run_victory_screen(WIDTH, HEIGHT, screen):
     """Victory/End screen when player wins with animated mushroom"""
-    font_title = pygame.font.Font("assets/yoster.ttf", 48)
-    font_normal = pygame.font.Font("assets/yoster.ttf", 24)
+    font_title = fonts.get(fonts.DEFAULT_FONT, 48)
+    font_normal = fonts.get(fonts.DEFAULT_FONT, 24)
     
     # Load the victory mushroom sprite (bottom row, second from left = row 2, column 1)
     try:
@@ -1188,7 +1104,7 @@ def run_victory_screen(WIDTH, HEIGHT, screen):
         animation_timer += dt
         
         # Draw victory text
-        title = font_title.render("VICTORY!", True, (255, 255, 0))
+        title = fonts.render(font_title, "VICTORY!", (255, 255, 0))
         title_rect = title.get_rect(center=(WIDTH//2, HEIGHT//2 - 150))
         screen.blit(title, title_rect)
         
@@ -1232,11 +1148,11 @@ def run_victory_screen(WIDTH, HEIGHT, screen):
                                mushroom_center_y - scaled_height // 2)
                 screen.blit(scaled_mushroom, mushroom_pos)
         
-        subtext = font_normal.render("The magic mushroom has purified the world! Corruption is no more!", True, (255, 255, 255))
+        subtext = fonts.render(font_normal, "The magic mushroom has purified the world! Corruption is no more!", (255, 255, 255))
         subtext_rect = subtext.get_rect(center=(WIDTH//2, HEIGHT//2 + 80))
         screen.blit(subtext, subtext_rect)
         
-        prompt = font_normal.render("Press any key to continue...", True, (200, 200, 200))
+        prompt = fonts.render(font_normal, "Press any key to continue...", (200, 200, 200))
         prompt_rect = prompt.get_rect(center=(WIDTH//2, HEIGHT//2 + 130))
         screen.blit(prompt, prompt_rect)
         
@@ -1252,23 +1168,23 @@ def run_victory_screen(WIDTH, HEIGHT, screen):
 
 def run_defeat_screen(WIDTH, HEIGHT, screen):
     """Defeat screen when player loses"""
-    font_title = pygame.font.Font("assets/yoster.ttf", 48)
-    font_normal = pygame.font.Font("assets/yoster.ttf", 24)
+    font_title = fonts.get(fonts.DEFAULT_FONT, 48)
+    font_normal = fonts.get(fonts.DEFAULT_FONT, 24)
     
     running = True
     while running:
         screen.fill((0, 0, 0))
         
         # Draw defeat text
-        title = font_title.render("DEFEATED!", True, (255, 50, 50))
+        title = fonts.render(font_title, "DEFEATED!", (255, 50, 50))
         title_rect = title.get_rect(center=(WIDTH//2, HEIGHT//2 - 100))
         screen.blit(title, title_rect)
         
-        subtext = font_normal.render("Red Riding Hood has fallen... the corruption spreads unchecked...", True, (255, 200, 200))
+        subtext = fonts.render(font_normal, "Red Riding Hood has fallen... the corruption spreads unchecked...", (255, 200, 200))
         subtext_rect = subtext.get_rect(center=(WIDTH//2, HEIGHT//2))
         screen.blit(subtext, subtext_rect)
         
-        prompt = font_normal.render("Press any key to continue...", True, (200, 200, 200))
+        prompt = fonts.render(font_normal, "Press any key to continue...", (200, 200, 200))
         prompt_rect = prompt.get_rect(center=(WIDTH//2, HEIGHT//2 + 100))
         screen.blit(prompt, prompt_rect)
         
@@ -0,0 +1,261 @@
+"""
+Collision and physics micro-benchmarks.
+
+Each case calls one of the hot per-frame collision routines in isolation,
+on a synthetic obstacle set, and reports calls per second and allocations
+per call - a fixed yardstick for collision and physics changes:
+
+    python microbench.py                                  # every case at 100, 1000 and 5000 obstacles
+    python microbench.py arrow_update --obstacles 2000 --density 0.3 --json out.json
+
+Obstacle sets are plain blocks on a 20-row tile grid: a floor row, then
+blocks scattered over the rows above until `count` are placed. `density` is
+the fraction of grid cells that are solid, so it sets how wide the grid is.
+They are listed row by row, the order load_tilemap() produces, so early-exit
+loops find the floor as late as they would in a real level.
+
+Every step first puts its body back where the case started, so each call
+does the same work. Allocations come from a separate tracemalloc pass:
+peak bytes above the baseline during one call (a loop that allocates and
+drops a rect per obstacle shows as a single rect), and net memory blocks.
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import contextlib
+import json
+import math
+import random
+import sys
+import timeit
+import tracemalloc
+
+import pygame
+
+from benchmark import REPORT_VERSION, environment
+
+TILE_SIZE = 32
+ROWS = 20
+FLOOR_Y = (ROWS - 2) * TILE_SIZE
+START_X = 100
+SIZES = (100, 1000, 5000)
+DENSITY = 0.15
+
+
+def make_obstacles(count, density=DENSITY, seed=0):
+    """`count` blocks on a grid `density` full: the floor first, the rest scattered above it."""
+    from blocks import block
+
+    floor_row = FLOOR_Y // TILE_SIZE
+    usable_rows = floor_row - 1  # The floor row plus rows 2..floor_row-1
+    columns = max(1, math.ceil(count / (density * usable_rows)))
+    cells = {(x, floor_row) for x in range(min(columns, count))}
+    rng = random.Random(seed)
+    while len(cells) < count:
+        cells.add((rng.randrange(columns), rng.randrange(2, floor_row)))
+    return [block(x * TILE_SIZE, y * TILE_SIZE) for x, y in sorted(cells, key=lambda cell: (cell[1], cell[0]))]
+
+
+# ===== Cases =====
+# Each takes the obstacle list and returns a zero-argument step to time
+
+def _player():
+    from entities import mainCharacter
+    player = mainCharacter(START_X, 0)
+    player.rect.bottom = FLOOR_Y
+    return player
+
+
+def player_check_collision(obstacles):
+    """mainCharacter.check_collision: landing on the floor after a gravity step."""
+    player = _player()
+    landed = player.rect.y
+
+    def step():
+        player.rect.y = landed + 4
+        player.y_velocity = 4
+        player.on_ground = False
+        player.check_collision(obstacles)
+    return step
+
+
+def player_move(obstacles):
+    """mainCharacter.move: a walking step each way plus the downward probe into the floor."""
+    player = _player()
+    x, y = player.rect.topleft
+
+    def step():
+        player.rect.topleft = (x, y)
+        player.move(4, 1, obstacles)
+    return step
+
+
+def _enemy():
+    from Level1Enemies import Level1Enemy
+    enemy = Level1Enemy(START_X, 0)
+    enemy.rect.bottom = FLOOR_Y
+    return enemy
+
+
+def enemy_vertical_collision(obstacles):
+    """Level1Enemy.check_vertical_collision: standing on the floor (both scans run)."""
+    enemy = _enemy()
+    y = enemy.rect.y
+
+    def step():
+        enemy.rect.y = y
+        enemy.y_velocity = 0
+        enemy.on_ground = True
+        enemy.check_vertical_collision(obstacles)
+    return step
+
+
+def enemy_ground_ahead(obstacles):
+    """Level1Enemy.check_ground_ahead: the edge probe a patrolling enemy makes every step."""
+    enemy = _enemy()
+
+    def step():
+        enemy.check_ground_ahead(2, obstacles)
+    return step
+
+
+def arrow_update(obstacles):
+    """Arrow.update: one flight step through open air."""
+    from Level1Enemies import Arrow
+    arrow = Arrow(START_X, TILE_SIZE, True, ttl_ms=10 ** 9)
+
+    def step():
+        arrow.rect.x = START_X
+        arrow.alive = True
+        arrow.update(obstacles)
+    return step
+
+
+def boss_projectile_update(obstacles):
+    """BossProjectile.update: one flight step through open air, trail included."""
+    from BossEnemy import BossProjectile
+    projectile = BossProjectile(START_X, TILE_SIZE, START_X + 800, TILE_SIZE)
+
+    def step():
+        projectile.x, projectile.y = projectile.start_x, projectile.start_y
+        projectile.alive = True
+        projectile.update(1.0, obstacles)
+    return step
+
+
+def projectile_collisions(obstacles):
+    """handle_projectile_collisions: 8 player shots in the air, 10 enemies, the obstacles as blocks."""
+    from weapons.projectiles import PlayerProjectile, ProjectileManager
+    from weapons.weapons import handle_projectile_collisions
+
+    player = _player()
+    manager = ProjectileManager()
+    for i in range(8):
+        manager.add_projectile(PlayerProjectile(START_X + i * 40, TILE_SIZE, 1))
+    enemies = [_enemy() for _ in range(10)]
+    for i, enemy in enumerate(enemies):
+        enemy.rect.x = START_X + 400 + i * 80
+
+    def step():
+        for projectile in manager.projectiles:
+            projectile.active = True
+        handle_projectile_collisions(manager, player, enemies, obstacles)
+    return step
+
+
+CASES = {
+    "player_check_collision": player_check_collision,
+    "player_move": player_move,
+    "enemy_vertical_collision": enemy_vertical_collision,
+    "enemy_ground_ahead": enemy_ground_ahead,
+    "arrow_update": arrow_update,
+    "boss_projectile_update": boss_projectile_update,
+    "projectile_collisions": projectile_collisions,
+}
+
+
+# ===== Measuring =====
+
+def calls_per_second(step, repeat=3):
+    """Best of `repeat` timeit runs, each long enough (>= 0.2 s) to trust."""
+    timer = timeit.Timer(step)
+    number, _ = timer.autorange()
+    return number / min(timer.repeat(repeat, number))
+
+
+def allocations(step, calls=200):
+    """Mean peak bytes and net memory blocks per call, under tracemalloc."""
+    step()  # First call may fill caches
+    peak = 0
+    tracemalloc.start()
+    try:
+        blocks = sys.getallocatedblocks()
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            step()
+            peak += tracemalloc.get_traced_memory()[1] - base
+        blocks = sys.getallocatedblocks() - blocks
+    finally:
+        tracemalloc.stop()
+    return peak / calls, blocks / calls
+
+
+def run_case(name, count, density=DENSITY, seed=0):
+    obstacles = make_obstacles(count, density, seed)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        step = CASES[name](obstacles)
+        rate = calls_per_second(step)
+        peak, blocks = allocations(step)
+    return {
+        "calls_per_s": round(rate),
+        "us_per_call": round(1e6 / rate, 3),
+        "peak_bytes_per_call": round(peak, 1),
+        "net_blocks_per_call": round(blocks, 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Shroomlight collision and physics micro-benchmarks")
+    parser.add_argument("cases", nargs="*", help=f"cases to run (default: all of {', '.join(CASES)})")
+    parser.add_argument("--obstacles", type=int, nargs="+", default=list(SIZES), metavar="N",
+                        help="obstacle set sizes to run each case against")
+    parser.add_argument("--density", type=float, default=DENSITY, help="fraction of grid cells that are solid, 0..1")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="write the report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+    if not 0 < args.density <= 1:
+        parser.error("--density must be in (0, 1]")
+
+    pygame.init()
+    pygame.display.set_mode((960, 640))
+    report = {"version": REPORT_VERSION, "environment": environment(), "density": args.density,
+              "seed": args.seed, "cases": {}}
+    for name in args.cases or list(CASES):
+        report["cases"][name] = {}
+        for count in args.obstacles:
+            result = run_case(name, count, args.density, args.seed)
+            report["cases"][name][str(count)] = result
+            print(f"⏱️ {name:26s} {count:6d} obstacles  {result['calls_per_s']:>10,d} calls/s"
+                  f"  {result['us_per_call']:9.2f} us  {result['peak_bytes_per_call']:7.1f} B peak"
+                  f"  {result['net_blocks_per_call']:+.2f} blocks", file=sys.stderr)
+    pygame.quit()
+
+    text = json.dumps(report, indent=2)
+    if args.json:
+        with open(args.json, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Typed object pools for short-lived combat objects.
+
+Arrows, projectiles and effect particles used to be constructed on every
+shot, slash or dash frame and dropped the moment they died, so a busy fight
+allocated - and garbage collected - hundreds of small objects a second.
+Pooled classes keep their set-up in a reset() method that __init__ calls;
+acquire() re-runs reset() on an instance an earlier spawn released and only
+constructs a new one when the pool is empty.
+
+There is one pool per class. Its capacity caps how many released instances
+are kept for reuse; anything released beyond that is left to the GC. Only
+instances that came from acquire() are taken back: release() ignores
+anything constructed directly (an EnemyProjectile, say), so a pool never
+fills up with a class nobody acquires.
+"""
+
+DEFAULT_CAPACITY = 32
+
+# Class name -> released instances kept for reuse, sized for the busiest fights
+POOL_CAPACITY = {
+    "Arrow": 32,
+    "PlayerProjectile": 16,
+    "ChargedProjectile": 8,
+    "BossProjectile": 48,
+    "BoneParticle": 32,
+    "PoisonCloudParticle": 16,
+    "TeleportParticle": 48,
+    "DashTrailParticle": 64,
+    "DoubleJumpParticle": 32,
+}
+
+
+class ObjectPool:
+    """Released instances of one class, handed back out by acquire()."""
+
+    def __init__(self, cls, capacity=DEFAULT_CAPACITY):
+        self.cls = cls
+        self.capacity = capacity
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args, **kwargs):
+        """An instance set up as cls(*args, **kwargs) would be, recycled when possible."""
+        if self.free:
+            obj = self.free.pop()
+            obj._pooled = False
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+            return obj
+        self.created += 1
+        obj = self.cls(*args, **kwargs)
+        obj._pooled = False  # Handed out by acquire(): release() may take it back
+        return obj
+
+    def release(self, obj):
+        """Hand a dead object back; the caller must not touch it afterwards."""
+        if getattr(obj, "_pooled", True) or len(self.free) >= self.capacity:
+            return
+        obj._pooled = True
+        self.free.append(obj)
+
+    def stats(self):
+        return {"free": len(self.free), "created": self.created, "reused": self.reused}
+
+
+_pools = {}  # class -> ObjectPool
+
+
+def pool(cls):
+    """The pool for cls, created with its POOL_CAPACITY entry the first time."""
+    p = _pools.get(cls)
+    if p is None:
+        p = _pools[cls] = ObjectPool(cls, POOL_CAPACITY.get(cls.__name__, DEFAULT_CAPACITY))
+    return p
+
+
+def acquire(cls, *args, **kwargs):
+    return pool(cls).acquire(*args, **kwargs)
+
+
+def release(obj):
+    p = _pools.get(type(obj))
+    if p is not None:  # No pool: the class is never acquired, so nothing to take back
+        p.release(obj)
+
+
+def stats():
+    """Per class name: free instances, constructions and reuses so far."""
+    return {cls.__name__: p.stats() for cls, p in _pools.items()}
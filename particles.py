@@ -69,6 +69,10 @@ class ScreenDropletParticle:
 class DashTrailParticle(Particle):
     """Blue trail particle for dash effect"""
     def __init__(self, x, y, direction):
+        self.reset(x, y, direction)
+
+    def reset(self, x, y, direction):
+        """(Re)initialise - called by __init__ and when reused from object_pool"""
         super().__init__(x, y)
         # Store as relative position from player center
         self.relative_x = 0
@@ -109,6 +113,9 @@ class DashTrailParticle(Particle):
 class DoubleJumpParticle(Particle):
     """Smoke/cloud particle for double jump effect"""
     def __init__(self, x, y):
+        self.reset(x, y)
+
+    def reset(self, x, y):
         super().__init__(x, y)
         # Store as relative position from player
         self.relative_x = random.uniform(-10, 10)
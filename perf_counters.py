@@ -0,0 +1,120 @@
+"""
+Per-frame engine counters for the debug overlay.
+
+Subsystems add to named counters (perf_counters.add("rect_tests", n)); the
+level loop calls end_frame() once per frame, which keeps that frame's
+numbers in `last_frame` for draw_debug_info() and starts from zero again.
+They answer "was that slow frame 3,000 blits or 30,000 rect tests?".
+
+Counting is switched on with the debug overlay (B). While it is off nothing
+is wrapped, and call sites check `perf_counters.enabled` outside their
+loops, so the cost is one attribute test per collision scan. While on:
+- the level draws into a CountingSurface that tallies blits and fills, and
+  display.flip() copies it to the screen first,
+- pygame.draw.*, pygame.transform.* and pygame.image.load are wrapped,
+- fonts.render counts cache misses.
+pygame.Surface() and Surface.copy() are C and can't be wrapped, so
+"surfaces" counts the ones made by transforms, loads and font renders.
+"""
+
+import pygame
+
+enabled = False
+counts = {}         # name -> count so far this frame
+last_frame = {}     # The previous frame's counts, for the overlay
+
+TRANSFORMS = ("scale", "scale_by", "smoothscale", "smoothscale_by", "flip", "rotate",
+              "rotozoom", "scale2x", "chop", "laplacian")
+DRAWS = ("rect", "circle", "ellipse", "line", "lines", "aaline", "aalines", "polygon", "arc")
+
+_originals = []     # (module, name, original, wrapper) replaced while enabled
+_target = None      # CountingSurface the level draws into
+_display = None     # The surface _target is presented to
+
+
+def add(name, n=1):
+    counts[name] = counts.get(name, 0) + n
+
+
+class CountingSurface(pygame.Surface):
+    """Offscreen stand-in for the display that counts what is drawn onto it."""
+
+    def blit(self, *args, **kwargs):
+        counts["blits"] = counts.get("blits", 0) + 1
+        return super().blit(*args, **kwargs)
+
+    def blits(self, blit_sequence, *args, **kwargs):
+        blit_sequence = list(blit_sequence)
+        add("blits", len(blit_sequence))
+        return super().blits(blit_sequence, *args, **kwargs)
+
+    def fill(self, *args, **kwargs):
+        add("fills")
+        return super().fill(*args, **kwargs)
+
+
+def target(screen):
+    """The surface to draw this frame into: `screen`, or its counting stand-in while enabled."""
+    global _target, _display
+    if not enabled:
+        return screen
+    if _target is None or _target.get_size() != screen.get_size():
+        _target = CountingSurface(screen.get_size(), 0, screen)
+    _display = screen
+    return _target
+
+
+def _counting(func, *names):
+    def wrapper(*args, **kwargs):
+        for name in names:
+            counts[name] = counts.get(name, 0) + 1
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def _presenting(func):
+    def wrapper(*args, **kwargs):
+        if _display is not None and _target is not None:
+            _display.blit(_target, (0, 0))
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def _wrap(module, name, wrapper, *args):
+    func = getattr(module, name, None)
+    if func is not None:
+        wrapped = wrapper(func, *args)
+        _originals.append((module, name, func, wrapped))
+        setattr(module, name, wrapped)
+
+
+def set_enabled(on):
+    """Switch counting (and the wrappers it needs) on or off."""
+    global enabled, counts, last_frame, _target, _display
+    if on == enabled:
+        return
+    enabled = on
+    counts, last_frame = {}, {}
+    if on:
+        for name in DRAWS:
+            _wrap(pygame.draw, name, _counting, "draws")
+        for name in TRANSFORMS:
+            _wrap(pygame.transform, name, _counting, "surfaces")
+        _wrap(pygame.image, "load", _counting, "image_loads", "surfaces")
+        _wrap(pygame.display, "flip", _presenting)
+        _wrap(pygame.display, "update", _presenting)
+    else:
+        for module, name, func, wrapped in reversed(_originals):
+            # Leave it alone if someone else has replaced it since (benchmark's render timing)
+            if getattr(module, name) is wrapped:
+                setattr(module, name, func)
+        _originals.clear()
+        _target = _display = None
+
+
+def end_frame():
+    """Keep this frame's counts for the overlay and start the next frame from zero."""
+    global counts, last_frame
+    if not enabled:
+        return
+    last_frame, counts = counts, {}
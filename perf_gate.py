@@ -0,0 +1,175 @@
+"""
+Performance regression gate.
+
+Compares a benchmark.py run against a stored baseline and fails when any
+tracked metric got worse by more than its tolerance, so an optimization to
+draw_tilemap, collision or particles can't be quietly undone later.
+
+    python perf_gate.py --update            # record perf_baseline.json on this machine
+    python perf_gate.py                     # run the benchmarks, compare, exit 1 on regression
+    python perf_gate.py --report out.json   # compare an existing benchmark.py report instead
+
+Baselines are per machine: record one where the gate runs. The file holds
+BASELINE_VERSION, the benchmark REPORT_VERSION, the environment, the frame
+count and per scenario only the metrics in TOLERANCES; a baseline written by
+another version is rejected rather than misread.
+
+A metric regresses when it is above the baseline by more than both its
+relative tolerance and its absolute floor - the floor keeps sub-millisecond
+noise on fast scenarios from failing the gate.
+"""
+
+import argparse
+import json
+import sys
+
+import benchmark
+
+BASELINE_VERSION = 1
+BASELINE_PATH = "perf_baseline.json"
+FRAMES = 600
+
+# metric path -> (relative tolerance, absolute floor, unit); lower is better for all of them
+TOLERANCES = {
+    "frame_ms.p50": (0.10, 0.5, "ms"),
+    "frame_ms.p95": (0.15, 1.0, "ms"),
+    "frame_ms.p99": (0.25, 2.0, "ms"),
+    "update_ms.p50": (0.15, 0.3, "ms"),
+    "render_ms.p50": (0.15, 0.3, "ms"),
+    "load_s": (0.25, 0.05, "s"),
+    "surface_bytes": (0.05, 64 * 1024, "B"),
+    "alloc.peak_bytes_per_frame.p50": (0.20, 4096, "B"),
+    "alloc.net_blocks_per_frame.mean": (0.0, 2.0, "blocks"),
+}
+
+
+def metrics(result):
+    """The TOLERANCES metrics out of one scenario's benchmark result."""
+    values = {}
+    for path in TOLERANCES:
+        value = result
+        for part in path.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        if value is not None:
+            values[path] = value
+    return values
+
+
+def baseline_from(report, frames):
+    return {
+        "version": BASELINE_VERSION,
+        "report_version": report["version"],
+        "environment": report["environment"],
+        "frames": frames,
+        "scenarios": {name: metrics(result) for name, result in report["scenarios"].items()},
+    }
+
+
+def load_baseline(path):
+    with open(path) as f:
+        baseline = json.load(f)
+    if baseline.get("version") != BASELINE_VERSION or baseline.get("report_version") != benchmark.REPORT_VERSION:
+        raise ValueError(f"{path} was written by another version (baseline {baseline.get('version')}, "
+                         f"report {baseline.get('report_version')}); re-record it with --update")
+    return baseline
+
+
+def compare(baseline, report):
+    """(rows, regressions): one row per scenario metric, as (scenario, metric, old, new, limit, verdict)."""
+    rows, regressions = [], []
+    for name, result in report["scenarios"].items():
+        old_values = baseline["scenarios"].get(name)
+        if old_values is None:
+            rows.append((name, "-", None, None, None, "no baseline"))
+            continue
+        for metric, new in metrics(result).items():
+            old = old_values.get(metric)
+            if old is None:
+                rows.append((name, metric, None, new, None, "no baseline"))
+                continue
+            rel, floor, _ = TOLERANCES[metric]
+            limit = max(old * (1 + rel), old + floor)
+            if new > limit:
+                verdict = "REGRESSED"
+                regressions.append((name, metric))
+            elif new < old - (limit - old):
+                verdict = "better"
+            else:
+                verdict = "ok"
+            rows.append((name, metric, old, new, limit, verdict))
+    return rows, regressions
+
+
+def _fmt(value, unit):
+    if value is None:
+        return "-"
+    if unit == "B":
+        return f"{value / 1024:.1f} KB"
+    return f"{value:.3f} {unit}" if unit == "s" else f"{value:.2f} {unit}"
+
+
+def print_diff(rows):
+    print(f"{'scenario':22s} {'metric':34s} {'baseline':>12s} {'current':>12s} {'change':>8s} {'limit':>12s}")
+    for name, metric, old, new, limit, verdict in rows:
+        unit = TOLERANCES.get(metric, (0, 0, ""))[2]
+        change = f"{(new - old) / old * 100:+.1f}%" if old and new is not None else ""
+        mark = {"REGRESSED": "❌", "better": "✅", "ok": "  "}.get(verdict, "⚠️")
+        print(f"{name:22s} {metric:34s} {_fmt(old, unit):>12s} {_fmt(new, unit):>12s} {change:>8s} "
+              f"{_fmt(limit, unit):>12s} {mark} {verdict if verdict != 'ok' else ''}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fail when a benchmark metric regresses past its tolerance")
+    parser.add_argument("scenarios", nargs="*", help="scenarios to run (default: every one in the baseline, or all)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help=f"baseline file (default {BASELINE_PATH})")
+    parser.add_argument("--update", action="store_true", help="record the run as the new baseline instead of comparing")
+    parser.add_argument("--report", metavar="PATH", help="compare this benchmark.py JSON report instead of running")
+    parser.add_argument("--frames", type=int, help=f"measured frames per scenario (default: the baseline's, else {FRAMES})")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if not args.update:
+        try:
+            baseline = load_baseline(args.baseline)
+        except FileNotFoundError:
+            parser.error(f"no baseline at {args.baseline}; record one with --update")
+        except ValueError as e:
+            parser.error(str(e))
+
+    frames = args.frames or (baseline or {}).get("frames") or FRAMES
+    if args.report:
+        with open(args.report) as f:
+            report = json.load(f)
+    else:
+        names = args.scenarios or list((baseline or {}).get("scenarios") or benchmark.SCENARIOS)
+        unknown = [name for name in names if name not in benchmark.SCENARIOS]
+        if unknown:
+            parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+        benchmark.pygame.init()
+        benchmark.pygame.display.set_mode((benchmark.WIDTH, benchmark.HEIGHT))
+        report = benchmark.run_all(names, frames)
+        benchmark.pygame.quit()
+
+    if args.update:
+        with open(args.baseline, "w") as f:
+            json.dump(baseline_from(report, frames), f, indent=2)
+            f.write("\n")
+        print(f"✅ Baseline for {len(report['scenarios'])} scenarios written to {args.baseline}")
+        return
+
+    if baseline["frames"] != frames:
+        print(f"⚠️ Baseline was recorded over {baseline['frames']} frames, this run used {frames}")
+    if baseline["environment"] != report["environment"]:
+        print(f"⚠️ Baseline environment differs: {baseline['environment']}")
+
+    rows, regressions = compare(baseline, report)
+    print_diff(rows)
+    if regressions:
+        print(f"❌ {len(regressions)} metric(s) regressed: "
+              + ", ".join(f"{name} {metric}" for name, metric in regressions))
+        sys.exit(1)
+    print("✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
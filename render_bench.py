@@ -0,0 +1,276 @@
+"""
+Render-only benchmark: one frozen frame, drawn over and over.
+
+benchmark.py can only split a frame by call (blits vs everything else)
+because the game draws enemies and traps inside their update passes. This
+plays a scenario for a while, stops the simulation there and then redraws
+that exact frame - same positions, animation frames, particles, HUD -
+through the level's own draw methods, one stage at a time:
+
+    clear, background (parallax layers), leaves, tilemap, obstacles, traps,
+    enemies, arrows, powerups, player (with its effects and projectiles), hud
+
+Nothing advances between redraws: no update() is called, and
+pygame.time.get_ticks() is pinned to the snapshot so the pulsing glows,
+blinking and spark rings stay on the same frame. Each stage reports its
+time percentiles and what it drew (blits, fills, pygame.draw calls, font
+renders - via perf_counters.py). The background stage is also rerun with
+1..N parallax layers, so the cost of each extra layer is visible.
+
+    python render_bench.py                                      # every scenario at 960x640
+    python render_bench.py boss_hard_arena --sizes 960x640 1920x1080 --json out.json
+
+At other sizes the level is built and played at that size (backgrounds
+are scaled to it and culling uses its width), so the snapshot is of the
+same scenario as it would play in that window.
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import contextlib
+import json
+import sys
+import time
+
+import pygame
+
+import benchmark
+import perf_counters
+
+SIZES = ((960, 640),)
+ADVANCE = 300       # Frames played before the snapshot
+FRAMES = 300        # Redraws measured per size
+
+
+# ===== Stages =====
+
+def _clear(level, surface):
+    surface.fill((0, 0, 0))
+
+
+def _background(level, surface):
+    # draw_bg() without its leaf particles, which are their own stage
+    particles, level.leaf_particles = level.leaf_particles, []
+    try:
+        level.draw_bg()
+    finally:
+        level.leaf_particles = particles
+
+
+def _leaves(level, surface):
+    level.draw_leaf_particles()
+
+
+def _tilemap(level, surface):
+    level.draw_tilemap()
+
+
+def _obstacles(level, surface):
+    # update_obstacles() without the update: positions are already set for this scroll
+    for obstacle in level.obstacles:
+        obstacle.draw(surface)
+
+
+def _traps(level, surface):
+    lo, hi = level.window_bounds(level.trap_window, level.animated_traps)
+    for trap in level.animated_traps[lo:hi]:
+        surface.blit(trap.image, (trap.rect.x - level.ground_scroll, trap.rect.y))
+
+
+def _enemies(level, surface):
+    lo, hi = level.window_bounds(level.enemy_window, level.enemies)
+    for enemy in level.enemies[lo:hi]:
+        if enemy.alive:
+            enemy.draw(surface)
+
+
+def _arrows(level, surface):
+    for arrow in level.arrows:
+        arrow.draw(surface, scroll_offset=level.ground_scroll)
+
+
+def _powerups(level, surface):
+    if hasattr(level, "draw_powerups"):
+        level.draw_powerups()
+        return
+    lo, hi = level.window_bounds(level.powerup_window, level.powerups)
+    for powerup in level.powerups[lo:hi]:
+        powerup.draw(surface, level.ground_scroll)
+
+
+def _player(level, surface):
+    if level.player:
+        level.player.draw(surface)
+
+
+def _hud(level, surface):
+    level.update_lives()
+    level.draw_mushroom_count()
+    if getattr(level, "boss", None) is not None and level.boss.alive:
+        level.draw_boss_ui(surface)
+    if getattr(level, "level_complete", False):
+        level.draw_victory_message(surface)
+
+
+# name -> draw function(level, surface), in the run loops' order
+STAGES = {
+    "clear": _clear,
+    "background": _background,
+    "leaves": _leaves,
+    "tilemap": _tilemap,
+    "obstacles": _obstacles,
+    "traps": _traps,
+    "enemies": _enemies,
+    "arrows": _arrows,
+    "powerups": _powerups,
+    "player": _player,
+    "hud": _hud,
+}
+
+# HUD warnings count themselves down as they are drawn
+_COUNTDOWNS = ("level_gate_message_timer", "boss_gate_message_timer")
+
+
+# ===== Measuring =====
+
+def snapshot(name, size, advance=ADVANCE):
+    """Play scenario `name` at `size` for `advance` frames and return the level, stopped there."""
+    factory, script, _ = benchmark.SCENARIOS[name]
+    width, height = size
+    pygame.display.set_mode(size)
+    level, _, _, _ = benchmark.play((lambda: factory(width, height), script, advance), advance, warmup=0)
+    return level
+
+
+@contextlib.contextmanager
+def frozen_time():
+    """Pin pygame.time.get_ticks() so time-driven effects keep drawing the same frame."""
+    get_ticks = pygame.time.get_ticks
+    ticks = get_ticks()
+    pygame.time.get_ticks = lambda: ticks
+    try:
+        yield
+    finally:
+        pygame.time.get_ticks = get_ticks
+
+
+def draw_stage(level, surface, stage):
+    """Draw one stage; returns (ms, {counter: count})."""
+    perf_counters.counts = {}
+    countdowns = [(attr, getattr(level, attr)) for attr in _COUNTDOWNS if hasattr(level, attr)]
+    t = time.perf_counter()
+    STAGES[stage](level, surface)
+    ms = (time.perf_counter() - t) * 1000
+    for attr, value in countdowns:
+        setattr(level, attr, value)
+    return ms, perf_counters.counts
+
+
+def render(level, frames=FRAMES):
+    """Redraw the level's current frame `frames` times; returns per-stage timings and draw counts."""
+    surface = perf_counters.CountingSurface(pygame.display.get_surface().get_size(), 0,
+                                            pygame.display.get_surface())
+    level.screen = surface
+    timings = {stage: [] for stage in STAGES}
+    counts = {}
+    totals = []
+    perf_counters.set_enabled(True)
+    try:
+        with frozen_time():
+            for _ in range(frames):
+                total = 0.0
+                for stage in STAGES:
+                    ms, counts[stage] = draw_stage(level, surface, stage)
+                    timings[stage].append(ms)
+                    total += ms
+                totals.append(total)
+
+            # Parallax depth: the background stage with only the first n layers
+            layers = level.bg_images
+            parallax = []
+            try:
+                for n in range(1, len(layers) + 1):
+                    level.bg_images = layers[:n]
+                    parallax.append({"layers": n, "ms": benchmark.percentiles(
+                        [draw_stage(level, surface, "background")[0] for _ in range(frames)])["p50"]})
+            finally:
+                level.bg_images = layers
+    finally:
+        perf_counters.set_enabled(False)
+
+    return {
+        "frame_ms": benchmark.percentiles(totals),
+        "stages": {stage: {"ms": benchmark.percentiles(timings[stage]), "counts": counts[stage]}
+                   for stage in STAGES},
+        "parallax": parallax,
+    }
+
+
+def run(name, size, advance=ADVANCE, frames=FRAMES, verbose=False):
+    with open(os.devnull, "w") as devnull, \
+            (contextlib.nullcontext() if verbose else contextlib.redirect_stdout(devnull)):
+        level = snapshot(name, size, advance)
+        result = render(level, frames)
+    result["scroll"] = level.ground_scroll
+    return result
+
+
+def print_result(name, size, result):
+    print(f"🎨 {name} at {size[0]}x{size[1]}: p50 {result['frame_ms']['p50']:.2f} ms"
+          f"  p95 {result['frame_ms']['p95']:.2f} ms per redraw (scroll {result['scroll']:.0f})", file=sys.stderr)
+    for stage, stats in result["stages"].items():
+        counts = "  ".join(f"{key} {value}" for key, value in sorted(stats["counts"].items()))
+        print(f"   {stage:12s} {stats['ms']['p50']:7.3f} ms  {counts}", file=sys.stderr)
+    print("   parallax     " + "  ".join(f"{point['layers']}: {point['ms']:.2f}" for point in result["parallax"])
+          + " ms", file=sys.stderr)
+
+
+def _size(text):
+    try:
+        width, height = (int(value) for value in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got {text!r}")
+    return width, height
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Shroomlight render-only benchmark on a frozen frame")
+    parser.add_argument("scenarios", nargs="*",
+                        help=f"scenarios to snapshot (default: all of {', '.join(benchmark.SCENARIOS)})")
+    parser.add_argument("--sizes", type=_size, nargs="+", default=list(SIZES), metavar="WxH",
+                        help="window sizes to build, play and render each scenario at")
+    parser.add_argument("--advance", type=int, default=ADVANCE, help="frames played before the snapshot")
+    parser.add_argument("--frames", type=int, default=FRAMES, help="redraws measured per size")
+    parser.add_argument("--json", metavar="PATH", help="write the report here instead of stdout")
+    parser.add_argument("--verbose", action="store_true", help="keep the game's own console output")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.scenarios if name not in benchmark.SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    pygame.init()
+    report = {"version": benchmark.REPORT_VERSION, "environment": benchmark.environment(),
+              "advance": args.advance, "frames": args.frames, "scenarios": {}}
+    for name in args.scenarios or list(benchmark.SCENARIOS):
+        report["scenarios"][name] = {}
+        for size in args.sizes:
+            result = run(name, size, args.advance, args.frames, args.verbose)
+            report["scenarios"][name][f"{size[0]}x{size[1]}"] = result
+            print_result(name, size, result)
+    pygame.quit()
+
+    text = json.dumps(report, indent=2)
+    if args.json:
+        with open(args.json, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Sampling profiler for live play.
+
+cProfile hooks every call and slows the frame loop until the game no longer
+plays like itself. This instead runs a background thread that, RATE_HZ
+times a second, reads the main thread's current stack from
+sys._current_frames() and counts it under the scene being played (menu,
+Level1, Level2, FinalBossLevel). The game itself runs untouched; the cost
+is the sampler thread taking the GIL for a few microseconds per sample.
+
+A waking thread gets the GIL at the main thread's next release - a C call
+that drops it (transform.rotate does, blit doesn't) or the forced switch
+after sys.getswitchinterval() (5 ms). Left alone, samples pile up on the
+first GIL-releasing call after each wake-up, so while sampling the switch
+interval is cut to SWITCH_INTERVAL_S and a sample lands where the main
+thread actually is.
+
+    python main.py --profile                  # 100 Hz
+    python main.py --profile --profile-rate 250
+
+On exit the samples are written in the collapsed-stack format flamegraph.pl,
+speedscope and inferno read ("outer;inner;leaf count" per line), one file
+per scene plus all.collapsed with the scene as the root frame, under
+OUT_DIR. Only Python frames are seen, so time in C (a blit, a transform)
+counts toward the function that called it; time waiting in clock.tick()
+shows up the same way, so idle frames are visible too.
+"""
+
+import atexit
+import os
+import sys
+import threading
+import time
+
+RATE_HZ = 100
+MAX_DEPTH = 64
+SWITCH_INTERVAL_S = 0.0002
+OUT_DIR = os.path.join(".cache", "profiles")
+
+_scene = "menu"
+_stacks = {}        # scene -> {collapsed stack: samples}
+_labels = {}        # code object -> frame label
+_thread = None
+_stop = threading.Event()
+_started = None
+_switch_interval = None
+
+
+def _label(code):
+    label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    _labels[code] = label
+    return label
+
+
+def _sample(main_id, interval):
+    while not _stop.wait(interval):
+        frame = sys._current_frames().get(main_id)
+        stack = []
+        while frame is not None and len(stack) < MAX_DEPTH:
+            code = frame.f_code
+            stack.append(_labels.get(code) or _label(code))
+            frame = frame.f_back
+        del frame
+        if stack:
+            key = ";".join(reversed(stack))
+            counts = _stacks.setdefault(_scene, {})
+            counts[key] = counts.get(key, 0) + 1
+
+
+def start(rate_hz=RATE_HZ):
+    """Start sampling the calling (main) thread; results are written at exit."""
+    global _thread, _started, _switch_interval
+    if _thread is not None:
+        return
+    _stop.clear()
+    _started = time.perf_counter()
+    _switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(SWITCH_INTERVAL_S)
+    _thread = threading.Thread(target=_sample, args=(threading.get_ident(), 1.0 / rate_hz),
+                               name="sampling-profiler", daemon=True)
+    _thread.start()
+    atexit.register(stop)
+    print(f"📊 Sampling profiler on at {rate_hz} Hz")
+
+
+def is_running():
+    return _thread is not None
+
+
+def set_scene(name):
+    """Samples from now on are counted under `name`."""
+    global _scene
+    _scene = name
+
+
+def stop(out_dir=None):
+    """Stop sampling and write the collapsed stacks; returns {scene: path}."""
+    global _thread
+    if _thread is None:
+        return {}
+    _stop.set()
+    _thread.join()
+    _thread = None
+    sys.setswitchinterval(_switch_interval)
+    return write(out_dir or OUT_DIR)
+
+
+def write(out_dir):
+    os.makedirs(out_dir, exist_ok=True)
+    paths = {}
+    total = 0
+    with open(os.path.join(out_dir, "all.collapsed"), "w") as combined:
+        for scene, counts in _stacks.items():
+            paths[scene] = os.path.join(out_dir, f"{scene}.collapsed")
+            with open(paths[scene], "w") as f:
+                for stack, n in sorted(counts.items()):
+                    f.write(f"{stack} {n}\n")
+                    combined.write(f"{scene};{stack} {n}\n")
+            total += sum(counts.values())
+
+    elapsed = time.perf_counter() - _started if _started else 0.0
+    print(f"📊 {total} samples over {elapsed:.0f} s written to {out_dir}")
+    for scene, counts in _stacks.items():
+        print(f"   {scene}: {sum(counts.values())} samples, hottest: "
+              + ", ".join(f"{leaf} {n}" for leaf, n in hottest(counts, 3)))
+    return paths
+
+
+def hottest(counts, top=10):
+    """The `top` leaf frames by self samples."""
+    leaves = {}
+    for stack, n in counts.items():
+        leaf = stack.rsplit(";", 1)[-1]
+        leaves[leaf] = leaves.get(leaf, 0) + n
+    return sorted(leaves.items(), key=lambda item: -item[1])[:top]
@@ -0,0 +1,158 @@
+"""
+Sound effect bank.
+
+entities.py used to call pygame.mixer.init() and decode every sound effect
+at import time, so merely importing game code (as main.py, the enemy modules
+and the tools all do) touched the audio device and the disk before a window
+existed. Sounds are now listed here by name and decoded on first use (or
+preloaded during a level load).
+
+Decoded PCM is cached under .cache/sfx/ keyed by the source file and the
+mixer format, so later launches skip the MP3 decode entirely. Effects play
+on a small pool of reserved channels: when every channel is busy the
+lowest-priority, oldest voice is stolen, and a new sound that ranks below
+everything playing is dropped instead of queueing behind it.
+"""
+
+import hashlib
+import os
+
+import pygame
+
+import hitch_watch
+import startup_trace
+
+CACHE_DIR = os.path.join(".cache", "sfx")
+
+# Priorities: the player hearing they got hit matters more than one more arrow
+PRIORITY_LOW, PRIORITY_NORMAL, PRIORITY_HIGH = 0, 1, 2
+
+# name -> (file, volume, priority)
+SFX_MANIFEST = {
+    "fish_throw": ("assets/SFX/FishThrow.mp3", 0.3, PRIORITY_NORMAL),
+    "scratch": ("assets/SFX/ScratchAttack.mp3", 0.3, PRIORITY_NORMAL),
+    "player_hurt": ("assets/SFX/playerhurt.mp3", 1.0, PRIORITY_HIGH),
+    "archer_shoot": ("assets/SFX/ArcherShoot.mp3", 0.3, PRIORITY_LOW),
+}
+
+
+def _cache_path(file):
+    """Cache file for `file`'s decoded PCM in the current mixer format."""
+    stat = os.stat(file)
+    key = f"{os.path.abspath(file)}|{stat.st_mtime_ns}|{stat.st_size}|{pygame.mixer.get_init()}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    name = os.path.splitext(os.path.basename(file))[0]
+    return os.path.join(CACHE_DIR, f"{name}-{digest}.pcm")
+
+
+def _decode(file):
+    """Return a Sound for file, from the PCM cache when possible."""
+    try:
+        path = _cache_path(file)
+    except OSError:
+        path = None
+
+    if path and os.path.exists(path):
+        with open(path, "rb") as f:
+            return pygame.mixer.Sound(buffer=f.read())
+
+    sound = pygame.mixer.Sound(file)
+    if path:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(sound.get_raw())
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"⚠️ Could not cache sound {file}: {e}")
+    return sound
+
+
+class SoundBank:
+    """Decoded sound effects played through a reserved, prioritised channel pool."""
+
+    def __init__(self, manifest, pool_size=4):
+        self.manifest = manifest
+        self.pool_size = pool_size
+        self.sounds = {}        # name -> Sound, or None if it could not be loaded
+        self.channels = []      # Reserved pygame Channels, created with the mixer
+        self.voices = []        # Per channel: (priority, start tick) of what it last played
+
+    def _init_mixer(self):
+        if self.channels:
+            return True
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            if pygame.mixer.get_num_channels() < self.pool_size:
+                pygame.mixer.set_num_channels(self.pool_size)
+            # Reserved channels are never handed out by Sound.play()/find_channel()
+            pygame.mixer.set_reserved(self.pool_size)
+        except pygame.error as e:
+            print(f"⚠️ Pygame mixer unavailable: {e}")
+            return False
+        self.channels = [pygame.mixer.Channel(i) for i in range(self.pool_size)]
+        self.voices = [(PRIORITY_LOW, 0)] * self.pool_size
+        return True
+
+    def get(self, name):
+        """Return the Sound for name, loading it the first time it is asked for."""
+        if name in self.sounds:
+            return self.sounds[name]
+
+        file, volume, _ = self.manifest[name]
+        sound = None
+        if self._init_mixer():
+            try:
+                with startup_trace.timed("asset decode"), hitch_watch.loading("sound", name):
+                    sound = _decode(file)
+                sound.set_volume(volume)
+            except (pygame.error, OSError) as e:
+                print(f"⚠️ Could not load sound {name}: {e}")
+        self.sounds[name] = sound
+        return sound
+
+    def preload(self, *names):
+        """Decode sounds ahead of time (e.g. during level load) so first use doesn't hitch."""
+        for name in names or self.manifest:
+            self.get(name)
+
+    def play(self, name):
+        """Play name on a free pool channel, stealing a lower-priority voice if all are busy."""
+        sound = self.get(name)
+        if sound is None:
+            return None
+        priority = self.manifest[name][2]
+
+        index = None
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                index = i
+                break
+
+        if index is None:
+            # Steal the least important voice, oldest first among equals
+            index = min(range(len(self.channels)), key=lambda i: self.voices[i])
+            if self.voices[index][0] > priority:
+                return None
+
+        channel = self.channels[index]
+        channel.play(sound)
+        self.voices[index] = (priority, pygame.time.get_ticks())
+        return channel
+
+
+bank = SoundBank(SFX_MANIFEST)
+
+
+def get(name):
+    return bank.get(name)
+
+
+def preload(*names):
+    bank.preload(*names)
+
+
+def play(name):
+    return bank.play(name)
@@ -0,0 +1,88 @@
+"""
+Sorted spatial activation window.
+
+Keeps a level's world-space entities (enemies, traps, powerups) ordered by
+rect.left so the slice around the scrolled view can be found with bisect
+instead of testing every entity every frame.
+"""
+
+import bisect
+
+
+def _left(entity):
+    return entity.rect.left
+
+
+class SpatialWindow:
+    """Bisect-based x window over a list of entities with world-space rects.
+
+    The list itself stays the level's own list (self.enemies, self.powerups...)
+    and is only re-ordered in place, so other code holding a reference to it
+    keeps working.
+    """
+
+    def __init__(self, margin=0):
+        self.margin = margin    # Extra world px activated beyond each screen edge
+        self.items = None
+        self.keys = []
+        self.max_width = 0
+
+    def sync(self, items):
+        """Adopt `items`, sorting it in place if the list was replaced or resized elsewhere."""
+        if items is self.items and len(items) == len(self.keys):
+            return
+        items.sort(key=_left)
+        self.items = items
+        self.keys = [_left(entity) for entity in items]
+        self.max_width = max((entity.rect.width for entity in items), default=0)
+
+    def bounds(self, view_left, view_right, margin=None):
+        """Return the index range [lo, hi) of entities that may overlap the padded view."""
+        if margin is None:
+            margin = self.margin
+        lo = bisect.bisect_left(self.keys, view_left - margin - self.max_width)
+        hi = bisect.bisect_right(self.keys, view_right + margin, lo)
+        return lo, hi
+
+    def refresh(self, lo, hi):
+        """Re-key entities in [lo, hi) after they moved and restore the sort order.
+
+        Only visited entities move, and only by a few pixels per frame, so a
+        local insertion pass is enough to keep the whole list sorted.
+        """
+        items, keys = self.items, self.keys
+        for i in range(lo, hi):
+            keys[i] = _left(items[i])
+            width = items[i].rect.width
+            if width > self.max_width:
+                self.max_width = width
+
+        # Entities that moved left bubble down past their neighbours...
+        for i in range(max(lo, 1), hi):
+            j = i
+            while j > 0 and keys[j - 1] > keys[j]:
+                keys[j - 1], keys[j] = keys[j], keys[j - 1]
+                items[j - 1], items[j] = items[j], items[j - 1]
+                j -= 1
+
+        # ...and ones that moved right bubble up past the rest of the list
+        last = len(keys) - 1
+        for i in range(hi - 1, lo - 1, -1):
+            j = i
+            while j < last and keys[j] > keys[j + 1]:
+                keys[j + 1], keys[j] = keys[j], keys[j + 1]
+                items[j + 1], items[j] = items[j], items[j + 1]
+                j += 1
+
+    def prune(self, lo, hi, keep):
+        """Drop entities in [lo, hi) for which keep(entity) is false; returns the new hi."""
+        items, keys = self.items, self.keys
+        i = lo
+        while i < hi:
+            if keep(items[i]):
+                i += 1
+            else:
+                del items[i]
+                del keys[i]
+                hi -= 1
+        return hi
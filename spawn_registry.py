@@ -0,0 +1,250 @@
+"""
+Declarative spawn registry.
+
+Each level used to turn Tiled objects into entities with its own long
+if/elif chain, with hand-tuned offsets (obj.y - 32, obj.y - 96, ...) and
+per-level tweaks buried inline. Here a registry is just a dict mapping the
+Tiled `type` string to a SpawnEntry that says what to build, where relative
+to the object, which list it goes into and which attributes the level
+overrides. Game.load_spawns() walks the map once for every level.
+
+Entries marked `prototype=True` build one instance the normal way, keep a
+pristine copy in the level's spawn_prototypes, and clone it for every later
+spawn instead of re-running a constructor that loads sprite sheets from
+disk. A clone is a deep copy that shares only the loaded surfaces, sounds
+and fonts; Game.teardown() drops the prototypes with the level.
+"""
+
+import copy
+
+import pygame
+
+from Level1Enemies import BreakableBlock, Archer, Warrior, Mushroom
+from Level2Enemies import MushroomPickup, MutatedMushroom, Skeleton, FlyingEye
+from BossEnemy import EasyDungeonBoss, HardDungeonBoss
+from blocks import Spikes, Ice, end, EndWithDifficulty, AnimatedTrap, LightningTrap, FireTrap
+from level2_powerup_loader import create_level2_powerup_with_sprite, TILED_OBJECT_TO_POWERUP
+
+# Entry kinds that go through the lazy spawn table instead of being built at load
+LAZY_KINDS = ("enemy", "trap")
+
+# Constructor-derived world coordinates that have to follow a clone to its new spot
+_CLONE_X_ATTRS = ("x", "original_x", "patrol_start", "patrol_center", "patrol_left_bound",
+                  "patrol_right_bound", "start_x", "_last_x")
+_CLONE_Y_ATTRS = ("y", "original_y", "fly_height")
+
+# Constructor-time pygame.time.get_ticks() stamps, restarted for every clone
+_CLONE_CLOCK_ATTRS = ("last_update",)
+
+# Loaded assets a clone keeps sharing with its prototype; everything else is deep-copied
+_SHARED_TYPES = (pygame.Surface, pygame.mixer.Sound, pygame.font.Font)
+
+
+def shared_assets(entity):
+    """Every shared asset reachable from entity's attributes, as a deepcopy memo."""
+    memo = {}
+    stack = list(vars(entity).values())
+    seen = set()
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        if isinstance(value, _SHARED_TYPES):
+            memo[id(value)] = value
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            stack.extend(value)
+        elif hasattr(value, "__dict__") and not isinstance(value, type):
+            stack.extend(vars(value).values())
+    return memo
+
+
+def clone_entity(prototype, dx, dy, shared=None):
+    """Deep-copy an entity, sharing only its loaded assets, moved by (dx, dy)."""
+    memo = dict(shared if shared is not None else shared_assets(prototype))
+    entity = copy.deepcopy(prototype, memo)
+    for value in vars(entity).values():
+        if isinstance(value, pygame.Rect):
+            value.move_ip(dx, dy)
+    for attr in _CLONE_X_ATTRS:
+        if attr in vars(prototype):
+            setattr(entity, attr, getattr(prototype, attr) + dx)
+    for attr in _CLONE_Y_ATTRS:
+        if attr in vars(prototype):
+            setattr(entity, attr, getattr(prototype, attr) + dy)
+    now = pygame.time.get_ticks()
+    for attr in _CLONE_CLOCK_ATTRS:
+        if attr in vars(prototype):
+            setattr(entity, attr, now)
+    return entity
+
+
+class SpawnEntry:
+    """Recipe for one Tiled object type."""
+
+    def __init__(self, factory, kind="enemy", offset=(0, 0), center_x=False, overrides=None,
+                 prototype=False, label=None):
+        self.factory = factory          # factory(level, x, y, props) -> entity or None
+        self.kind = kind                # enemy/trap (lazy), obstacle, powerup, boss or start
+        self.offset = offset            # Added to the Tiled object's position
+        self.center_x = center_x        # Anchor on the object's horizontal centre (traps)
+        self.overrides = overrides or {}
+        self.prototype = prototype
+        self.label = label              # Printed on spawn when set
+
+    def with_overrides(self, **overrides):
+        """Same recipe with some attributes replaced after building (per-level tuning)."""
+        entry = copy.copy(self)
+        entry.overrides = dict(self.overrides, **overrides)
+        return entry
+
+    def position(self, obj):
+        x = obj.x + (obj.width / 2 if self.center_x else 0) + self.offset[0]
+        y = obj.y + self.offset[1]
+        return x, y
+
+    def build(self, level, x, y, props):
+        if self.prototype:
+            # Per level (Game.spawn_prototypes), so nothing outlives the level that built it
+            cached = level.spawn_prototypes.get(self.factory)
+            if cached is None:
+                entity = self.factory(level, x, y, props)
+                shared = shared_assets(entity)
+                level.spawn_prototypes[self.factory] = (clone_entity(entity, 0, 0, shared), shared, x, y)
+            else:
+                prototype, shared, px, py = cached
+                entity = clone_entity(prototype, x - px, y - py, shared)
+        else:
+            entity = self.factory(level, x, y, props)
+
+        if entity is not None:
+            for attr, value in self.overrides.items():
+                setattr(entity, attr, value)
+        return entity
+
+
+# ===== Factories =====
+
+def _tile_image(level, props):
+    return level.tmx_data.get_tile_image_by_gid(props.get("gid", 0))
+
+def _end(level, x, y, props):
+    return end(x, y)
+
+def _easy_end(level, x, y, props):
+    return EndWithDifficulty(x, y, "easy")
+
+def _hard_end(level, x, y, props):
+    return EndWithDifficulty(x, y, "hard")
+
+def _breakable(level, x, y, props):
+    return BreakableBlock(x, y, _tile_image(level, props))
+
+def _mushroom(level, x, y, props):
+    return Mushroom(x, y, _tile_image(level, props))
+
+def _mushroom_pickup(level, x, y, props):
+    mushroom_image = _tile_image(level, props)
+    if not mushroom_image:
+        print(f"Warning: Could not load mushroom image for object at ({x}, {y})")
+        return None
+    return MushroomPickup(x, y, pygame.transform.scale(mushroom_image, (32, 32)))
+
+def _archer(level, x, y, props):
+    return Archer(x, y)
+
+def _warrior(level, x, y, props):
+    return Warrior(x, y)
+
+def _skeleton(level, x, y, props):
+    return Skeleton(x, y)
+
+def _mutated_mushroom(level, x, y, props):
+    return MutatedMushroom(x, y)
+
+def _flying_eye(level, x, y, props):
+    return FlyingEye(x, y)
+
+SAW_TRAP_SHEET = 'assets/Level2/Traps/SawTrap.png'
+
+def _saw_trap(level, x, y, props):
+    return AnimatedTrap(x, y, SAW_TRAP_SHEET, 64, 32)
+
+def _lightning_trap(level, x, y, props):
+    return LightningTrap(x, y)
+
+def _fire_trap(level, x, y, props):
+    return FireTrap(x, y)
+
+def _boss(level, x, y, props):
+    # Normal difficulty defaults to easy
+    if level.difficulty == "hard":
+        return HardDungeonBoss(x, y)
+    return EasyDungeonBoss(x, y)
+
+def _powerup_factory(powerup_type):
+    def build(level, x, y, props):
+        return create_level2_powerup_with_sprite(x, y, powerup_type, level.mushroom_sprites)
+    return build
+
+
+# ===== Registries =====
+
+# Tile `type` property -> obstacle class; anything else becomes a plain block
+LEVEL_TILES = {"tombstone": Spikes, "ice": Ice}
+BOSS_TILES = {}
+
+# Powerups are centred on the object: their 60x60 box is offset by half its size
+POWERUP_SPAWNS = {
+    typ: SpawnEntry(_powerup_factory(powerup_type), kind="powerup", offset=(-30, -30))
+    for typ, powerup_type in TILED_OBJECT_TO_POWERUP.items()
+}
+
+LEVEL1_SPAWNS = {
+    "start": SpawnEntry(None, kind="start", offset=(30, -70)),
+    "end": SpawnEntry(_end, kind="obstacle"),
+    "breakable": SpawnEntry(_breakable),
+    "mushroom": SpawnEntry(_mushroom),
+    "archer": SpawnEntry(_archer, offset=(0, -32), prototype=True),
+    "warrior": SpawnEntry(_warrior, offset=(0, -32), prototype=True),
+    **POWERUP_SPAWNS,
+}
+
+LEVEL2_SPAWNS = {
+    "start": SpawnEntry(None, kind="start", offset=(0, -70)),
+    "end": SpawnEntry(_end, kind="obstacle"),
+    # obj.y is the bottom of the object in Tiled; 128px sprites sit 96px up, flyers 64px
+    "skeleton": SpawnEntry(_skeleton, offset=(0, -96), prototype=True, label="Skeleton"),
+    "mushroom_enemy": SpawnEntry(_mutated_mushroom, offset=(0, -96), prototype=True, label="Mutated Mushroom"),
+    "flyingeye": SpawnEntry(_flying_eye, offset=(0, -64), prototype=True, label="Flying Eye"),
+    "sawtrap": SpawnEntry(_saw_trap, kind="trap", center_x=True, prototype=True),
+    "lightningtrap": SpawnEntry(_lightning_trap, kind="trap", center_x=True, prototype=True,
+                                overrides={"damage": 1, "cooldown_duration": 2000}),
+    "firetrap": SpawnEntry(_fire_trap, kind="trap", center_x=True, prototype=True,
+                           overrides={"damage": 1, "cooldown_duration": 3000}),
+    "mushroom4": SpawnEntry(_mushroom_pickup),
+    "EasyEnd": SpawnEntry(_easy_end, kind="obstacle", label="EasyEnd"),
+    "HardEnd": SpawnEntry(_hard_end, kind="obstacle", label="HardEnd"),
+    **POWERUP_SPAWNS,
+}
+
+# Boss arena: weaker mushroom minions, harder-hitting traps
+_BOSS_MINION = LEVEL2_SPAWNS["mushroom_enemy"].with_overrides(max_hp=50, current_hp=50)
+_BOSS_MINION.label = "Mushroom Minion"
+_BOSS_ENTRY = SpawnEntry(_boss, kind="boss", offset=(0, -128))
+
+BOSS_SPAWNS = {
+    "start": LEVEL2_SPAWNS["start"],
+    "end": LEVEL2_SPAWNS["end"],
+    "final_boss": _BOSS_ENTRY,
+    "boss_spawn": _BOSS_ENTRY,
+    "mushroom_enemy": _BOSS_MINION,
+    "mushroom_minion": _BOSS_MINION,
+    "mushroom4": LEVEL2_SPAWNS["mushroom4"],
+    "firetrap": LEVEL2_SPAWNS["firetrap"].with_overrides(damage=2, cooldown_duration=2000),
+    "lightningtrap": LEVEL2_SPAWNS["lightningtrap"].with_overrides(damage=2, cooldown_duration=1500),
+    "sawtrap": LEVEL2_SPAWNS["sawtrap"],
+    **POWERUP_SPAWNS,
+}
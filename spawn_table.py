@@ -0,0 +1,85 @@
+"""
+Lazy spawn table.
+
+process_tilemap used to construct every enemy and trap up front, each one
+loading its own assets. Levels now record those objects here as lightweight
+(type, x, y, props) records sorted by x, and only build them once the camera
+comes within spawn_radius. Enemies left far behind can be hibernated back
+into records so resident state tracks what is near the player.
+"""
+
+import bisect
+from collections import namedtuple
+
+# type  - the Tiled object type string
+# x, y  - world position handed to the entity's constructor
+# props - anything else the level needs to build it (image gid, damage, saved state...)
+SpawnRecord = namedtuple("SpawnRecord", "type x y props")
+
+# Attributes carried over when an enemy is hibernated and woken up again. The
+# record is re-keyed to where the enemy stopped, so anything its constructor
+# derives from the spawn point (spawn origin, patrol area, hover height) is kept
+# too; otherwise each hibernate/wake cycle would drift it by the hitbox offset.
+HIBERNATED_ATTRS = ("current_hp", "direction", "facing_right", "on_ground", "y_velocity",
+                    "original_x", "original_y", "patrol_start",
+                    "patrol_left_bound", "patrol_right_bound", "start_x", "fly_height")
+
+
+class SpawnTable:
+    """x-sorted spawn records, materialized as the camera approaches."""
+
+    def __init__(self, spawn_radius=900, hibernate_radius=None):
+        self.spawn_radius = spawn_radius          # World px beyond each screen edge to spawn within
+        self.hibernate_radius = hibernate_radius  # None disables hibernation
+        self.records = []
+        self.keys = []
+
+    def __len__(self):
+        return len(self.records)
+
+    def clear(self):
+        self.records.clear()
+        self.keys.clear()
+
+    def add(self, typ, x, y, props=None):
+        """Record an object to be spawned later."""
+        self.put(SpawnRecord(typ, x, y, props or {}))
+
+    def put(self, record):
+        i = bisect.bisect_right(self.keys, record.x)
+        self.keys.insert(i, record.x)
+        self.records.insert(i, record)
+
+    def take(self, view_left, view_right):
+        """Remove and return every record within spawn_radius of the view."""
+        lo = bisect.bisect_left(self.keys, view_left - self.spawn_radius)
+        hi = bisect.bisect_right(self.keys, view_right + self.spawn_radius, lo)
+        if lo == hi:
+            return ()
+        due = self.records[lo:hi]
+        del self.records[lo:hi]
+        del self.keys[lo:hi]
+        return due
+
+    def hibernate(self, entity):
+        """Turn a live entity back into a spawn record at its current position, keeping how hurt it is."""
+        record = entity.spawn_record
+        state = {attr: getattr(entity, attr) for attr in HIBERNATED_ATTRS if hasattr(entity, attr)}
+        state["topleft"] = entity.rect.topleft
+        props = dict(record.props)
+        props["state"] = state
+        # Keyed where it is now, so the camera wakes it there rather than at its old spawn point
+        self.put(record._replace(x=entity.rect.x, y=entity.rect.y, props=props))
+
+    @staticmethod
+    def restore(entity, record):
+        """Apply any hibernated state saved in record onto a freshly spawned entity."""
+        entity.spawn_record = record
+        state = record.props.get("state")
+        if not state:
+            return
+        for attr, value in state.items():
+            if attr == "topleft":
+                entity.rect.topleft = value
+            else:
+                setattr(entity, attr, value)
@@ -0,0 +1,73 @@
+"""
+Startup tracer.
+
+Reports how long launch-to-menu takes and where the time goes: module
+imports, display init, asset decoding and the first presented frame.
+Enable with `python main.py --trace-startup` or SHROOMLIGHT_TRACE_STARTUP=1.
+When disabled every hook returns immediately.
+
+main.py imports this module first, so its import time is the zero point.
+"""
+
+import os
+import time
+from contextlib import contextmanager, nullcontext
+
+_t0 = time.perf_counter()
+_enabled = os.environ.get("SHROOMLIGHT_TRACE_STARTUP", "") not in ("", "0")
+_marks = []          # (label, seconds since _t0)
+_totals = {}         # bucket -> accumulated seconds (asset decode...)
+_reported = False
+_NULL = nullcontext()
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def is_enabled():
+    return _enabled
+
+
+def mark(label):
+    """Record that startup reached `label`."""
+    if _enabled and not _reported:
+        _marks.append((label, time.perf_counter() - _t0))
+
+
+def timed(bucket):
+    """Context manager adding the time spent inside it to `bucket`."""
+    if not _enabled or _reported:
+        return _NULL
+    return _timed(bucket)
+
+
+@contextmanager
+def _timed(bucket):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _totals[bucket] = _totals.get(bucket, 0.0) + time.perf_counter() - start
+
+
+def first_frame():
+    """Call after a frame is presented; the first call ends the trace and prints the report."""
+    global _reported
+    if not _enabled or _reported:
+        return
+    mark("first frame")
+    _reported = True
+    print(report())
+
+
+def report():
+    lines = ["=== Startup trace ==="]
+    previous = 0.0
+    for label, at in _marks:
+        lines.append(f"  {label:<16} +{(at - previous) * 1000:7.1f} ms  (at {at * 1000:7.1f} ms)")
+        previous = at
+    for bucket, total in _totals.items():
+        lines.append(f"  {bucket:<16} {total * 1000:8.1f} ms total")
+    return "\n".join(lines)
@@ -0,0 +1,168 @@
+"""
+Synthetic stress maps for scaling tests.
+
+The shipped maps are small (137x20, 160x20 and 45x20 tiles, 18-169 objects),
+too small to show how tile drawing, obstacle scans and enemy updates grow
+with the level. generate() writes a valid TMX map in the dungeon's format -
+same tilesets, same object `type` names as DungeonMapActual.tmx - so Level2
+loads it through the normal spawn registry:
+
+    python stress_map.py .cache/stress/wide.tmx --width 1000 --skeleton 200
+
+Everything is seeded, so the same parameters always give the same map.
+"""
+
+import argparse
+import os
+import random
+from xml.sax.saxutils import quoteattr
+
+TILE_SIZE = 32
+GROUND_GID = 23      # Solid dungeon floor
+PLATFORM_GID = 2     # Dungeon ledge
+START_GID, EASY_END_GID, HARD_END_GID = 449, 450, 451   # forestobjects tiles (firstgid 400)
+
+# Tilesets as DungeonMapActual.tmx references them, relative to the repo root
+TILESETS = ((1, "DungeonInsideHouse.tsx"), (400, "assets/forestobjects.tsx"))
+
+ENEMY_TYPES = ("skeleton", "mushroom_enemy", "flyingeye")
+TRAP_TYPES = {"sawtrap": (32, 32), "lightningtrap": (96, 96), "firetrap": (64, 64)}
+POWERUP_TYPES = ("health_mushroom", "fire_mushroom", "speed_mushroom",
+                 "strength_mushroom", "amulet_mushroom", "wisdom_mushroom")
+
+
+def _platforms(rng, width, height, density):
+    """Tile grid (rows of gids): two floor rows plus ledges covering ~density of the open band."""
+    rows = [[0] * width for _ in range(height)]
+    for row in rows[-2:]:
+        row[:] = [GROUND_GID] * width
+
+    band = range(4, height - 4, 3)   # Ledge rows, three tiles apart so there's room to jump between
+    target = int(density * len(band) * width)
+    placed = 0
+    while placed < target:
+        row = rows[rng.choice(band)]
+        length = rng.randint(3, 8)
+        x = rng.randrange(0, max(1, width - length))
+        for i in range(x, min(width, x + length)):
+            if not row[i]:
+                row[i] = PLATFORM_GID
+                placed += 1
+    return rows
+
+
+def generate(path, width=160, height=20, platform_density=0.15, enemies=None, traps=None,
+             powerups=None, seed=0):
+    """Write a stress map to path and return a summary of what it contains.
+
+    width/height     - map size in tiles (the game expects 20 rows)
+    platform_density - fraction of the ledge band covered with platforms, 0..1
+    enemies, traps, powerups - {object type: count}, types as in ENEMY_TYPES,
+                       TRAP_TYPES and POWERUP_TYPES
+    """
+    rng = random.Random(seed)
+    enemies = enemies or {}
+    traps = traps or {}
+    powerups = powerups or {}
+    for typ in enemies:
+        if typ not in ENEMY_TYPES:
+            raise ValueError(f"Unknown enemy type {typ!r}")
+    for typ in traps:
+        if typ not in TRAP_TYPES:
+            raise ValueError(f"Unknown trap type {typ!r}")
+    for typ in powerups:
+        if typ not in POWERUP_TYPES:
+            raise ValueError(f"Unknown powerup type {typ!r}")
+
+    rows = _platforms(rng, width, height, platform_density)
+    floor_y = (height - 2) * TILE_SIZE
+    map_width = width * TILE_SIZE
+    # Keep the first screen clear so the player doesn't spawn into a fight
+    spread = (960, max(961, map_width - 200))
+
+    objects = [
+        ('type="start"', f'gid="{START_GID}"', 147, floor_y - 20, 47, 57),
+        ('type="HardEnd"', f'gid="{HARD_END_GID}"', map_width - 150, floor_y + 47, 57, 30),
+        ('type="EasyEnd"', f'gid="{EASY_END_GID}"', map_width - 140, 70, 52, 63),
+    ]
+    for typ, count in enemies.items():
+        for _ in range(count):
+            y = floor_y - rng.randint(100, 250) if typ == "flyingeye" else floor_y
+            objects.append((f'type="{typ}"', None, rng.uniform(*spread), y, None, None))
+    for typ, count in traps.items():
+        w, h = TRAP_TYPES[typ]
+        for _ in range(count):
+            objects.append((f'type="{typ}"', None, rng.uniform(*spread), floor_y - h, w, h))
+    for typ, count in powerups.items():
+        for _ in range(count):
+            objects.append((f'type="{typ}"', None, rng.uniform(*spread), floor_y - rng.randint(16, 300), None, None))
+
+    # Tileset paths are relative to the map file, wherever it is written
+    map_dir = os.path.dirname(os.path.abspath(path))
+    root = os.path.dirname(os.path.abspath(__file__))
+
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<map version="1.10" tiledversion="1.11.2" orientation="orthogonal" renderorder="right-down" '
+        f'width="{width}" height="{height}" tilewidth="{TILE_SIZE}" tileheight="{TILE_SIZE}" infinite="0" '
+        f'nextlayerid="3" nextobjectid="{len(objects) + 1}">',
+    ]
+    for firstgid, source in TILESETS:
+        rel = os.path.relpath(os.path.join(root, source), map_dir).replace(os.sep, "/")
+        lines.append(f' <tileset firstgid="{firstgid}" source={quoteattr(rel)}/>')
+    lines.append(f' <layer id="1" name="Tile Layer 1" width="{width}" height="{height}">')
+    lines.append('  <data encoding="csv">')
+    lines.append(",\n".join(",".join(map(str, row)) for row in rows))
+    lines.append('</data>')
+    lines.append(' </layer>')
+    lines.append(' <objectgroup id="2" name="Object Layer 1">')
+    for object_id, (typ, gid, x, y, w, h) in enumerate(objects, start=1):
+        attrs = [f'id="{object_id}"', 'name="type"', typ]
+        if gid:
+            attrs.append(gid)
+        attrs += [f'x="{x:.1f}"', f'y="{y:.1f}"']
+        if w:
+            attrs += [f'width="{w}"', f'height="{h}"']
+        lines.append(f'  <object {" ".join(attrs)}/>')
+    lines.append(' </objectgroup>')
+    lines.append('</map>')
+
+    os.makedirs(map_dir, exist_ok=True)
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+    return {
+        "width": width,
+        "height": height,
+        "platform_density": platform_density,
+        "solid_tiles": sum(1 for row in rows for gid in row if gid),
+        "enemies": sum(enemies.values()),
+        "traps": sum(traps.values()),
+        "powerups": sum(powerups.values()),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic dungeon stress map (TMX)")
+    parser.add_argument("path")
+    parser.add_argument("--width", type=int, default=160)
+    parser.add_argument("--height", type=int, default=20)
+    parser.add_argument("--platform-density", type=float, default=0.15)
+    parser.add_argument("--seed", type=int, default=0)
+    for typ in (*ENEMY_TYPES, *TRAP_TYPES, *POWERUP_TYPES):
+        parser.add_argument(f"--{typ}", type=int, default=0, metavar="N", help=f"number of {typ} objects")
+    args = parser.parse_args(argv)
+
+    counts = vars(args)
+    summary = generate(
+        args.path, args.width, args.height, args.platform_density,
+        enemies={typ: counts[typ] for typ in ENEMY_TYPES if counts[typ]},
+        traps={typ: counts[typ] for typ in TRAP_TYPES if counts[typ]},
+        powerups={typ: counts[typ] for typ in POWERUP_TYPES if counts[typ]},
+        seed=args.seed,
+    )
+    print(f"✅ Wrote {args.path}: {summary}")
+
+
+if __name__ == "__main__":
+    main()
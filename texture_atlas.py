@@ -0,0 +1,98 @@
+"""
+Texture atlas packer.
+
+Sprites used to live in hundreds of small standalone surfaces: every sheet
+sliced into per-frame copies, ~80 individual boss frames, trap frames, HUD
+icons and menu buttons. TextureAtlas shelf-packs frames into a few large
+page surfaces and hands back subsurface views into them, so the animation
+code keeps working with ordinary Surfaces while the pixels live in a
+handful of allocations. `index` records where each named group of frames
+landed, as (page, Rect) pairs.
+
+Packing is memoized by name (frame_cache uses its content key), so building
+a second enemy of the same type gets the same views instead of new pixels.
+"""
+
+import pygame
+
+PAGE_SIZE = 1024        # Pages are allocated on demand, PAGE_SIZE x PAGE_SIZE each
+MAX_FRAME_SIZE = 512    # Anything larger (backgrounds...) stays a standalone surface
+PADDING = 1             # Gap between frames so filtering/scaling never bleeds neighbours
+
+
+class TextureAtlas:
+    """Shelf packer that copies frames into shared pages and returns subsurface views."""
+
+    def __init__(self, page_size=PAGE_SIZE, max_frame_size=MAX_FRAME_SIZE, padding=PADDING):
+        self.page_size = page_size
+        self.max_frame_size = max_frame_size
+        self.padding = padding
+        self.pages = []
+        self.index = {}     # name -> [(page number, Rect) or None per frame]
+        self.views = {}     # name -> [Surface per frame]
+        # Current shelf on the last page
+        self._x = self._y = self._shelf_height = 0
+
+    def __contains__(self, name):
+        return name in self.views
+
+    def get(self, name):
+        return self.views.get(name)
+
+    def _new_page(self):
+        page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA).convert_alpha()
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page)
+        self._x = self._y = self._shelf_height = 0
+
+    def _place(self, width, height):
+        """Reserve a width x height slot, returning (page number, Rect)."""
+        if not self.pages:
+            self._new_page()
+        if self._x + width > self.page_size:
+            # Start a new shelf under the current one
+            self._x = 0
+            self._y += self._shelf_height + self.padding
+            self._shelf_height = 0
+        if self._y + height > self.page_size:
+            self._new_page()
+
+        rect = pygame.Rect(self._x, self._y, width, height)
+        self._x += width + self.padding
+        self._shelf_height = max(self._shelf_height, height)
+        return len(self.pages) - 1, rect
+
+    def pack(self, name, frames):
+        """Copy frames into the atlas (once per name) and return their views in the same order."""
+        views = self.views.get(name)
+        if views is not None:
+            return views
+
+        views = []
+        entries = []
+        for frame in frames:
+            width, height = frame.get_size()
+            if not (0 < width <= self.max_frame_size and 0 < height <= self.max_frame_size):
+                views.append(frame)
+                entries.append(None)
+                continue
+
+            page_number, rect = self._place(width, height)
+            page = self.pages[page_number]
+            # Adding onto cleared pixels is an exact copy, alpha included (a normal blit would blend)
+            page.blit(frame, rect, special_flags=pygame.BLEND_RGBA_ADD)
+            views.append(page.subsurface(rect))
+            entries.append((page_number, rect))
+
+        self.index[name] = entries
+        self.views[name] = views
+        return views
+
+    def stats(self):
+        packed = sum(1 for entries in self.index.values() for entry in entries if entry)
+        return {"pages": len(self.pages), "frames": packed, "groups": len(self.index)}
+
+
+# Gameplay sprites (player, enemies, boss, traps, pickups) and HUD/menu images
+SPRITES = TextureAtlas()
+UI = TextureAtlas(page_size=512)
@@ -1,9 +1,16 @@
 import pygame
 import math
+import frame_cache
+import object_pool
+import texture_atlas
 
 class BaseProjectile:
     """Base class for all projectiles - defines common behavior"""
-    def __init__(self, x, y, direction, speed=8, damage=15):
+    def __init__(self, *args, **kwargs):
+        self.reset(*args, **kwargs)
+
+    def reset(self, x, y, direction, speed=8, damage=15):
+        """Set up a fresh shot. Subclasses extend this; object_pool calls it to reuse a spent projectile"""
         self.x = x
         self.y = y
         self.width = 10
@@ -39,23 +46,33 @@ class BaseProjectile:
 
 class PlayerProjectile(BaseProjectile):
     """Player's projectile - fast fish projectile"""
-    def __init__(self, x, y, direction, speed=10, damage=20):
-        super().__init__(x, y, direction, speed=speed, damage=damage)
-        self.owner = 'player'
+    _images = {}  # direction -> arrow image, loaded (and flipped) once
+
+    def __init__(self, *args, **kwargs):
         self.trail_positions = []  # For trail effect
+        super().__init__(*args, **kwargs)
+
+    def reset(self, x, y, direction, speed=10, damage=20):
+        super().reset(x, y, direction, speed=speed, damage=damage)
+        self.owner = 'player'
+        self.trail_positions.clear()
         
         # Load arrow image
-        try:
-            self.image = pygame.image.load("assets/arrow.png").convert_alpha()
-            self.image = pygame.transform.scale(self.image, (10, 14))  # Made bigger: doubled size
-            # Flip image if going left
-            if direction == -1:
-                self.image = pygame.transform.flip(self.image, True, False)
+        if direction in self._images:
+            self.image = self._images[direction]
+        else:
+            try:
+                self.image = frame_cache.load_image("assets/arrow.png", size=(10, 14), atlas=texture_atlas.SPRITES)  # Made bigger: doubled size
+                # Flip image if going left
+                if direction == -1:
+                    self.image = pygame.transform.flip(self.image, True, False)
+            except:
+                self.image = None
+                print("Could not load arrow.png, using default drawing")
+            PlayerProjectile._images[direction] = self.image
+        if self.image:
             self.width = 10
             self.height = 14
-        except:
-            self.image = None
-            print("Could not load arrow.png, using default drawing")
         
     def update(self):
         # Add current position to trail
@@ -128,38 +145,50 @@ class EnemyProjectile(BaseProjectile):
 
 class ChargedProjectile(BaseProjectile):
     """Charged projectile that fires in a straight line with scaled power"""
-    def __init__(self, x, y, direction, charge_level, target_x=None, target_y=None, damage_boost=1.0):
+    _images = {}  # (arrow_size, direction) -> scaled arrow image, built once
+
+    def __init__(self, *args, **kwargs):
+        self.trail_positions = []
+        super().__init__(*args, **kwargs)
+
+    def reset(self, x, y, direction, charge_level, target_x=None, target_y=None, damage_boost=1.0):
         # Scale properties based on charge level (0.0 to 1.0)
         speed = 5 + (charge_level * 10)  # Speed: 5-15
         base_damage = 15 + int(charge_level * 35)  # Base damage: 15-50
         damage = int(base_damage * damage_boost)  # Apply damage boost
         
-        super().__init__(x, y, direction, speed, damage)
+        super().reset(x, y, direction, speed, damage)
         self.owner = 'player'
         self.charge_level = charge_level
         
         # --- All arcing and target logic has been removed ---
         
         # Load arrow image for charged projectile
-        try:
-            self.image = pygame.image.load("assets/arrow.png").convert_alpha()
-            # Make charged arrow larger based on charge level (30-60 pixels wide)
-            arrow_size = int(30 + (charge_level * 30))
-            arrow_height = int(arrow_size * 0.6)  # Maintain aspect ratio
-            self.image = pygame.transform.scale(self.image, (arrow_size, arrow_height))
-            # Flip image if going left
-            if direction == -1:
-                self.image = pygame.transform.flip(self.image, True, False)
+        # Make charged arrow larger based on charge level (30-60 pixels wide)
+        arrow_size = int(30 + (charge_level * 30))
+        arrow_height = int(arrow_size * 0.6)  # Maintain aspect ratio
+        key = (arrow_size, direction)
+        if key in self._images:
+            self.image = self._images[key]
+        else:
+            try:
+                self.image = frame_cache.load_image("assets/arrow.png", atlas=texture_atlas.SPRITES)
+                self.image = pygame.transform.scale(self.image, (arrow_size, arrow_height))
+                # Flip image if going left
+                if direction == -1:
+                    self.image = pygame.transform.flip(self.image, True, False)
+            except:
+                self.image = None
+                print("Could not load arrow.png for charged projectile")
+            ChargedProjectile._images[key] = self.image
+        if self.image:
             self.width = arrow_size
             self.height = arrow_height
-        except:
-            self.image = None
-            print("Could not load arrow.png for charged projectile")
 
         # Visual effects based on charge
         self.size = 3 + int(charge_level * 7)  # Size: 3-10 (for fallback circles)
         self.trail_length = int(3 + charge_level * 7)  # Trail: 3-10 points
-        self.trail_positions = []
+        self.trail_positions.clear()
         
         # Color intensity based on charge (gold/yellow for charged arrow)
         self.base_color = (int(255), int(200 + charge_level * 55), int(50))  # Gold color
@@ -264,8 +293,15 @@ class ProjectileManager:
         for projectile in self.projectiles:
             projectile.update()
         
-        # Remove inactive projectiles
-        self.projectiles = [p for p in self.projectiles if p.active]
+        # Remove inactive projectiles, handing the ones acquired from a pool back to it
+        alive = 0
+        for projectile in self.projectiles:
+            if projectile.active:
+                self.projectiles[alive] = projectile
+                alive += 1
+            else:
+                object_pool.release(projectile)
+        del self.projectiles[alive:]
     
     def draw(self, screen):
         """Draw all projectiles"""
@@ -306,6 +342,8 @@ class ProjectileManager:
     
     def clear_all(self):
         """Remove all projectiles"""
+        for projectile in self.projectiles:
+            object_pool.release(projectile)
         self.projectiles.clear()
     
     def get_count(self):
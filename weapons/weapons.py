@@ -7,6 +7,8 @@ This integrates with your existing entities.py animation system and collision de
 import pygame
 import math
 from .projectiles import PlayerProjectile, EnemyProjectile, ChargedProjectile, ProjectileManager
+import object_pool
+import perf_counters
 
 class WeaponSystem:
     """
@@ -283,7 +285,7 @@ class WeaponSystem:
         # Apply damage boost to projectile
         base_damage = 20  # Match PlayerProjectile default
         boosted_damage = int(base_damage * getattr(self, 'damage_boost', 1.0))
-        return PlayerProjectile(projectile_x, projectile_y, direction, speed=10, damage=boosted_damage)
+        return object_pool.acquire(PlayerProjectile, projectile_x, projectile_y, direction, speed=10, damage=boosted_damage)
     
 
     
@@ -329,7 +331,7 @@ class WeaponSystem:
         
         # Apply damage boost for charged projectile
         damage_boost = getattr(self, 'damage_boost', 1.0)
-        return ChargedProjectile(projectile_x, projectile_y, direction, charge_level, target_x, target_y, damage_boost)
+        return object_pool.acquire(ChargedProjectile, projectile_x, projectile_y, direction, charge_level, target_x, target_y, damage_boost)
     
     def cancel_charging(self):
         """Cancel charging without shooting"""
@@ -467,6 +469,9 @@ def handle_projectile_collisions(projectile_manager, player, enemies, blocks):
         blocks: List of block objects
     """
     
+    if perf_counters.enabled:
+        perf_counters.add("rect_tests", len(projectile_manager.projectiles) * (len(enemies) + len(blocks) + 1))
+
     # Check projectile-enemy collisions (only player projectiles can hit enemies)
     for projectile in projectile_manager.projectiles[:]:
         if not projectile.active or projectile.owner != 'player':